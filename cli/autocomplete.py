@@ -60,6 +60,9 @@ ac_table = {
             '--k8s-namespace',
             '--k8s-disable-connection-pool',
             '--polling',
+            '--hedge-endpoints',
+            '--hedge-percentile',
+            '--hedge-budget',
             '--uses',
             '--uses-with',
             '--uses-metas',
@@ -112,6 +115,9 @@ ac_table = {
             '--k8s-namespace',
             '--k8s-disable-connection-pool',
             '--polling',
+            '--hedge-endpoints',
+            '--hedge-percentile',
+            '--hedge-budget',
             '--uses',
             '--env',
             '--inspect',
@@ -131,6 +137,9 @@ ac_table = {
             '--k8s-namespace',
             '--k8s-disable-connection-pool',
             '--polling',
+            '--hedge-endpoints',
+            '--hedge-percentile',
+            '--hedge-budget',
             '--uses',
             '--uses-with',
             '--uses-metas',
@@ -141,6 +150,8 @@ ac_table = {
             '--native',
             '--num-part',
             '--prefetch',
+            '--prefetch-adaptive',
+            '--prefetch-global',
             '--title',
             '--description',
             '--cors',
@@ -156,6 +167,7 @@ ac_table = {
             '--host',
             '--proxy',
             '--port-expose',
+            '--coalesce-requests',
             '--graph-description',
             '--pods-addresses',
             '--daemon',
@@ -219,6 +231,9 @@ ac_table = {
             '--k8s-namespace',
             '--k8s-disable-connection-pool',
             '--polling',
+            '--hedge-endpoints',
+            '--hedge-percentile',
+            '--hedge-budget',
             '--uses',
             '--uses-with',
             '--uses-metas',
@@ -272,6 +287,9 @@ ac_table = {
             '--k8s-namespace',
             '--k8s-disable-connection-pool',
             '--polling',
+            '--hedge-endpoints',
+            '--hedge-percentile',
+            '--hedge-budget',
             '--uses',
             '--uses-with',
             '--uses-metas',
@@ -324,6 +342,8 @@ ac_table = {
             '--https',
             '--asyncio',
             '--results-as-docarray',
+            '--connections',
+            '--keep-order',
             '--protocol',
         ],
         'export-api': ['--help', '--yaml-path', '--json-path', '--schema-path'],
@@ -1,7 +1,8 @@
-import asyncio
+import os
 import json
+import asyncio
 from pathlib import Path
-from typing import List
+from typing import Dict, Optional
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from fastapi.exceptions import HTTPException
@@ -11,7 +12,7 @@ from websockets import ConnectionClosedOK
 from websockets.exceptions import ConnectionClosedError
 
 from daemon import daemon_logger, jinad_args
-from daemon.helper import get_log_file_path
+from daemon.helper import FileWatcher, get_log_file_path
 from daemon.models import DaemonID
 from daemon.stores import get_store_from_id
 
@@ -42,115 +43,199 @@ def _websocket_details(websocket: WebSocket):
 
 class ConnectionManager:
     """
-    Manager of websockets listening for a log stream.
+    Manager of all websockets listening for the log stream of one file.
 
-    TODO for now contian a single connection. Ideally there must be one
-    manager per log with a thread checking for updates in log and broadcasting
-    to active connections
+    A single task tails the file & parses each JSON line once, lines are then fanned out to every
+    websocket through a bounded queue. When a client doesn't keep up, its oldest lines are dropped.
+
+    :param filepath: path of the log file
+    :param max_queue_size: max number of lines buffered per websocket
     """
 
-    def __init__(self):
+    def __init__(self, filepath: str, max_queue_size: int = 1000):
         """Instantiate a ConnectionManager."""
-        self.active_connections: List[WebSocket] = []
+        self.filepath = filepath
+        self.max_queue_size = max_queue_size
+        self.active_connections: Dict[WebSocket, asyncio.Queue] = {}
+        self.num_dropped: Dict[WebSocket, int] = {}
+        self._tail_task: Optional[asyncio.Task] = None
 
-    async def connect(self, websocket: WebSocket):
+    async def connect(self, websocket: WebSocket) -> asyncio.Queue:
         """
         Register a new websocket.
 
         :param websocket: websocket to register
+        :return: queue of the log lines for this websocket
         """
+        # register before awaiting, so that this manager can't be dropped by a concurrent `disconnect`
+        queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self.active_connections[websocket] = queue
+        self.num_dropped[websocket] = 0
+        if self._tail_task is None:
+            self._tail_task = asyncio.get_event_loop().create_task(self._tail())
         await websocket.accept()
         daemon_logger.info(
             '%s is connected to stream logs!' % _websocket_details(websocket)
         )
-        self.active_connections.append(websocket)
+        return queue
 
     async def disconnect(self, websocket: WebSocket):
         """
-        Disconnect a websocket.
+        Disconnect a websocket, the tailing stops with the last one.
 
         :param websocket: websocket to disconnect
         """
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.pop(websocket, None)
+        num_dropped = self.num_dropped.pop(websocket, 0)
+        if num_dropped:
+            daemon_logger.warning(
+                f'{_websocket_details(websocket)} was too slow, dropped {num_dropped} lines'
+            )
+        if not self.active_connections:
+            if self._tail_task is not None:
+                self._tail_task.cancel()
+                self._tail_task = None
+            if _managers.get(self.filepath) is self:
+                _managers.pop(self.filepath)
         if websocket.application_state != WebSocketState.DISCONNECTED:
             await websocket.close()
             daemon_logger.info('%s is disconnected' % _websocket_details(websocket))
 
-    async def broadcast(self, message: dict):
+    def broadcast(self, message: dict):
         """
-        Send a json message to all registered websockets.
+        Queue a json message for all registered websockets.
 
         :param message: JSON-serializable message to be broadcast
         """
-        for connection in self.active_connections:
+        for connection, queue in self.active_connections.items():
+            if queue.full():
+                queue.get_nowait()
+                self.num_dropped[connection] += 1
+            queue.put_nowait(message)
+
+    async def _tail(self):
+        watcher = FileWatcher(self.filepath)
+        fp = None
+        try:
+            while True:
+                if fp is None:
+                    fp = await self._open(watcher)
+                    partial = ''
+                lines = fp.readlines()
+                if lines:
+                    lines[0] = partial + lines[0]
+                    partial = '' if lines[-1].endswith('\n') else lines.pop()
+                    for line in lines:
+                        self._parse_and_broadcast(line)
+                    continue
+
+                try:
+                    stat = os.stat(self.filepath)
+                except FileNotFoundError:
+                    # deleted, e.g. along with its workspace: wait for it to come back
+                    fp.close()
+                    fp = None
+                    continue
+                if stat.st_ino != os.fstat(fp.fileno()).st_ino:
+                    # rotated: the rest of the old file is already read, follow the new one from its start
+                    fp.close()
+                    fp = open(self.filepath)
+                    partial = ''
+                    continue
+                if stat.st_size < fp.tell():
+                    # truncated in place
+                    fp.seek(0)
+                    partial = ''
+                    continue
+                await watcher.wait()
+        except asyncio.CancelledError:
+            pass
+        except Exception as ex:
+            daemon_logger.error(f'error while tailing {self.filepath}: {ex!r}')
+            # wake up the subscribers, they'd otherwise wait for lines that never come
+            for queue in self.active_connections.values():
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+        finally:
+            if fp is not None:
+                fp.close()
+            watcher.close()
+            if self._tail_task is asyncio.current_task():
+                self._tail_task = None
+
+    async def _open(self, watcher: FileWatcher):
+        # on connection the fluentd file may not flushed (aka exist) yet
+        n = 0
+        while True:
             try:
-                await connection.send_json(message)
-            except ConnectionClosedOK:
-                await self.disconnect(connection)
-            except ConnectionClosedError:
-                await self.disconnect(connection)
-
-    def _has_active_connections(self):
-        return any(
-            connection.application_state != WebSocketState.DISCONNECTED
-            for connection in self.active_connections
-        )
+                fp = open(self.filepath)
+                break
+            except FileNotFoundError:
+                if n % 30 == 0:
+                    daemon_logger.debug(f'still waiting {self.filepath} to be ready...')
+                await watcher.wait()
+                n += 1
+        if n == 0:
+            # only lines written after connecting are streamed
+            fp.seek(0, 2)
+        daemon_logger.success(f'{self.filepath} is ready for streaming')
+        return fp
+
+    def _parse_and_broadcast(self, line: str):
+        try:
+            payload = json.loads(line)
+        except json.decoder.JSONDecodeError:
+            daemon_logger.warning(f'JSON decode error on {line}')
+            return
+        if payload:
+            self.broadcast(payload)
+
+
+_managers: Dict[str, ConnectionManager] = {}
+
+
+def _get_manager(filepath: str) -> ConnectionManager:
+    if filepath not in _managers:
+        _managers[filepath] = ConnectionManager(filepath)
+    return _managers[filepath]
 
 
 @router.websocket('/logstream/{log_id}')
 async def _logstream(websocket: WebSocket, log_id: DaemonID, timeout: int = 60):
-    manager = ConnectionManager()
-    await manager.connect(websocket)
-    client_details = _websocket_details(websocket)
-    filepath, _ = get_log_file_path(log_id)
     try:
-        if jinad_args.no_fluentd:
+        filepath, _ = get_log_file_path(log_id)
+    except KeyError:
+        filepath = None
+    if filepath is None or jinad_args.no_fluentd:
+        await websocket.accept()
+        if filepath is None:
+            daemon_logger.error(f'log file {log_id} not found')
+        else:
             daemon_logger.warning(
-                f'{client_details} asked for logstreaming but fluentd is not available'
+                f'{_websocket_details(websocket)} asked for logstreaming but fluentd is not available'
             )
-            return
+        await websocket.close()
+        return
 
-        # on connection the fluentd file may not flushed (aka exist) yet
-        n = 0
-        while (
-            not Path(filepath).is_file()
-            and websocket.application_state == WebSocketState.CONNECTED
-        ):
-            if n % 30 == 0:
-                daemon_logger.debug(f'still waiting {filepath} to be ready...')
-            await asyncio.sleep(1)
-            n += 1
-            if timeout > 0 and n >= timeout:
-                daemon_logger.error(
-                    f'waited for {timeout} secs for {filepath} to be ready, exiting'
+    manager = _get_manager(filepath)
+    queue = await manager.connect(websocket)
+    try:
+        while websocket.application_state == WebSocketState.CONNECTED:
+            try:
+                payload = await asyncio.wait_for(
+                    queue.get(), timeout if timeout > 0 else None
+                )
+            except asyncio.TimeoutError:
+                daemon_logger.info(
+                    f'no logs in {filepath} for {timeout} secs, closing the stream'
                 )
                 return
-
-        daemon_logger.success(f'{filepath} is ready for streaming')
-
-        with open(filepath) as fp:
-            fp.seek(0, 2)
-            delay = 0.2
-            n = 0
-            while manager._has_active_connections():
-                line = fp.readline()  # also possible to read an empty line
-                if line:
-                    payload = None
-                    try:
-                        payload = json.loads(line)
-                    except json.decoder.JSONDecodeError:
-                        daemon_logger.warning(f'JSON decode error on {line}')
-
-                    if payload:
-                        await manager.broadcast(payload)
-                        n = 0
-                else:
-                    await asyncio.sleep(delay)
-                    n += 1
-                    if timeout > 0 and n >= timeout / delay:
-                        return
-    except WebSocketDisconnect:
-        await manager.disconnect(websocket)
+            if payload is None:
+                # the tailer stopped
+                return
+            await websocket.send_json(payload)
+    except (WebSocketDisconnect, ConnectionClosedOK, ConnectionClosedError):
+        pass
     finally:
         await manager.disconnect(websocket)
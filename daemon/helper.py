@@ -1,7 +1,13 @@
 import os
 import re
+import sys
+import ctypes
+import ctypes.util
+import asyncio
+import struct
+from pathlib import Path
 from contextlib import contextmanager
-from typing import Callable, List, TYPE_CHECKING, Tuple, Dict
+from typing import Callable, List, TYPE_CHECKING, Tuple, Dict, Optional
 
 import aiohttp
 
@@ -146,3 +152,105 @@ def change_env(key, val):
             os.environ[key] = old_var
         else:
             os.environ.pop(key)
+
+
+class FileWatcher:
+    """
+    Wait for changes of a file, via inotify on its parent directory on Linux, else by polling.
+
+    :param filepath: the file to watch, it doesn't need to exist yet
+    :param poll_interval: seconds between two polls when inotify is not available
+    """
+
+    # from <sys/inotify.h>
+    IN_MODIFY = 0x00000002
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_NONBLOCK = os.O_NONBLOCK
+    IN_CLOEXEC = os.O_CLOEXEC
+    # struct inotify_event {int wd; uint32_t mask; uint32_t cookie; uint32_t len; char name[];}
+    _EVENT = struct.Struct('iIII')
+
+    def __init__(self, filepath: str, poll_interval: float = 0.2):
+        filepath = os.path.abspath(filepath)
+        self._dirpath = os.path.dirname(filepath)
+        self._filename = os.path.basename(filepath).encode()
+        self._poll_interval = poll_interval
+        self._fd: Optional[int] = None
+        self._changed = asyncio.Event()
+
+    @staticmethod
+    def _libc() -> Optional[ctypes.CDLL]:
+        if not sys.platform.startswith('linux'):
+            return None
+        try:
+            libc = ctypes.CDLL(
+                ctypes.util.find_library('c') or 'libc.so.6', use_errno=True
+            )
+            libc.inotify_init1.argtypes = [ctypes.c_int]
+            libc.inotify_init1.restype = ctypes.c_int
+            libc.inotify_add_watch.argtypes = [
+                ctypes.c_int,
+                ctypes.c_char_p,
+                ctypes.c_uint32,
+            ]
+            libc.inotify_add_watch.restype = ctypes.c_int
+            return libc
+        except (OSError, AttributeError):
+            return None
+
+    def _add_watch(self) -> None:
+        if self._fd is not None or not Path(self._dirpath).is_dir():
+            return
+        libc = self._libc()
+        if libc is None:
+            return
+        fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if fd < 0:
+            return
+        mask = self.IN_MODIFY | self.IN_MOVED_TO | self.IN_CREATE | self.IN_DELETE
+        if libc.inotify_add_watch(fd, self._dirpath.encode(), mask) < 0:
+            os.close(fd)
+            return
+        self._fd = fd
+        asyncio.get_event_loop().add_reader(fd, self._on_events)
+
+    def _on_events(self) -> None:
+        try:
+            while True:
+                buffer = os.read(self._fd, 4096)
+                if not buffer:
+                    break
+                offset = 0
+                while offset + self._EVENT.size <= len(buffer):
+                    _, _, _, length = self._EVENT.unpack_from(buffer, offset)
+                    start = offset + self._EVENT.size
+                    # other files in the same directory don't concern this watcher
+                    if buffer[start : start + length].rstrip(b'\0') == self._filename:
+                        self._changed.set()
+                    offset = start + length
+        except BlockingIOError:
+            pass
+
+    async def wait(self) -> None:
+        """
+        Wait until the watched file changes. Waits on inotify are capped to 1 sec, so that a
+        missed event (e.g. the directory got created after the watch was attempted) can't stall readers.
+        """
+        self._add_watch()
+        if self._fd is None:
+            await asyncio.sleep(self._poll_interval)
+            return
+        try:
+            await asyncio.wait_for(self._changed.wait(), 1)
+        except asyncio.TimeoutError:
+            pass
+        self._changed.clear()
+
+    def close(self) -> None:
+        """Release the inotify descriptor"""
+        if self._fd is not None:
+            asyncio.get_event_loop().remove_reader(self._fd)
+            os.close(self._fd)
+            self._fd = None
@@ -1,15 +1,18 @@
 import os
+import uuid
 import pickle
-import shutil
+import inspect
+import functools
 from pathlib import Path
 from datetime import datetime
 from collections.abc import MutableMapping
-from typing import Callable, Dict, Sequence, TYPE_CHECKING, Tuple, Union
+from typing import Callable, Dict, Optional, Sequence, TYPE_CHECKING, Tuple, Union
 
 from jina.logging.logger import JinaLogger
-from daemon import jinad_args, __root_workspace__
+from daemon import daemon_logger, jinad_args, __root_workspace__
 from daemon.models import DaemonID
 from daemon.models.base import StoreItem, StoreStatus
+from daemon.stores.journal import StoreJournal, get_journal
 
 if TYPE_CHECKING:
     from daemon.models.workspaces import WorkspaceItem
@@ -21,10 +24,26 @@ class BaseStore(MutableMapping):
 
     _kind = ''
     _status_model = StoreStatus
+    # number of journal records after which the store gets snapshotted & the journal compacted
+    _snapshot_every = 1000
 
     def __init__(self):
         self._logger = JinaLogger(self.__class__.__name__, **vars(jinad_args))
         self.status = self.__class__._status_model()
+        self._init_journal_state()
+
+    def _init_journal_state(
+        self, seq: int = 0, generation: Optional[str] = None
+    ) -> None:
+        self._journal: Optional[StoreJournal] = None
+        self._journal_seq = seq
+        # records of the journal only apply on top of the snapshot of the same generation
+        self._journal_generation = generation
+        self._records_since_snapshot = 0
+        # keys written since the last journal record
+        self._dirty_keys = set()
+        # number of `dump`-wrapped calls running, items read meanwhile may get mutated in place
+        self._num_mutations = 0
 
     def add(self, *args, **kwargs) -> DaemonID:
         """Add a new element to the store. This method needs to be overridden by the subclass
@@ -95,7 +114,10 @@ class BaseStore(MutableMapping):
         :param key: the key (DaemonID) of the object
         :return: the value of the object
         """
-        return self.status.items[key]
+        value = self.status.items[key]
+        if self._num_mutations:
+            self._dirty_keys.add(key)
+        return value
 
     def __setitem__(self, key: DaemonID, value: StoreItem) -> None:
         """Add a Container/Workspace object to the store
@@ -104,6 +126,7 @@ class BaseStore(MutableMapping):
         :param value: the value to be assigned
         """
         self.status.items[key] = value
+        self._dirty_keys.add(key)
         self.status.num_add += 1
         self.status.time_updated = datetime.now()
 
@@ -115,53 +138,153 @@ class BaseStore(MutableMapping):
 
         .. #noqa: DAR201"""
         self.status.items.pop(key)
+        self._dirty_keys.add(key)
         self.status.num_del += 1
         self.status.time_updated = datetime.now()
 
+    def mark_dirty(self, key: DaemonID) -> None:
+        """Mark an item mutated in place outside of this store's own mutations (e.g. by another store),
+        so that it is part of the next journal record
+
+        :param key: the key (DaemonID) of the object
+        """
+        self._dirty_keys.add(key)
+
     def __setstate__(self, state: Dict):
         self._logger = JinaLogger(self.__class__.__name__, **vars(jinad_args))
         now = datetime.now()
+        seq = state.pop('journal_seq', 0)
+        generation = state.pop('journal_generation', None)
         self.status = self._status_model(**state)
         self.status.time_updated = now
+        self._init_journal_state(seq, generation)
 
     def __getstate__(self) -> Dict:
-        return self.status.dict()
+        state = self.status.dict()
+        state['journal_seq'] = self._journal_seq
+        state['journal_generation'] = self._journal_generation
+        return state
+
+    @classmethod
+    def _filepath(cls) -> str:
+        return os.path.join(__root_workspace__, f'{cls._kind}.store')
 
     @classmethod
     def dump(cls, func) -> Callable:
-        """Dump store as a pickle to local workspace
+        """Persist the mutations done by `func` to the store journal in local workspace
 
-        :param func: function to be wrapped
+        Only the items touched by `func` get appended to the journal, the whole store is pickled
+        as a snapshot once every `_snapshot_every` records.
+
+        :param func: function to be wrapped, can be sync or async
         :return: decorator for dump
         """
 
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                self._num_mutations += 1
+                try:
+                    return await func(self, *args, **kwargs)
+                finally:
+                    self._num_mutations -= 1
+                    self._persist()
+
+            return async_wrapper
+
+        @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
-            r = func(self, *args, **kwargs)
-            filepath = os.path.join(__root_workspace__, f'{self._kind}.store')
-            if Path(filepath).is_file():
-                shutil.copyfile(filepath, f'{filepath}.backup')
-            with open(filepath, 'wb') as f:
-                pickle.dump(self, f)
-            return r
+            self._num_mutations += 1
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                self._num_mutations -= 1
+                self._persist()
 
         return wrapper
 
+    def _persist(self) -> None:
+        """Append a record of the dirty items to the journal, snapshot the store if it's due"""
+        if self._journal is None:
+            # a store not restored from the journal (e.g. `--no-store`) starts a fresh one
+            self._journal = get_journal(self._filepath())
+            self._snapshot()
+            return
+
+        if not self._dirty_keys:
+            return
+        self._journal_seq += 1
+        self._journal.append(
+            {
+                'generation': self._journal_generation,
+                'seq': self._journal_seq,
+                'status': self.status.dict(exclude={'items'}),
+                'set': {
+                    k: self.status.items[k].dict()
+                    for k in self._dirty_keys
+                    if k in self.status.items
+                },
+                'del': [k for k in self._dirty_keys if k not in self.status.items],
+            }
+        )
+        self._dirty_keys.clear()
+        self._records_since_snapshot += 1
+        if self._records_since_snapshot >= self._snapshot_every:
+            self._snapshot()
+
+    def _snapshot(self) -> None:
+        self._journal_generation = uuid.uuid4().hex
+        self._dirty_keys.clear()
+        self._records_since_snapshot = 0
+        self._journal.snapshot(pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL))
+
     @classmethod
     def load(cls) -> 'BaseStore':
-        """Load store from a pickle in local workspace
+        """Load store from the latest snapshot in local workspace & replay the journal on top of it
 
         :return: Store from local or empty store
         """
 
-        filepath = os.path.join(__root_workspace__, f'{cls._kind}.store')
+        filepath = cls._filepath()
+        journal = get_journal(filepath)
+        # pending writes of a live store in this process need to land before reading
+        if not journal.flush():
+            daemon_logger.warning(
+                f'some pending writes of {filepath} are not on disk, loading without them'
+            )
+
         if Path(filepath).is_file() and os.path.getsize(filepath) > 0:
             with open(filepath, 'rb') as f:
-                return pickle.load(f)
+                store = pickle.load(f)
         else:
-            return cls()
+            store = cls()
+
+        state = None
+        for record in journal.replay():
+            if (
+                record.get('generation') != store._journal_generation
+                or record['seq'] <= store._journal_seq
+            ):
+                continue
+            if state is None:
+                state = store.status.dict()
+            state.update(record['status'])
+            state['items'].update(record['set'])
+            for k in record['del']:
+                state['items'].pop(k, None)
+            store._journal_seq = record['seq']
+            store._records_since_snapshot += 1
+
+        if state is not None:
+            store.status = cls._status_model(**state)
+        store._journal = journal
+        return store
 
     def reset(self) -> None:
         """Calling :meth:`clear` and reset all stats """
 
         self.clear()
         self.status = self._status_model()
+        if self._journal is not None:
+            self._snapshot()
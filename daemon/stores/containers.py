@@ -221,6 +221,7 @@ class ContainerStore(BaseStore, ABC):
                 f'{colored(id, "green")} is added to workspace {colored(workspace_id, "green")}'
             )
             workspace_store[workspace_id].metadata.managed_objects.add(id)
+            workspace_store.mark_dirty(workspace_id)
             return id
 
     @BaseStore.dump
@@ -247,6 +248,7 @@ class ContainerStore(BaseStore, ABC):
 
             Dockerizer.rm_container(id)
             workspace_store[workspace_id].metadata.managed_objects.remove(id)
+            workspace_store.mark_dirty(workspace_id)
             self._logger.success(f'{colored(id, "green")} is released from the store.')
 
     async def clear(self, **kwargs) -> None:
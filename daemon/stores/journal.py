@@ -0,0 +1,226 @@
+import os
+import atexit
+import pickle
+import shutil
+import struct
+import threading
+import zlib
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from jina.logging.logger import JinaLogger
+from daemon import jinad_args
+
+# every journal record is prefixed by its payload length & crc32
+_RECORD_HEADER = struct.Struct('<II')
+
+
+class StoreJournal:
+    """Append-only operation journal of a :class:`BaseStore`, along with its periodic snapshots
+
+    A snapshot (``<kind>.store``) is the pickled store, the journal (``<kind>.store.journal``) holds every
+    mutation since that snapshot. Writes are handed over to a background thread, which appends them to
+    the journal & fsyncs once per batch, so that callers (e.g. the FastAPI event loop) never wait on disk.
+
+    :param filepath: path of the snapshot file
+    :param flush_interval: max seconds a record waits in memory before being written & fsynced
+    :param batch_size: number of pending records which triggers a write before `flush_interval`
+    """
+
+    def __init__(
+        self, filepath: str, flush_interval: float = 0.2, batch_size: int = 64
+    ):
+        self._logger = JinaLogger(self.__class__.__name__, **vars(jinad_args))
+        self.snapshot_path = filepath
+        self.journal_path = f'{filepath}.journal'
+        self._flush_interval = flush_interval
+        self._batch_size = batch_size
+
+        # pending entries are either ('record', bytes) or ('snapshot', bytes)
+        self._pending: List[Tuple[str, bytes]] = []
+        self._num_enqueued = 0
+        self._num_written = 0
+        # failed batches are retried every `flush_interval`
+        self._num_failures = 0
+        self._flush_requested = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name=f'{self.__class__.__name__}-{filepath}', daemon=True
+        )
+        self._thread.start()
+
+    def append(self, record: Dict) -> None:
+        """Queue a mutation record to be written to the journal
+
+        :param record: the record, serialized right away so that later mutations don't leak into it
+        """
+        self._enqueue('record', pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def snapshot(self, payload: bytes) -> None:
+        """Queue a new snapshot, the journal gets truncated once the snapshot is safely on disk
+
+        :param payload: pickled store
+        """
+        self._enqueue('snapshot', payload)
+
+    def _enqueue(self, kind: str, payload: bytes) -> None:
+        with self._cond:
+            if self._closed:
+                raise RuntimeError(f'{self.journal_path} is already closed')
+            self._pending.append((kind, payload))
+            self._num_enqueued += 1
+            if kind == 'snapshot' or len(self._pending) >= self._batch_size:
+                self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything queued so far is written & fsynced
+
+        :param timeout: max seconds to wait
+        :return: True if everything got flushed in time, False if a write failed or timed out
+        """
+        with self._cond:
+            target = self._num_enqueued
+            num_failures = self._num_failures
+            self._flush_requested = True
+            self._cond.notify_all()
+            self._cond.wait_for(
+                lambda: self._num_written >= target
+                or self._num_failures > num_failures
+                or not self._thread.is_alive(),
+                timeout=timeout,
+            )
+            return self._num_written >= target
+
+    def close(self) -> None:
+        """Flush all pending writes and stop the writer thread"""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._closed)
+                # give other mutations a chance to join this batch
+                self._cond.wait_for(
+                    lambda: self._closed
+                    or self._flush_requested
+                    or len(self._pending) >= self._batch_size
+                    or any(kind == 'snapshot' for kind, _ in self._pending),
+                    timeout=self._flush_interval,
+                )
+                batch, self._pending = self._pending, []
+                self._flush_requested = False
+                closed = self._closed
+            try:
+                self._write(batch)
+            except Exception as ex:
+                self._logger.error(
+                    f'failed to persist {len(batch)} store entries, retrying: {ex!r}'
+                )
+                with self._cond:
+                    # keep the batch in order ahead of the entries queued meanwhile
+                    self._pending = batch + self._pending
+                    self._num_failures += 1
+                    self._cond.notify_all()
+                    if closed:
+                        return
+                    self._cond.wait(timeout=self._flush_interval)
+                continue
+            with self._cond:
+                self._num_written += len(batch)
+                self._cond.notify_all()
+                if closed and not self._pending:
+                    return
+
+    def _write(self, batch: List[Tuple[str, bytes]]) -> None:
+        records = []
+        for kind, payload in batch:
+            if kind == 'record':
+                records.append(payload)
+            else:
+                # records queued before this snapshot are already part of it
+                records.clear()
+                self._write_snapshot(payload)
+        if records:
+            data = b''.join(
+                _RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+                for payload in records
+            )
+            with open(self.journal_path, 'ab', buffering=0) as f:
+                offset = f.tell()
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[f.write(view) :]
+                    os.fsync(f.fileno())
+                except Exception:
+                    # a partial append would stop the replay before the retried records
+                    os.ftruncate(f.fileno(), offset)
+                    raise
+
+    def _write_snapshot(self, payload: bytes) -> None:
+        tmp_path = f'{self.snapshot_path}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        if Path(self.snapshot_path).is_file():
+            shutil.copyfile(self.snapshot_path, f'{self.snapshot_path}.backup')
+        os.replace(tmp_path, self.snapshot_path)
+        # records left by a crash right here belong to the previous generation, the replay skips them
+        with open(self.journal_path, 'wb') as f:
+            os.fsync(f.fileno())
+
+    def replay(self) -> Iterator[Dict]:
+        """Iterate over the records in the journal. A torn record at the tail (e.g. after a crash) is
+        dropped, along with everything after it.
+
+        :yield: journal records in the order they were appended
+        """
+        if not Path(self.journal_path).is_file():
+            return
+        with open(self.journal_path, 'rb') as f:
+            data = f.read()
+        offset = 0
+        while offset + _RECORD_HEADER.size <= len(data):
+            length, crc = _RECORD_HEADER.unpack_from(data, offset)
+            start = offset + _RECORD_HEADER.size
+            payload = data[start : start + length]
+            if len(payload) != length or zlib.crc32(payload) != crc:
+                break
+            yield pickle.loads(payload)
+            offset = start + length
+        if offset != len(data):
+            self._logger.warning(
+                f'dropping {len(data) - offset} bytes of incomplete records from {self.journal_path}'
+            )
+            with open(self.journal_path, 'r+b') as f:
+                f.truncate(offset)
+
+
+_journals: Dict[str, StoreJournal] = {}
+_journals_lock = threading.Lock()
+
+
+def get_journal(filepath: str) -> StoreJournal:
+    """Get the process-wide journal of a store file, all stores sharing a file share the writer thread
+
+    :param filepath: path of the snapshot file
+    :return: the journal
+    """
+    with _journals_lock:
+        if filepath not in _journals:
+            _journals[filepath] = StoreJournal(filepath)
+        return _journals[filepath]
+
+
+@atexit.register
+def _close_journals() -> None:
+    with _journals_lock:
+        for journal in _journals.values():
+            journal.close()
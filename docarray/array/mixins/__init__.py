@@ -4,8 +4,10 @@ from .content import ContentPropertyMixin
 from .embed import EmbedMixin
 from .empty import EmptyMixin
 from .evaluation import EvaluationMixin
+from .find import FindMixin
 from .getattr import GetAttributeMixin
 from .group import GroupMixin
+from .image import ImageToolsMixin
 from .io.binary import BinaryIOMixin
 from .io.common import CommonIOMixin
 from .io.csv import CsvIOMixin
@@ -37,10 +39,12 @@ class AllMixins(
     PushPullMixin,
     FromGeneratorMixin,
     MatchMixin,
+    FindMixin,
     TraverseMixin,
     PlotMixin,
     SampleMixin,
     TextToolsMixin,
+    ImageToolsMixin,
     EvaluationMixin,
     ReduceMixin,
     ParallelMixin,
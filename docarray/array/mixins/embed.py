@@ -1,8 +1,11 @@
 import warnings
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, TypeVar, Optional
+
+import numpy as np
 
 if TYPE_CHECKING:
     from ...helper import T
+    from ...math.dimensionality_reduction import IncrementalPCA
 
     AnyDNN = TypeVar(
         'AnyDNN'
@@ -35,6 +38,49 @@ class EmbedMixin:
         )
         return self
 
+    def reduce_dim(
+        self,
+        n_components: int,
+        batch_size: int = 1024,
+        whiten: bool = False,
+        pca: Optional['IncrementalPCA'] = None,
+    ) -> 'IncrementalPCA':
+        """Replace :attr:`.embedding` of Documents inplace by their projection on the top `n_components` principal
+        components, e.g. to compress them before indexing.
+
+        The PCA is fitted batch by batch, so that the embeddings of a :class:`DocumentArrayMemmap` never need to fit in
+        memory. Use the returned PCA to project the embeddings of the queries, by passing it as ``pca``.
+
+        .. highlight:: python
+        .. code-block:: python
+
+            pca = index.reduce_dim(64)
+            queries.reduce_dim(64, pca=pca)
+            queries.match(index)
+
+        :param n_components: the number of dimensions to keep
+        :param batch_size: number of Documents in a batch
+        :param whiten: if to scale the projections to unit variance
+        :param pca: a fitted PCA to project with, instead of fitting one on these embeddings
+        :return: the fitted PCA
+        """
+        from ... import DocumentArrayMemmap
+        from ...math.dimensionality_reduction import IncrementalPCA
+
+        if pca is None:
+            pca = IncrementalPCA(n_components, whiten=whiten)
+            for b in self.batch(batch_size):
+                pca.partial_fit(_dense_embeddings(b))
+
+        for start in range(0, len(self), batch_size):
+            b = self[start : start + batch_size]
+            b.embeddings = pca.transform(_dense_embeddings(b))
+            if isinstance(self, DocumentArrayMemmap):
+                # the batch holds copies of the Documents
+                for i, d in enumerate(b):
+                    self[start + i] = d
+        return pca
+
     def _set_embeddings_keras(
         self: 'T',
         embed_model: 'AnyDNN',
@@ -152,3 +198,12 @@ def get_framework(dnn_model) -> str:
             return 'onnx'
 
     raise ValueError(f'can not determine the backend of {dnn_model!r}')
+
+
+def _dense_embeddings(docs) -> np.ndarray:
+    x_mat = docs.embeddings
+    if not isinstance(x_mat, np.ndarray):
+        raise ValueError(
+            f'Type {type(x_mat)} not currently supported, use np.ndarray embeddings'
+        )
+    return x_mat
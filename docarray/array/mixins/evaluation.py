@@ -1,5 +1,5 @@
 import warnings
-from typing import Optional, Union, TYPE_CHECKING, Callable
+from typing import Optional, Union, TYPE_CHECKING, Callable, List, Sequence, Tuple
 
 import numpy as np
 
@@ -13,12 +13,14 @@ class EvaluationMixin:
     def evaluate(
         self,
         other: Union['DocumentArray', 'DocumentArrayMemmap'],
-        metric: Union[str, Callable[..., float]],
+        metric: Union[
+            str, Callable[..., float], Sequence[Union[str, Callable[..., float]]]
+        ],
         hash_fn: Optional[Callable[['Document'], str]] = None,
-        metric_name: Optional[str] = None,
+        metric_name: Optional[Union[str, Sequence[str]]] = None,
         strict: bool = True,
         **kwargs,
-    ) -> Optional[float]:
+    ) -> Optional[Union[float, List[float]]]:
         """Compute ranking evaluation metrics for a given `DocumentArray` when compared with a groundtruth.
 
         This implementation expects to provide a `groundtruth` DocumentArray that is structurally identical to `self`. It is based
@@ -26,32 +28,82 @@ class EvaluationMixin:
 
         This method will fill the `evaluations` field of Documents inside this `DocumentArray` and will return the average of the computations
 
+        The relevance of the matches of all Documents is computed at once, and the metrics of
+        :mod:`docarray.math.evaluation` given by name are computed for all Documents at once too. Metrics given as a
+        function are called on the relevance of each Document.
+
         :param other: The groundtruth DocumentArray` that the `DocumentArray` compares to.
         :param metric: The name of the metric, or multiple metrics to be computed
         :param hash_fn: The function used for identifying the uniqueness of Documents. If not given, then ``Document.id`` is used.
         :param metric_name: If provided, the results of the metrics computation will be stored in the `evaluations` field of each Document. If not provided, the name will be computed based on the metrics name.
+            When multiple metrics are computed, a name per metric.
         :param strict: If set, then left and right sides are required to be fully aligned: on the length, and on the semantic of length. These are preventing
             you to evaluate on irrelevant matches accidentally.
         :param kwargs: Additional keyword arguments to be passed to `metric_fn`
         :return: The average evaluation computed or a list of them if multiple metrics are required
         """
+        from ...math import evaluation
+
         if strict:
             self._check_length(len(other))
 
-        if hash_fn is None:
-            hash_fn = lambda d: d.id
+        is_single = isinstance(metric, str) or callable(metric)
+        metrics = [metric] if is_single else list(metric)
+        if metric_name is None:
+            metric_names = [None] * len(metrics)
+        else:
+            metric_names = [metric_name] if is_single else list(metric_name)
+            if len(metric_names) != len(metrics):
+                raise ValueError(
+                    f'{len(metrics)} metrics are computed, but {len(metric_names)} names are given'
+                )
+
+        relevance, num_matches = self._get_relevance(other, hash_fn, strict)
+        if not len(num_matches):
+            return None
+
+        names, scores = [], []
+        for m, name in zip(metrics, metric_names):
+            if isinstance(m, str) and m in evaluation._BATCH_METRICS:
+                values = evaluation._BATCH_METRICS[m](relevance, num_matches, **kwargs)
+                metric_fn = getattr(evaluation, m)
+            else:
+                metric_fn = getattr(evaluation, m) if isinstance(m, str) else m
+                values = [
+                    metric_fn(r[:n].astype(int).tolist(), **kwargs)
+                    for r, n in zip(relevance, num_matches.tolist())
+                ]
+            names.append(name or metric_fn.__name__)
+            scores.append(np.asarray(values, dtype=np.float64))
+
+        self._set_evaluations(names, scores)
+        results = [float(np.mean(s)) for s in scores]
+        return results[0] if is_single else results
 
-        if callable(metric):
-            metric_fn = metric
-        elif isinstance(metric, str):
-            from ...math import evaluation
+    def _get_relevance(
+        self,
+        other: Union['DocumentArray', 'DocumentArrayMemmap'],
+        hash_fn: Optional[Callable[['Document'], str]],
+        strict: bool,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute the binary relevance of the matches of all Documents
 
-            metric_fn = getattr(evaluation, metric)
+        :param other: the groundtruth
+        :param hash_fn: the function identifying Documents, ``Document.id`` if not given
+        :param strict: if to check the Documents & their groundtruth are aligned
+        :return: the relevance as a bool matrix, one row per Document padded with False, and the number of matches of
+            each Document
+        """
+        if hash_fn is None:
+            # read the ids straight from the protobuf
+            left, right = self._pb_body, other._pb_body
+            hash_fn = lambda d: d.id
+        else:
+            left, right = self, other
 
-        metric_name = metric_name or metric_fn.__name__
-        results = []
-        for d, gd in zip(self, other):
-            if not strict or hash_fn(d) != hash_fn(gd):
+        match_hashes, gt_hashes = [], []
+        for d, gd in zip(left, right):
+            if strict and hash_fn(d) != hash_fn(gd):
                 raise ValueError(
                     f'Document {d} from the left-hand side and '
                     f'{gd} from the right-hand are not hashed to the same value. '
@@ -62,18 +114,48 @@ class EvaluationMixin:
                 raise ValueError(
                     f'Document {d!r} or {gd!r} has no matches, please check your Document'
                 )
+            match_hashes.append([hash_fn(m) for m in d.matches])
+            gt_hashes.append([hash_fn(m) for m in gd.matches])
 
-            desired = {hash_fn(m) for m in gd.matches}
-            if len(desired) != len(gd.matches):
-                warnings.warn(
-                    f'{hash_fn!r} may not be valid, as it maps multiple Documents into the same hash. '
-                    f'Evaluation results may be affected'
-                )
+        # integer ids of the groundtruth hashes, from a vocabulary built once; other hashes are never relevant
+        vocab = {}
+        gt_ids = [vocab.setdefault(h, len(vocab)) for hs in gt_hashes for h in hs]
+        match_ids = [vocab.get(h, -1) for hs in match_hashes for h in hs]
+
+        num_matches = np.array([len(hs) for hs in match_hashes], dtype=np.int64)
+        num_gt = np.array([len(hs) for hs in gt_hashes], dtype=np.int64)
+        # a (Document, id) pair as a single integer key
+        gt_keys = np.repeat(np.arange(len(num_gt)), num_gt) * len(vocab) + gt_ids
+        match_rows = np.repeat(np.arange(len(num_matches)), num_matches)
+        match_ids = np.array(match_ids, dtype=np.int64)
+        relevant = (match_ids >= 0) & np.isin(
+            match_rows * len(vocab) + match_ids, gt_keys
+        )
+
+        unique_gt = np.unique(gt_keys)
+        if len(unique_gt) != len(gt_keys):
+            warnings.warn(
+                f'{hash_fn!r} may not be valid, as it maps multiple Documents into the same hash. '
+                f'Evaluation results may be affected'
+            )
+
+        relevance = np.zeros((len(num_matches), num_matches.max(initial=0)), dtype=bool)
+        match_cols = np.arange(len(match_rows)) - np.repeat(
+            np.cumsum(num_matches) - num_matches, num_matches
+        )
+        relevance[match_rows, match_cols] = relevant
+        return relevance, num_matches
 
-            binary_relevance = [1 if hash_fn(m) in desired else 0 for m in d.matches]
+    def _set_evaluations(self, names: List[str], scores: List[np.ndarray]) -> None:
+        from ... import DocumentArrayMemmap
 
-            r = metric_fn(binary_relevance, **kwargs)
-            d.evaluations[metric_name] = r
-            results.append(r)
-        if results:
-            return float(np.mean(results))
+        columns = [s.tolist() for s in scores]
+        if isinstance(self, DocumentArrayMemmap):
+            # the Documents are written back when they are modified through their view
+            for i, d in enumerate(self):
+                for name, c in zip(names, columns):
+                    d.evaluations[name] = c[i]
+        else:
+            for i, d in enumerate(self._pb_body):
+                for name, c in zip(names, columns):
+                    d.evaluations[name].value = c[i]
@@ -0,0 +1,155 @@
+import numbers
+from typing import Any, Dict, List, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from ..document import DocumentArray
+
+#: range operator -> (side of the bound in the sorted values, if the matches are below the bound)
+_RANGE_OPERATORS = {
+    '$gt': ('right', False),
+    '$gte': ('left', False),
+    '$lt': ('left', True),
+    '$lte': ('right', True),
+}
+_OPERATORS = ('$eq', '$ne', '$in', '$nin') + tuple(_RANGE_OPERATORS)
+
+
+class _FieldIndex:
+    """Index of one field over all Documents: the sorted positions of the Documents holding each value, and all the
+    numeric values sorted, for range queries.
+
+    :param values: the value of the field of each Document, ``None`` if it is missing
+    """
+
+    def __init__(self, values: List[Any]):
+        self.size = len(values)
+        postings = {}
+        numbers_pos = []
+        for pos, value in enumerate(values):
+            try:
+                postings.setdefault(value, []).append(pos)
+            except TypeError:
+                # unhashable values (e.g. lists) can not be filtered on
+                continue
+            if isinstance(value, numbers.Number) and not isinstance(value, bool):
+                numbers_pos.append(pos)
+        self._postings = {k: np.array(v, dtype=np.int64) for k, v in postings.items()}
+
+        numbers_pos = np.array(numbers_pos, dtype=np.int64)
+        numbers_val = np.array([values[p] for p in numbers_pos], dtype=np.float64)
+        order = np.argsort(numbers_val, kind='stable')
+        self._sorted_values = numbers_val[order]
+        self._sorted_pos = numbers_pos[order]
+
+    def _positions(self, value: Any) -> np.ndarray:
+        try:
+            return self._postings.get(value, np.empty(0, dtype=np.int64))
+        except TypeError:
+            return np.empty(0, dtype=np.int64)
+
+    def mask(self, condition: Any) -> np.ndarray:
+        """Compute which Documents satisfy ``condition``
+
+        :param condition: either a value the field must be equal to, or a dict of operators to values, e.g.
+            ``{'$gte': 1, '$lt': 10}``
+        :return: the boolean mask of the Documents satisfying ``condition``
+        """
+        if not isinstance(condition, dict):
+            condition = {'$eq': condition}
+
+        mask = np.ones(self.size, dtype=bool)
+        for op, operand in condition.items():
+            if op not in _OPERATORS:
+                raise ValueError(
+                    f'`{op}` is not a supported operator, must be one of {_OPERATORS}'
+                )
+            op_mask = np.zeros(self.size, dtype=bool)
+            if op in ('$eq', '$ne'):
+                op_mask[self._positions(operand)] = True
+            elif op in ('$in', '$nin'):
+                for v in operand:
+                    op_mask[self._positions(v)] = True
+            else:
+                side, below = _RANGE_OPERATORS[op]
+                bound = np.searchsorted(self._sorted_values, operand, side=side)
+                op_mask[
+                    self._sorted_pos[:bound] if below else self._sorted_pos[bound:]
+                ] = True
+            if op in ('$ne', '$nin'):
+                op_mask = ~op_mask
+            mask &= op_mask
+        return mask
+
+
+class FindMixin:
+    """Provide a secondary index over tags and scalar fields, and filtered search over it """
+
+    def build_index(self, *fields: str) -> None:
+        """Build an index over the values of ``fields``, so that :meth:`find` and :meth:`match` filter on them
+        without going through every Document.
+
+        The index is rebuilt when Documents are added, removed or replaced. Call this method again after modifying
+        an indexed field of a Document in place.
+
+        :param fields: the names of the fields, e.g. `modality`. Use `tags__` to index a tag, e.g. `tags__lang`
+        """
+        index = getattr(self, '_field_index', None)
+        fields = set(fields)
+        if index:
+            fields.update(index[1])
+        self._field_index = (
+            self._index_ids(),
+            {f: _FieldIndex(self._get_field_values(f)) for f in fields},
+        )
+
+    def _index_ids(self) -> List[str]:
+        return [d.id for d in self._pb_body]
+
+    def _get_field_values(self, field: str) -> List[Any]:
+        from ...helper import dunder_get
+        from .getattr import _tag_values
+
+        head, _, rest = field.partition('__')
+        if head == 'tags' and rest:
+            return _tag_values(self._pb_body, rest)
+
+        values = []
+        for d in self._pb_body:
+            try:
+                values.append(dunder_get(d, field))
+            except (AttributeError, KeyError, IndexError):
+                values.append(None)
+        return values
+
+    def _get_field_index(self, field: str) -> _FieldIndex:
+        index = getattr(self, '_field_index', None)
+        if index and field in index[1]:
+            if index[0] != self._index_ids():
+                self.build_index()
+                index = self._field_index
+            return index[1][field]
+        return _FieldIndex(self._get_field_values(field))
+
+    def _filter_mask(self, filter: Dict[str, Any]) -> np.ndarray:
+        mask = np.ones(len(self), dtype=bool)
+        for field, condition in filter.items():
+            mask &= self._get_field_index(field).mask(condition)
+        return mask
+
+    def find(self, filter: Dict[str, Any]) -> 'DocumentArray':
+        """Return the Documents satisfying ``filter``, in their order
+
+        .. highlight:: python
+        .. code-block:: python
+
+            da.build_index('tags__lang', 'tags__year')
+            da.find({'tags__lang': 'en', 'tags__year': {'$gte': 2000, '$lt': 2010}})
+
+        :param filter: a dict from field names to conditions, all conditions must be satisfied. A condition is either
+            a value the field must be equal to, or a dict of operators (`$eq`, `$ne`, `$in`, `$nin`, `$gt`, `$gte`,
+            `$lt`, `$lte`) to values. Fields not indexed by :meth:`build_index` are read from every Document.
+        :return: a DocumentArray of the matching Documents
+        """
+        return self[np.flatnonzero(self._filter_mask(filter)).tolist()]
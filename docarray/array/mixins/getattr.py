@@ -1,19 +1,41 @@
-from typing import Union, List, Tuple, TYPE_CHECKING
+import numbers
+from typing import Union, List, Tuple, TYPE_CHECKING, Iterable, Any
+
+import numpy as np
+from google.protobuf.descriptor import FieldDescriptor
 
 if TYPE_CHECKING:
     from ..document import DocumentArray
+    from ...proto.docarray_pb2 import DocumentProto
 
 
 class GetAttributeMixin:
     """Helpers that provide attributes getter in bulk """
 
-    def get_attributes(self, *fields: str) -> Union[List, List[List]]:
+    def get_attributes(
+        self, *fields: str, as_columns: bool = False
+    ) -> Union[List, List[List]]:
         """Return all nonempty values of the fields from all docs this array contains
 
+        With ``as_columns``, the path of each field is resolved once, and the values are read straight from the
+        protobuf of the Documents, in a single pass per field:
+
+            - numeric & boolean fields, e.g. `weight`, come as a np.ndarray
+            - `embedding` & `blob` come stacked, as :attr:`.embeddings` & :attr:`.blobs`
+            - `scores__<name>__value` & `evaluations__<name>__value` come as a float np.ndarray, NaN when missing
+            - `tags__<key>` come as a float np.ndarray when all the values are numbers, NaN when missing, else as a
+              list, None when missing
+            - other fields, e.g. `id` & `text`, come as a list
+
         :param fields: Variable length argument with the name of the fields to extract
+        :param as_columns: if set, return the values of each field as a column, e.g. a np.ndarray, see above
         :return: Returns a list of the values for these fields.
             When `fields` has multiple values, then it returns a list of list.
         """
+        if as_columns:
+            columns = [self._get_column(f) for f in fields]
+            return columns[0] if len(fields) == 1 else columns
+
         contents = [doc.get_attributes(*fields) for doc in self]
 
         if len(fields) > 1:
@@ -21,6 +43,35 @@ class GetAttributeMixin:
 
         return contents
 
+    def _get_column(self, field: str) -> Union[np.ndarray, List]:
+        from ...proto.docarray_pb2 import DocumentProto, NamedScoreProto
+
+        if field == 'embedding':
+            return self.embeddings
+        if field == 'blob':
+            return self.blobs
+
+        head, _, rest = field.partition('__')
+        if head == 'tags' and rest:
+            return _to_column(_tag_values(self._pb_body, rest))
+        if head in ('scores', 'evaluations') and rest:
+            name, _, attr = rest.rpartition('__')
+            desc = NamedScoreProto.DESCRIPTOR.fields_by_name.get(attr)
+            if name and desc is not None and desc.cpp_type in _NUMPY_DTYPES:
+                return _score_values(self._pb_body, head, name, attr)
+
+        desc = DocumentProto.DESCRIPTOR.fields_by_name.get(field)
+        if (
+            desc is not None
+            and desc.label != FieldDescriptor.LABEL_REPEATED
+            and desc.cpp_type != FieldDescriptor.CPPTYPE_MESSAGE
+        ):
+            values = [getattr(d, field) for d in self._pb_body]
+            dtype = _NUMPY_DTYPES.get(desc.cpp_type)
+            return np.array(values, dtype=dtype) if dtype else values
+
+        return [doc.get_attributes(field) for doc in self]
+
     def get_attributes_with_docs(
         self,
         *fields: str,
@@ -45,3 +96,49 @@ class GetAttributeMixin:
         from ..document import DocumentArray
 
         return contents, DocumentArray(docs_pts)
+
+
+#: the numpy dtypes of the numeric & boolean protobuf fields
+_NUMPY_DTYPES = {
+    FieldDescriptor.CPPTYPE_INT32: np.int32,
+    FieldDescriptor.CPPTYPE_INT64: np.int64,
+    FieldDescriptor.CPPTYPE_UINT32: np.uint32,
+    FieldDescriptor.CPPTYPE_UINT64: np.uint64,
+    FieldDescriptor.CPPTYPE_DOUBLE: np.float64,
+    FieldDescriptor.CPPTYPE_FLOAT: np.float32,
+    FieldDescriptor.CPPTYPE_BOOL: bool,
+}
+
+
+def _tag_values(protos: Iterable['DocumentProto'], key: str) -> List[Any]:
+    from ...helper import dunder_get
+
+    if '__' not in key:
+        return [d.tags[key] if key in d.tags else None for d in protos]
+
+    values = []
+    for d in protos:
+        try:
+            values.append(dunder_get(d.tags, key))
+        except (AttributeError, KeyError, IndexError, ValueError):
+            values.append(None)
+    return values
+
+
+def _score_values(
+    protos: Iterable['DocumentProto'], field: str, name: str, attr: str
+) -> np.ndarray:
+    values = []
+    for d in protos:
+        scores = getattr(d, field)
+        values.append(getattr(scores[name], attr) if name in scores else np.nan)
+    return np.array(values, dtype=np.float64)
+
+
+def _to_column(values: List[Any]) -> Union[np.ndarray, List[Any]]:
+    present = [v for v in values if v is not None]
+    if present and all(
+        isinstance(v, numbers.Number) and not isinstance(v, bool) for v in present
+    ):
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    return values
@@ -0,0 +1,117 @@
+import io
+from collections import defaultdict
+from typing import Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from ...helper import T
+    from ... import Document
+    from .parallel import WorkerPool
+
+
+class ImageToolsMixin:
+    """Help functions used in computer vision for DA and DAM"""
+
+    def preprocess_images(
+        self: 'T',
+        shape: Optional[Tuple[int, int]] = None,
+        normalize: bool = True,
+        channel_axis: int = -1,
+        img_mean: Tuple[float] = (0.485, 0.456, 0.406),
+        img_std: Tuple[float] = (0.229, 0.224, 0.225),
+        batch_size: int = 256,
+        num_worker: Optional[int] = None,
+        pool: Optional['WorkerPool'] = None,
+    ) -> 'T':
+        """Load, resize & normalize the image :attr:`.blob` of all Documents inplace, batch by batch.
+
+        It gives the same blobs as chaining the per-Document methods
+
+        .. highlight:: python
+        .. code-block:: python
+
+            for d in da:
+                (
+                    d.load_uri_to_image_blob()
+                    .set_image_blob_shape(shape)
+                    .set_image_blob_normalization()
+                    .set_image_blob_channel_axis(-1, channel_axis)
+                )
+
+        but only the decoding of the images is done per Document, in a thread pool. The images of a batch are then
+        resized, normalized and moved to ``channel_axis`` stacked together, and set with a single :attr:`.blobs`
+        assignment.
+
+        The Documents without :attr:`.blob` are loaded from their :attr:`.uri`, the others are expected to hold a uint8
+        ``[H, W, C]`` image. All images must have the same size if ``shape`` is not given.
+
+        :param shape: the new ``(H, W)`` of the images, if not given the images are not resized
+        :param normalize: if to normalize the uint8 images into float32, see
+            :meth:`~docarray.document.mixins.image.ImageDataMixin.set_image_blob_normalization`
+        :param channel_axis: the axis of the color channel in the resulting blobs
+        :param img_mean: the mean of all images
+        :param img_std: the standard deviation of all images
+        :param batch_size: number of Documents in a batch
+        :param num_worker: the number of threads decoding the images. If not given, then the number of CPUs in the
+            system will be used.
+        :param pool: a `thread` :class:`WorkerPool` to decode the images with, instead of starting a new pool
+        :return: itself after processed
+        """
+        from ... import DocumentArrayMemmap
+        from .parallel import _use_pool
+
+        if pool is not None and pool.backend != 'thread':
+            raise ValueError(
+                f'images are decoded in threads, `pool` must have the `thread` backend, receiving {pool.backend}'
+            )
+
+        with _use_pool(_get_image_blob, 'thread', num_worker, pool) as (func, p):
+            for start in range(0, len(self), batch_size):
+                b = self[start : start + batch_size]
+                blobs = p._pool.map(func, b)
+                b.blobs = _preprocess_batch(
+                    blobs, shape, normalize, channel_axis, img_mean, img_std
+                )
+                if isinstance(self, DocumentArrayMemmap):
+                    # the batch holds copies of the Documents
+                    for i, d in enumerate(b):
+                        self[start + i] = d
+        return self
+
+
+def _get_image_blob(doc: 'Document') -> 'np.ndarray':
+    from ...document.mixins.helper import _uri_to_buffer
+    from ...document.mixins.image import _to_image_blob
+
+    if doc.blob is not None:
+        return doc.blob
+    return _to_image_blob(io.BytesIO(_uri_to_buffer(doc.uri)))
+
+
+def _preprocess_batch(
+    blobs, shape, normalize, channel_axis, img_mean, img_std
+) -> 'np.ndarray':
+    from ...document.mixins.image import _move_channel_axis, _nn_resize, _normalize
+
+    if shape is None:
+        batch = np.stack(blobs)
+    else:
+        # images of different sizes are resized in one gather per size
+        batch = np.empty((len(blobs), *shape, blobs[0].shape[-1]), blobs[0].dtype)
+        by_shape = defaultdict(list)
+        for i, blob in enumerate(blobs):
+            by_shape[blob.shape].append(i)
+        for pos in by_shape.values():
+            batch[pos] = _nn_resize(np.stack([blobs[i] for i in pos]), shape)
+
+    # `channel_axis` is the axis of a single image
+    if channel_axis >= 0:
+        channel_axis += 1
+    if normalize:
+        if batch.dtype != np.uint8 or batch.ndim != 4:
+            raise ValueError(
+                f'images must be uint8 ndarrays with ndim=3, but receiving {batch.dtype} with ndim={batch.ndim - 1}'
+            )
+        return _normalize(batch, img_mean, img_std, channel_axis)
+    return _move_channel_axis(batch, -1, channel_axis)
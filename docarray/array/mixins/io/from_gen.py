@@ -21,11 +21,16 @@ class FromGeneratorMixin:
 
     @classmethod
     def _from_generator(cls: Type['T'], meth: str, *args, **kwargs) -> 'T':
+        from .... import DocumentArrayMemmap
         from ....document import generators
 
         from_fn = getattr(generators, meth)
         da_like = cls()
-        da_like.extend(from_fn(*args, **kwargs))
+        if isinstance(da_like, DocumentArrayMemmap):
+            # the loaded Documents are referenced nowhere else, caching them would only churn the buffer pool
+            da_like.extend(from_fn(*args, **kwargs), update_buffer=False)
+        else:
+            da_like.extend(from_fn(*args, **kwargs))
         return da_like
 
     @classmethod
@@ -65,6 +70,8 @@ class FromGeneratorMixin:
         sampling_rate: Optional[float] = None,
         read_mode: Optional[str] = None,
         to_dataturi: bool = False,
+        num_worker: Optional[int] = None,
+        backend: str = 'thread',
     ) -> 'T':
         """Build from a list of file path or the content of the files.
 
@@ -77,6 +84,9 @@ class FromGeneratorMixin:
             'r' for reading in text mode, 'rb' for reading in binary mode.
             If `read_mode` is None, will iterate over filenames.
         :param to_dataturi: if set, then the Document.uri will be filled with DataURI instead of the plan URI
+        :param num_worker: the number of parallel workers reading the files. If not given, the files are read one by
+            one in the calling thread.
+        :param backend: if to use multi-`process` or multi-`thread` as the parallelization backend
         """
         ...
 
@@ -98,6 +108,8 @@ class FromGeneratorMixin:
         size: Optional[int] = None,
         sampling_rate: Optional[float] = None,
         dialect: Union[str, 'csv.Dialect'] = 'excel',
+        num_worker: Optional[int] = None,
+        backend: str = 'thread',
     ) -> 'T':
         """Build from CSV.
 
@@ -110,6 +122,9 @@ class FromGeneratorMixin:
             predefined dialects in your system, or could be a :class:`csv.Dialect` class that groups specific formatting
             parameters together. If you don't know the dialect and the default one does not work for you,
             you can try set it to ``auto``.
+        :param num_worker: the number of parallel workers building the Documents from the rows. If not given, they are
+            built one by one in the calling thread.
+        :param backend: if to use multi-`process` or multi-`thread` as the parallelization backend
         """
         ...
 
@@ -171,6 +186,8 @@ class FromGeneratorMixin:
         field_resolver: Optional[Dict[str, str]] = None,
         size: Optional[int] = None,
         sampling_rate: Optional[float] = None,
+        num_worker: Optional[int] = None,
+        backend: str = 'thread',
     ) -> 'T':
         """Build from line separated JSON. Yields documents.
 
@@ -180,6 +197,9 @@ class FromGeneratorMixin:
                 a JSON string or a Python dict.
         :param size: the maximum number of the documents
         :param sampling_rate: the sampling rate between [0, 1]
+        :param num_worker: the number of parallel workers parsing the lines. If not given, they are parsed one by one
+            in the calling thread.
+        :param backend: if to use multi-`process` or multi-`thread` as the parallelization backend
         """
         ...
 
@@ -203,6 +223,8 @@ class FromGeneratorMixin:
         field_resolver: Optional[Dict[str, str]] = None,
         size: Optional[int] = None,
         sampling_rate: Optional[float] = None,
+        num_worker: Optional[int] = None,
+        backend: str = 'thread',
     ) -> 'T':
         """Build from lines, json and csv. Yields documents or strings.
 
@@ -216,6 +238,9 @@ class FromGeneratorMixin:
                 a JSON string or a Python dict.
         :param size: the maximum number of the documents
         :param sampling_rate: the sampling rate between [0, 1]
+        :param num_worker: the number of parallel workers parsing the lines. If not given, they are parsed one by one
+            in the calling thread.
+        :param backend: if to use multi-`process` or multi-`thread` as the parallelization backend
         """
         ...
 
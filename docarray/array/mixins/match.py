@@ -1,5 +1,15 @@
+import os
 import warnings
-from typing import Optional, Union, Callable, Tuple, Sequence, TYPE_CHECKING
+from typing import (
+    Optional,
+    Union,
+    Callable,
+    Tuple,
+    Sequence,
+    Dict,
+    Any,
+    TYPE_CHECKING,
+)
 
 import numpy as np
 
@@ -8,6 +18,7 @@ from ...math.helper import top_k, minmax_normalize, update_rows_x_mat_best
 if TYPE_CHECKING:
     from ... import DocumentArray, Document, DocumentArrayMemmap
     from ...ndarray import ArrayType
+    from ...math.inverted_index import SparseInvertedIndex
 
 
 class MatchMixin:
@@ -27,16 +38,18 @@ class MatchMixin:
         traversal_rdarray: Optional[Sequence[str]] = None,
         exclude_self: bool = False,
         filter_fn: Optional[Callable[['Document'], bool]] = None,
+        filter: Optional[Dict[str, Any]] = None,
         only_id: bool = False,
         use_scipy: bool = False,
         device: str = 'cpu',
         num_worker: Optional[int] = 1,
+        use_index: bool = False,
         **kwargs,
     ) -> None:
         """Compute embedding based nearest neighbour in `another` for each Document in `self`,
         and store results in `matches`.
         .. note::
-            'cosine', 'euclidean', 'sqeuclidean' are supported natively without extra dependency.
+            'cosine', 'euclidean', 'sqeuclidean', 'dot' are supported natively without extra dependency.
             You can use other distance metric provided by ``scipy``, such as `braycurtis`, `canberra`, `chebyshev`,
             `cityblock`, `correlation`, `cosine`, `dice`, `euclidean`, `hamming`, `jaccard`, `jensenshannon`,
             `kulsinski`, `mahalanobis`, `matching`, `minkowski`, `rogerstanimoto`, `russellrao`, `seuclidean`,
@@ -60,6 +73,8 @@ class MatchMixin:
         :param traversal_rdarray: DEPRECATED. if set, then matching is applied along the `traversal_path` of the
                 right-hand ``DocumentArray``.
         :param filter_fn: DEPRECATED. if set, apply the filter function to filter docs on the right hand side (rhv) to be matched
+        :param filter: if set, only the Documents in ``darray`` satisfying it are matched, see :meth:`find` for its
+            syntax. The allowed Documents are computed from the index built by :meth:`build_index`, if any.
         :param exclude_self: if set, Documents in ``darray`` with same ``id`` as the left-hand values will not be
                         considered as matches.
         :param only_id: if set, then returning matches will only contain ``id``
@@ -71,6 +86,10 @@ class MatchMixin:
                 .. note::
                     This argument is only effective when ``batch_size`` is set.
 
+        :param use_index: if set, search ``darray`` through an inverted index of its sparse embeddings instead of
+            computing the distance to every Document. Only ``metric='dot'`` is supported. The index is built on the
+            first call and rebuilt once ``darray`` changes, for a DocumentArrayMemmap it is persisted next to it.
+            Documents sharing no non-zero dimension with a query are not matched.
         :param kwargs: other kwargs.
         """
         if limit is not None:
@@ -87,6 +106,11 @@ class MatchMixin:
             else:
                 batch_size = int(batch_size)
 
+        if use_index and metric != 'dot':
+            raise ValueError(
+                f'`use_index=True` only supports `metric=\'dot\'`, receiving {metric!r}'
+            )
+
         lhv = self
         rhv = darray
 
@@ -117,6 +141,9 @@ class MatchMixin:
             if not isinstance(rhv, DocumentArray):
                 rhv = DocumentArray(rhv)
 
+        if filter:
+            rhv = rhv.find(filter)
+
         if not (lhv and rhv):
             return
 
@@ -137,7 +164,9 @@ class MatchMixin:
         metric_name = metric_name or (metric.__name__ if callable(metric) else metric)
         _limit = len(rhv) if limit is None else (limit + (1 if exclude_self else 0))
 
-        if batch_size:
+        if use_index:
+            dist, idx = lhv._match_index(rhv, _limit, normalization)
+        elif batch_size:
             dist, idx = lhv._match_online(
                 rhv, cdist, _limit, normalization, metric_name, batch_size, num_worker
             )
@@ -207,6 +236,45 @@ class MatchMixin:
 
         return dist, idx
 
+    def _match_index(self, darray, limit, normalization):
+        """
+        Computes the matches between self and `darray` through the inverted index of the embeddings of `darray`.
+
+        :param darray: the other DocumentArray or DocumentArrayMemmap to match against
+        :param limit: the maximum number of matches
+        :param normalization: a tuple [a, b] to be used with min-max normalization,
+                              the min distance will be rescaled to `a`, the max distance will be rescaled to `b`
+                              all values will be rescaled into range `[a, b]`.
+        :return: distances and indices, one array of at most `limit` values per Document
+        """
+        dist, idx = darray._get_sparse_index().search(self.embeddings, limit)
+        if isinstance(normalization, (tuple, list)) and normalization is not None:
+            dist = [minmax_normalize(d, normalization) if len(d) else d for d in dist]
+        return dist, idx
+
+    def _get_sparse_index(self) -> 'SparseInvertedIndex':
+        from ...math.inverted_index import SparseInvertedIndex
+        from ...memmap import DocumentArrayMemmap
+
+        ids = self._index_ids()
+        index = getattr(self, '_sparse_index', None)
+        if index is not None and index.ids == ids:
+            return index
+
+        path = (
+            os.path.join(self.path, 'sparse_index.npz')
+            if isinstance(self, DocumentArrayMemmap)
+            else None
+        )
+        if path and os.path.exists(path):
+            index = SparseInvertedIndex.load(path)
+        if index is None or index.ids != ids:
+            index = SparseInvertedIndex(self.embeddings, ids)
+            if path:
+                index.save(path)
+        self._sparse_index = index
+        return index
+
     def _match_online(
         self,
         darray,
@@ -1,13 +1,71 @@
+import itertools
+import math
+import os
 import sys
+from collections import deque
+from contextlib import contextmanager
 from types import LambdaType
-from typing import Callable, TYPE_CHECKING, Generator, Optional, overload, TypeVar
+from typing import (
+    Any,
+    Callable,
+    TYPE_CHECKING,
+    Generator,
+    Iterable,
+    Optional,
+    Tuple,
+    overload,
+    TypeVar,
+)
 
 if TYPE_CHECKING:
     from ...helper import T, random_identity
     from ... import Document, DocumentArray
+    from ...proto.docarray_pb2 import DocumentProto
 
 T_DA = TypeVar('T_DA')
 
+#: the max number of Documents sent at once to a worker process by `map`
+_MAX_CHUNK_SIZE = 1024
+#: the number of tasks in flight per worker process
+_TASKS_PER_WORKER = 2
+
+
+class WorkerPool:
+    """A pool of workers that :meth:`ParallelMixin.map` & co. reuse across calls, instead of starting a new pool on
+    every call.
+
+    .. highlight:: python
+    .. code-block:: python
+
+        from docarray.array.mixins.parallel import WorkerPool
+
+        with WorkerPool(num_worker=4) as pool:
+            for da in das:
+                da.apply(func, pool=pool)
+
+    With the `process` backend, the workers are started once, so ``func`` must be importable by them: lambda & local
+    functions are not supported.
+
+    :param backend: if to use multi-`process` or multi-`thread` as the parallelization backend
+    :param num_worker: the number of parallel workers. If not given, then the number of CPUs in the system will be used.
+    """
+
+    def __init__(self, backend: str = 'process', num_worker: Optional[int] = None):
+        self.backend = backend
+        self.num_worker = num_worker or os.cpu_count() or 1
+        self._pool = _get_pool(backend, self.num_worker)
+
+    def close(self) -> None:
+        """Stop the workers"""
+        self._pool.terminate()
+        self._pool.join()
+
+    def __enter__(self) -> 'WorkerPool':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
 
 class ParallelMixin:
     """Helper functions that provide parallel map to :class:`DocumentArray` or :class:`DocumentArrayMemmap`."""
@@ -18,8 +76,10 @@ class ParallelMixin:
         func: Callable[['Document'], 'Document'],
         backend: str = 'process',
         num_worker: Optional[int] = None,
+        pool: Optional['WorkerPool'] = None,
     ) -> 'T':
-        """Apply each element in itself with ``func``, return itself after modified.
+        """Apply each element in itself with ``func``, return itself after modified. Each element is overwritten in
+        place by the :class:`Document` returned by ``func``.
 
         :param func: a function that takes :class:`Document` as input and outputs :class:`Document`.
         :param backend: if to use multi-`process` or multi-`thread` as the parallelization backend. In general, if your
@@ -33,6 +93,7 @@ class ParallelMixin:
                 and the original object do **not** share the same memory.
 
         :param num_worker: the number of parallel workers. If not given, then the number of CPUs in the system will be used.
+        :param pool: a :class:`WorkerPool` to reuse, its backend & number of workers are used instead.
 
         """
         ...
@@ -42,12 +103,10 @@ class ParallelMixin:
         # noqa: DAR102
         # noqa: DAR101
         # noqa: DAR201
-        :return: a new :class:`DocumentArray` or :class:`DocumentArrayMemmap`
+        :return: itself after modified
         """
-        new_da = type(self)()
-        new_da.extend(self.map(*args, **kwargs))
-        self.clear()
-        self.extend(new_da)
+        for i, doc in enumerate(self.map(*args, **kwargs)):
+            self[i] = doc
         return self
 
     def map(
@@ -55,6 +114,7 @@ class ParallelMixin:
         func: Callable[['Document'], 'T'],
         backend: str = 'process',
         num_worker: Optional[int] = None,
+        pool: Optional['WorkerPool'] = None,
     ) -> Generator['T', None, None]:
         """Return an iterator that applies function to every **element** of iterable in parallel, yielding the results.
 
@@ -75,13 +135,22 @@ class ParallelMixin:
                 and the original object do **not** share the same memory.
 
         :param num_worker: the number of parallel workers. If not given, then the number of CPUs in the system will be used.
+        :param pool: a :class:`WorkerPool` to reuse, its backend & number of workers are used instead.
         :yield: anything return from ``func``
         """
-        if _is_lambda_or_local_function(func) and backend == 'process':
-            func = _globalize_lambda_function(func)
-        with _get_pool(backend, num_worker) as p:
-            for x in p.imap(func, self):
-                yield x
+        with _use_pool(func, backend, num_worker, pool) as (func, p):
+            if p.backend == 'thread':
+                yield from p._pool.imap(func, self)
+                return
+            # Documents go to the workers in chunks of serialized `DocumentArrayProto`
+            chunk_size = _get_chunk_size(len(self), p.num_worker)
+            protos = iter(self._pb_body)
+            chunks = (
+                (func, _to_proto_bytes(itertools.islice(protos, chunk_size)))
+                for _ in range(0, len(self), chunk_size)
+            )
+            for results in _imap_ordered(p, _map_chunk, chunks):
+                yield from _unpack(results)
 
     @overload
     def apply_batch(
@@ -91,6 +160,7 @@ class ParallelMixin:
         backend: str = 'process',
         num_worker: Optional[int] = None,
         shuffle: bool = False,
+        pool: Optional['WorkerPool'] = None,
     ) -> 'T':
         """Apply each element in itself with ``func``, return itself after modified.
 
@@ -108,6 +178,7 @@ class ParallelMixin:
         :param num_worker: the number of parallel workers. If not given, then the number of CPUs in the system will be used.
         :param batch_size: Size of each generated batch (except the last one, which might be smaller, default: 32)
         :param shuffle: If set, shuffle the Documents before dividing into minibatches.
+        :param pool: a :class:`WorkerPool` to reuse, its backend & number of workers are used instead.
         """
         ...
 
@@ -132,6 +203,7 @@ class ParallelMixin:
         backend: str = 'process',
         num_worker: Optional[int] = None,
         shuffle: bool = False,
+        pool: Optional['WorkerPool'] = None,
     ) -> Generator['T', None, None]:
         """Return an iterator that applies function to every **minibatch** of iterable in parallel, yielding the results.
         Each element in the returned iterator is :class:`DocumentArray`.
@@ -155,14 +227,17 @@ class ParallelMixin:
                 and the original object do **not** share the same memory.
 
         :param num_worker: the number of parallel workers. If not given, then the number of CPUs in the system will be used.
+        :param pool: a :class:`WorkerPool` to reuse, its backend & number of workers are used instead.
         :yield: anything return from ``func``
         """
-
-        if _is_lambda_or_local_function(func) and backend == 'process':
-            func = _globalize_lambda_function(func)
-        with _get_pool(backend, num_worker) as p:
-            for x in p.imap(func, self.batch(batch_size=batch_size, shuffle=shuffle)):
-                yield x
+        batches = self.batch(batch_size=batch_size, shuffle=shuffle)
+        with _use_pool(func, backend, num_worker, pool) as (func, p):
+            if p.backend == 'thread':
+                yield from p._pool.imap(func, batches)
+                return
+            tasks = ((func, _to_proto_bytes(b._pb_body)) for b in batches)
+            for result in _imap_ordered(p, _map_batch_chunk, tasks):
+                yield next(_unpack(result, as_array=True))
 
 
 def _get_pool(backend, num_worker):
@@ -180,6 +255,87 @@ def _get_pool(backend, num_worker):
         )
 
 
+@contextmanager
+def _use_pool(
+    func: Callable, backend: str, num_worker: Optional[int], pool: Optional[WorkerPool]
+):
+    if pool is not None:
+        if pool.backend == 'process' and _is_lambda_or_local_function(func):
+            raise ValueError(
+                'lambda or local functions can not be sent to the processes of a `WorkerPool`, '
+                'define `func` at the module level'
+            )
+        yield func, pool
+        return
+    if _is_lambda_or_local_function(func) and backend == 'process':
+        # before starting the processes, so that they find it
+        func = _globalize_lambda_function(func)
+    with WorkerPool(backend, num_worker) as p:
+        yield func, p
+
+
+def _get_chunk_size(num_docs: int, num_worker: int) -> int:
+    # a few chunks per worker balance the load, while amortizing the transfer of each chunk
+    return max(1, min(math.ceil(num_docs / (4 * num_worker)), _MAX_CHUNK_SIZE))
+
+
+def _imap_ordered(pool: WorkerPool, func: Callable, tasks: Iterable) -> Generator:
+    # unlike `Pool.imap`, only a few tasks are read & sent ahead of the results consumed, in the calling thread
+    pending = deque()
+    for task in tasks:
+        pending.append(pool._pool.apply_async(func, task))
+        if len(pending) >= _TASKS_PER_WORKER * pool.num_worker:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def _to_proto_bytes(protos: Iterable['DocumentProto']) -> bytes:
+    from ...proto.docarray_pb2 import DocumentArrayProto
+
+    return DocumentArrayProto(docs=protos).SerializeToString()
+
+
+def _from_proto_bytes(buffer: bytes) -> 'DocumentArray':
+    from ... import DocumentArray
+    from ...proto.docarray_pb2 import DocumentArrayProto
+
+    return DocumentArray(DocumentArrayProto.FromString(buffer))
+
+
+def _pack(results: Any, is_docs: bool) -> Tuple[bool, Any]:
+    # Documents go back serialized as protobuf, anything else is pickled
+    return (True, _to_proto_bytes(results)) if is_docs else (False, results)
+
+
+def _unpack(result: Tuple[bool, Any], as_array: bool = False) -> Generator:
+    is_docs, value = result
+    if not is_docs:
+        yield from ([value] if as_array else value)
+    elif as_array:
+        yield _from_proto_bytes(value)
+    else:
+        yield from _from_proto_bytes(value)
+
+
+def _map_chunk(func: Callable, buffer: bytes) -> Tuple[bool, Any]:
+    from ... import Document
+
+    results = [func(d) for d in _from_proto_bytes(buffer)]
+    if all(isinstance(r, Document) for r in results):
+        return _pack([r.proto for r in results], True)
+    return _pack(results, False)
+
+
+def _map_batch_chunk(func: Callable, buffer: bytes) -> Tuple[bool, Any]:
+    from ... import DocumentArray
+
+    result = func(_from_proto_bytes(buffer))
+    if isinstance(result, DocumentArray):
+        return _pack(result._pb_body, True)
+    return _pack(result, False)
+
+
 def _is_lambda_or_local_function(func):
     return (isinstance(func, LambdaType) and func.__name__ == '<lambda>') or (
         '<locals>' in func.__qualname__
@@ -190,9 +190,9 @@ class PlotMixin:
 
             x_mat_2d = TSNE(n_components=2).fit_transform(x_mat)
         else:
-            from ...math.dimensionality_reduction import PCA
+            from ...math.dimensionality_reduction import IncrementalPCA
 
-            x_mat_2d = PCA(n_components=2).fit_transform(x_mat)
+            x_mat_2d = IncrementalPCA(n_components=2).fit_transform(x_mat)
 
         plt_kwargs = {
             'x': x_mat_2d[:, 0],
@@ -1,24 +1,50 @@
+import itertools
 from collections import Counter
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Optional, Iterable, Generator, List, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from ...helper import T
+    from .parallel import WorkerPool
 
 
 class TextToolsMixin:
     """Help functions used in NLP for DA and DAM"""
 
     def get_vocabulary(
-        self, min_freq: int = 1, text_attrs: Tuple[str, ...] = ('text',)
+        self,
+        min_freq: int = 1,
+        text_attrs: Tuple[str, ...] = ('text',),
+        num_worker: Optional[int] = None,
+        pool: Optional['WorkerPool'] = None,
     ) -> Dict[str, int]:
         """Get the text vocabulary in a dict that maps from the word to the index from all Documents.
 
         :param text_attrs: the textual attributes where vocabulary will be derived from
         :param min_freq: the minimum word frequency to be considered into the vocabulary.
+        :param num_worker: the number of processes counting the words of the Documents, shard by shard. If not given,
+            the words are counted in the calling process. The vocabulary is the same either way.
+        :param pool: a :class:`WorkerPool` to count the words with, instead of starting a new pool
         :return: a vocabulary in dictionary where key is the word, value is the index. The value is 2-index, where
             `0` is reserved for padding, `1` is reserved for unknown token.
         """
+        from .parallel import _use_pool, _get_chunk_size, _imap_ordered
 
-        all_tokens = Counter()
-        for d in self:
-            all_tokens.update(d.get_vocabulary(text_attrs=text_attrs))
+        texts = self._iter_texts(text_attrs)
+        if num_worker is None and pool is None:
+            all_tokens = _count_tokens(texts)
+        else:
+            all_tokens = Counter()
+            with _use_pool(_count_tokens, 'process', num_worker, pool) as (func, p):
+                chunk_size = _get_chunk_size(len(self), p.num_worker) * len(text_attrs)
+                chunks = (
+                    (list(itertools.islice(texts, chunk_size)),)
+                    for _ in range(0, len(self) * len(text_attrs), chunk_size)
+                )
+                # merged in order, so that the words are indexed in the order they first appear
+                for counts in _imap_ordered(p, func, chunks):
+                    all_tokens.update(counts)
 
         # 0 for padding, 1 for unknown
         return {
@@ -27,3 +53,76 @@ class TextToolsMixin:
                 (k for k, v in all_tokens.items() if v >= min_freq), start=2
             )
         }
+
+    def texts_to_sparse(
+        self: 'T',
+        vocab: Dict[str, int],
+        text_attrs: Tuple[str, ...] = ('text',),
+        dtype: str = 'float32',
+    ) -> 'T':
+        """Convert the texts of all Documents to term-frequency vectors, set as sparse :attr:`.embeddings` inplace.
+
+        The texts are tokenized in one pass into a single ``scipy.sparse.csr_matrix`` of shape
+        ``[len(self), max(vocab.values()) + 1]``, where column ``j`` counts the word indexed ``j`` in ``vocab``. Words
+        not in ``vocab`` are left out, so that they never match each other.
+
+        .. highlight:: python
+        .. code-block:: python
+
+            vocab = da.get_vocabulary()
+            da.texts_to_sparse(vocab)
+            queries.texts_to_sparse(vocab)
+            queries.match(da, metric='cosine')
+
+        :param vocab: a dictionary that maps a word to an integer index, e.g. from :meth:`.get_vocabulary`
+        :param text_attrs: the textual attributes where the words are counted from
+        :param dtype: the dtype of the generated :attr:`.embeddings`
+        :return: itself after processed
+        """
+        import scipy.sparse as sp
+
+        indices = []
+        indptr = [0]
+        texts = self._iter_texts(text_attrs)
+        for _ in range(len(self)):
+            for text in itertools.islice(texts, len(text_attrs)):
+                indices.extend(_tokens_to_ids(text, vocab))
+            indptr.append(len(indices))
+
+        indices = np.array(indices, dtype=np.int64)
+        mat = sp.csr_matrix(
+            (np.ones(len(indices), dtype=dtype), indices, np.array(indptr)),
+            shape=(len(self), max(vocab.values(), default=1) + 1),
+        )
+        # repeated words become their count
+        mat.sum_duplicates()
+        self.embeddings = mat
+        return self
+
+    def _iter_texts(self, text_attrs: Tuple[str, ...]) -> Generator[str, None, None]:
+        from ...proto.docarray_pb2 import DocumentProto
+
+        if all(f in DocumentProto.DESCRIPTOR.fields_by_name for f in text_attrs):
+            # read straight from the protobuf
+            docs = self._pb_body
+        else:
+            docs = self
+        for d in docs:
+            for f in text_attrs:
+                yield getattr(d, f)
+
+
+def _count_tokens(texts: Iterable[str]) -> Counter:
+    from ...document.mixins.text import _text_to_word_sequence
+
+    all_tokens = Counter()
+    for text in texts:
+        all_tokens.update(_text_to_word_sequence(text))
+    return all_tokens
+
+
+def _tokens_to_ids(text: str, vocab: Dict[str, int]) -> List[int]:
+    from ...document.mixins.text import _text_to_word_sequence
+
+    ids = (vocab.get(s) for s in _text_to_word_sequence(text))
+    return [i for i in ids if i is not None]
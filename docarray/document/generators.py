@@ -5,6 +5,7 @@ import json
 import os
 import random
 from contextlib import nullcontext
+from functools import partial
 from typing import (
     Optional,
     Generator,
@@ -13,6 +14,8 @@ from typing import (
     Iterable,
     Dict,
     TYPE_CHECKING,
+    Callable,
+    Any,
     TextIO,
 )
 
@@ -57,6 +60,8 @@ def from_files(
     sampling_rate: Optional[float] = None,
     read_mode: Optional[str] = None,
     to_dataturi: bool = False,
+    num_worker: Optional[int] = None,
+    backend: str = 'thread',
 ) -> Generator['Document', None, None]:
     """Creates an iterator over a list of file path or the content of the files.
 
@@ -69,42 +74,32 @@ def from_files(
         'r' for reading in text mode, 'rb' for reading in binary mode.
         If `read_mode` is None, will iterate over filenames.
     :param to_dataturi: if set, then the Document.uri will be filled with DataURI instead of the plan URI
+    :param num_worker: the number of parallel workers reading the files. If not given, the files are read one by one
+        in the calling thread. The Documents are yielded in order either way.
+    :param backend: if to use multi-`process` or multi-`thread` as the parallelization backend
     :yield: file paths or binary content
 
     .. note::
         This function should not be directly used, use :meth:`Flow.index_files`, :meth:`Flow.search_files` instead
     """
-    from . import Document
-
     if read_mode not in {'r', 'rb', None}:
         raise RuntimeError(f'read_mode should be "r", "rb" or None, got {read_mode}')
 
-    def _iter_file_exts(ps):
-        return itertools.chain.from_iterable(
-            glob.iglob(os.path.expanduser(p), recursive=recursive) for p in ps
-        )
-
-    num_docs = 0
     if isinstance(patterns, str):
         patterns = [patterns]
-    for g in _iter_file_exts(patterns):
-        if os.path.isdir(g):
-            continue
-        if sampling_rate is None or random.random() < sampling_rate:
-            if read_mode is None:
-                d = Document(uri=g)
-                if to_dataturi:
-                    d.convert_uri_to_datauri()
-                yield d
-            elif read_mode in {'r', 'rb'}:
-                with open(g, read_mode) as fp:
-                    d = Document(content=fp.read(), uri=g)
-                    if to_dataturi:
-                        d.convert_uri_to_datauri()
-                    yield d
-            num_docs += 1
-        if size is not None and num_docs >= size:
-            break
+    paths = (
+        g
+        for g in itertools.chain.from_iterable(
+            glob.iglob(os.path.expanduser(p), recursive=recursive) for p in patterns
+        )
+        if not os.path.isdir(g)
+    )
+    yield from _build_docs(
+        partial(_file_to_doc, read_mode=read_mode, to_datauri=to_dataturi),
+        _subsample(paths, size, sampling_rate),
+        num_worker,
+        backend,
+    )
 
 
 def from_csv(
@@ -113,6 +108,8 @@ def from_csv(
     size: Optional[int] = None,
     sampling_rate: Optional[float] = None,
     dialect: Union[str, 'csv.Dialect'] = 'excel',
+    num_worker: Optional[int] = None,
+    backend: str = 'thread',
 ) -> Generator['Document', None, None]:
     """Generator function for CSV. Yields documents.
 
@@ -125,11 +122,13 @@ def from_csv(
         predefined dialects in your system, or could be a :class:`csv.Dialect` class that groups specific formatting
         parameters together. If you don't know the dialect and the default one does not work for you,
         you can try set it to ``auto``.
+    :param num_worker: the number of parallel workers building the Documents from the rows, which are still parsed in
+        the calling thread. If not given, the Documents are built one by one in the calling thread. The Documents are
+        yielded in order either way.
+    :param backend: if to use multi-`process` or multi-`thread` as the parallelization backend
     :yield: documents
 
     """
-    from . import Document
-
     if hasattr(file, 'read'):
         file_ctx = nullcontext(file)
     else:
@@ -145,13 +144,12 @@ def from_csv(
             dialect = 'excel'  #: can not sniff delimiter, use default dialect
 
         lines = csv.DictReader(fp, dialect=dialect)
-        for value in _subsample(lines, size, sampling_rate):
-            if 'groundtruth' in value and 'document' in value:
-                yield Document(value['document'], field_resolver), Document(
-                    value['groundtruth'], field_resolver
-                )
-            else:
-                yield Document(value, field_resolver)
+        yield from _build_docs(
+            partial(_dict_to_doc, field_resolver=field_resolver),
+            _subsample(lines, size, sampling_rate),
+            num_worker,
+            backend,
+        )
 
 
 def from_huggingface_datasets(
@@ -217,6 +215,8 @@ def from_ndjson(
     field_resolver: Optional[Dict[str, str]] = None,
     size: Optional[int] = None,
     sampling_rate: Optional[float] = None,
+    num_worker: Optional[int] = None,
+    backend: str = 'thread',
 ) -> Generator['Document', None, None]:
     """Generator function for line separated JSON. Yields documents.
 
@@ -226,19 +226,18 @@ def from_ndjson(
             a JSON string or a Python dict.
     :param size: the maximum number of the documents
     :param sampling_rate: the sampling rate between [0, 1]
+    :param num_worker: the number of parallel workers parsing the lines. If not given, the lines are parsed one by one
+        in the calling thread. The Documents are yielded in order either way.
+    :param backend: if to use multi-`process` or multi-`thread` as the parallelization backend
     :yield: documents
 
     """
-    from . import Document
-
-    for line in _subsample(fp, size, sampling_rate):
-        value = json.loads(line)
-        if 'groundtruth' in value and 'document' in value:
-            yield Document(value['document'], field_resolver), Document(
-                value['groundtruth'], field_resolver
-            )
-        else:
-            yield Document(value, field_resolver)
+    yield from _build_docs(
+        partial(_json_to_doc, field_resolver=field_resolver),
+        _subsample(fp, size, sampling_rate),
+        num_worker,
+        backend,
+    )
 
 
 def from_lines(
@@ -249,6 +248,8 @@ def from_lines(
     field_resolver: Optional[Dict[str, str]] = None,
     size: Optional[int] = None,
     sampling_rate: Optional[float] = None,
+    num_worker: Optional[int] = None,
+    backend: str = 'thread',
 ) -> Generator['Document', None, None]:
     """Generator function for lines, json and csv. Yields documents or strings.
 
@@ -262,6 +263,9 @@ def from_lines(
             a JSON string or a Python dict.
     :param size: the maximum number of the documents
     :param sampling_rate: the sampling rate between [0, 1]
+    :param num_worker: the number of parallel workers parsing json and csv lines. If not given, the lines are parsed
+        one by one in the calling thread. The Documents are yielded in order either way.
+    :param backend: if to use multi-`process` or multi-`thread` as the parallelization backend
     :yield: documents
 
     """
@@ -269,16 +273,44 @@ def from_lines(
         file_type = os.path.splitext(filepath)[1]
         with open(os.path.expanduser(filepath), read_mode) as f:
             if file_type in _jsonl_ext:
-                yield from from_ndjson(f, field_resolver, size, sampling_rate)
+                yield from from_ndjson(
+                    f,
+                    field_resolver,
+                    size,
+                    sampling_rate,
+                    num_worker=num_worker,
+                    backend=backend,
+                )
             elif file_type in _csv_ext:
-                yield from from_csv(f, field_resolver, size, sampling_rate)
+                yield from from_csv(
+                    f,
+                    field_resolver,
+                    size,
+                    sampling_rate,
+                    num_worker=num_worker,
+                    backend=backend,
+                )
             else:
                 yield from _subsample(f, size, sampling_rate)
     elif lines:
         if line_format == 'json':
-            yield from from_ndjson(lines, field_resolver, size, sampling_rate)
+            yield from from_ndjson(
+                lines,
+                field_resolver,
+                size,
+                sampling_rate,
+                num_worker=num_worker,
+                backend=backend,
+            )
         elif line_format == 'csv':
-            yield from from_csv(lines, field_resolver, size, sampling_rate)
+            yield from from_csv(
+                lines,
+                field_resolver,
+                size,
+                sampling_rate,
+                num_worker=num_worker,
+                backend=backend,
+            )
         else:
             yield from _subsample(lines, size, sampling_rate)
     else:
@@ -300,3 +332,80 @@ def _subsample(
     iterable, size: Optional[int] = None, sampling_rate: Optional[float] = None
 ):
     yield from itertools.islice(_sample(iterable, sampling_rate), size)
+
+
+#: the number of Documents built at once by a worker
+_BUILD_CHUNK_SIZE = 256
+
+
+def _file_to_doc(path: str, read_mode: Optional[str], to_datauri: bool) -> 'Document':
+    from . import Document
+
+    if read_mode is None:
+        d = Document(uri=path)
+    else:
+        with open(path, read_mode) as fp:
+            d = Document(content=fp.read(), uri=path)
+    if to_datauri:
+        d.convert_uri_to_datauri()
+    return d
+
+
+def _dict_to_doc(value: Dict, field_resolver: Optional[Dict[str, str]]):
+    from . import Document
+
+    if 'groundtruth' in value and 'document' in value:
+        return Document(value['document'], field_resolver), Document(
+            value['groundtruth'], field_resolver
+        )
+    return Document(value, field_resolver)
+
+
+def _json_to_doc(line: str, field_resolver: Optional[Dict[str, str]]):
+    return _dict_to_doc(json.loads(line), field_resolver)
+
+
+def _build_docs(
+    build: Callable[[Any], Any],
+    items: Iterable,
+    num_worker: Optional[int],
+    backend: str,
+) -> Generator:
+    """Map ``build`` over ``items`` in order, in chunks sent to a pool of workers if ``num_worker`` is given"""
+    if not num_worker:
+        yield from map(build, items)
+        return
+
+    from ..array.mixins.parallel import WorkerPool, _imap_ordered
+
+    serialize = backend == 'process'
+    chunks = iter(lambda: list(itertools.islice(items, _BUILD_CHUNK_SIZE)), [])
+    with WorkerPool(backend, num_worker) as pool:
+        for result in _imap_ordered(
+            pool, _build_chunk, ((build, c, serialize) for c in chunks)
+        ):
+            yield from _unpack_chunk(result) if serialize else result
+
+
+def _build_chunk(build: Callable[[Any], Any], items: List, serialize: bool):
+    results = [build(i) for i in items]
+    if not serialize:
+        return results
+
+    from ..array.mixins.parallel import _to_proto_bytes
+
+    # Documents go back serialized as protobuf, (document, groundtruth) pairs flattened
+    is_pairs = [isinstance(r, tuple) for r in results]
+    docs = itertools.chain.from_iterable(
+        r if p else (r,) for r, p in zip(results, is_pairs)
+    )
+    return is_pairs, _to_proto_bytes(d.proto for d in docs)
+
+
+def _unpack_chunk(result) -> Generator:
+    from ..array.mixins.parallel import _from_proto_bytes
+
+    is_pairs, buffer = result
+    docs = iter(_from_proto_bytes(buffer))
+    for p in is_pairs:
+        yield (next(docs), next(docs)) if p else next(docs)
@@ -233,7 +233,7 @@ class ImageDataMixin:
         if padding:
             h, w, c = blob.shape
             ext_h = window_h - h % stride_h
-            ext_w = window_w - w % window_w
+            ext_w = window_w - w % stride_w
             blob = np.pad(
                 blob,
                 ((0, ext_h), (0, ext_w), (0, 0)),
@@ -241,33 +241,43 @@ class ImageDataMixin:
                 constant_values=0,
             )
         h, w, c = blob.shape
-        row_step = blob.strides[0]
-        col_step = blob.strides[1]
+        row_step, col_step, channel_step = blob.strides
+        n_rows = 1 + int((h - window_h) / stride_h)
+        n_cols = 1 + int((w - window_w) / stride_w)
 
         expanded_img = np.lib.stride_tricks.as_strided(
             blob,
-            shape=(
-                1 + int((h - window_h) / stride_h),
-                1 + int((w - window_w) / stride_w),
-                window_h,
-                window_w,
-                c,
+            shape=(n_rows, n_cols, window_h, window_w, c),
+            strides=(
+                row_step * stride_h,
+                col_step * stride_w,
+                row_step,
+                col_step,
+                channel_step,
             ),
-            strides=(row_step * stride_h, col_step * stride_w, row_step, col_step, 1),
             writeable=False,
         )
         cur_loc_h, cur_loc_w = 0, 0
         if self.location:
             cur_loc_h, cur_loc_w = self.location[:2]
 
-        bbox_locations = [
-            (h * stride_h + cur_loc_h, w * stride_w + cur_loc_w, window_h, window_w)
-            for h in range(expanded_img.shape[0])
-            for w in range(expanded_img.shape[1])
-        ]
+        loc_h, loc_w = np.meshgrid(
+            np.arange(n_rows) * stride_h + cur_loc_h,
+            np.arange(n_cols) * stride_w + cur_loc_w,
+            indexing='ij',
+        )
+        bbox_locations = np.stack(
+            [
+                loc_h.ravel(),
+                loc_w.ravel(),
+                np.full(loc_h.size, window_h),
+                np.full(loc_h.size, window_w),
+            ],
+            axis=1,
+        ).tolist()
         expanded_img = expanded_img.reshape((-1, window_h, window_w, c))
         if as_chunks:
-            from . import Document
+            from ... import Document
 
             for location, _blob in zip(bbox_locations, expanded_img):
                 self.chunks.append(
@@ -404,3 +414,46 @@ def _nn_interpolate_2D(X, x, y):
     nx = np.clip(nx, 0, X.shape[1] - 1).astype(int)
     ny = np.clip(ny, 0, X.shape[0] - 1).astype(int)
     return X[ny, nx, :]
+
+
+def _nn_resize(blobs: 'np.ndarray', shape: Tuple[int, int]) -> 'np.ndarray':
+    """Resample a batch of channel-last images ``[N, H, W, C]`` with the same nearest neighbour sampling as
+    :meth:`ImageDataMixin.set_image_blob_shape`.
+
+    #noqa: DAR101
+    #noqa: DAR201
+    """
+    out_rows, out_cols = shape
+    in_rows, in_cols = blobs.shape[1:3]
+    ny = np.clip(np.around(np.linspace(0, in_rows - 2, out_rows)), 0, in_rows - 1)
+    nx = np.clip(np.around(np.linspace(0, in_cols - 2, out_cols)), 0, in_cols - 1)
+    blobs = np.take(blobs, ny.astype(int), axis=1)
+    return np.take(blobs, nx.astype(int), axis=2)
+
+
+def _normalize(
+    blobs: 'np.ndarray',
+    img_mean: Tuple[float],
+    img_std: Tuple[float],
+    channel_axis: int = -1,
+) -> 'np.ndarray':
+    """Normalize a batch of uint8 channel-last images ``[N, H, W, C]`` into float32 the same way as
+    :meth:`ImageDataMixin.set_image_blob_normalization`.
+
+    A uint8 pixel only takes 256 values, so each channel is normalized by a lookup in a table of the 256 results, which
+    is written straight into a contiguous array with the channel at ``channel_axis``.
+
+    #noqa: DAR101
+    #noqa: DAR201
+    """
+    mean = np.asarray(img_mean, dtype=np.float32)
+    std = np.asarray(img_std, dtype=np.float32)
+    table = ((np.arange(256) / 255.0).astype(np.float32)[:, None] - mean) / std
+
+    shape = list(blobs.shape[:-1])
+    shape.insert(channel_axis % blobs.ndim, blobs.shape[-1])
+    out = np.empty(shape, dtype=np.float32)
+    out_view = _move_channel_axis(out, channel_axis, -1)
+    for c in range(blobs.shape[-1]):
+        out_view[..., c] = table[blobs[..., c], c]
+    return out
@@ -1,4 +1,5 @@
 from collections import Counter
+from functools import lru_cache
 from typing import Tuple, Dict, Union, Optional
 
 import numpy as np
@@ -102,12 +103,15 @@ class TextDataMixin:
     convert_text_to_uri = deprecate_by(dump_text_to_datauri)
 
 
+@lru_cache()
+def _get_translate_map(filters: str, split: str) -> Dict[int, str]:
+    return str.maketrans({c: split for c in filters})
+
+
 def _text_to_word_sequence(
     text, filters='!"#$%&()*+,-./:;<=>?@[\\]^_`{|}~\t\n', split=' '
 ):
-    translate_dict = {c: split for c in filters}
-    translate_map = str.maketrans(translate_dict)
-    text = text.lower().translate(translate_map)
+    text = text.lower().translate(_get_translate_map(filters, split))
 
     seq = text.split(split)
     for i in seq:
@@ -1,3 +1,5 @@
+from typing import Tuple
+
 import numpy as np
 
 
@@ -26,8 +28,8 @@ class PCA:
         # covariance matrix (n_features, n_features)
         cov = np.cov(x_mat.T) / x_mat.shape[0]
 
-        # Compute eigenvalues eigenvectors of cov
-        e_values, e_vectors = np.linalg.eig(cov)
+        # Compute eigenvalues eigenvectors of cov, which is symmetric
+        e_values, e_vectors = np.linalg.eigh(cov)
 
         # Sort eigenvalues by magnitude (higher to lower)
         idx = e_values.argsort()[::-1]
@@ -60,3 +62,136 @@ class PCA:
         """
         self.fit(x_mat)
         return self.transform(x_mat)
+
+
+class IncrementalPCA:
+    """:class:`IncrementalPCA` is a PCA fitted batch by batch, so that the observations never need to fit in memory
+    at once, e.g. the embeddings of a :class:`DocumentArrayMemmap`.
+
+    Each batch updates the mean & the covariance matrix of the observations, shifted by the mean of the first batch to
+    avoid cancellation. The components are the top eigenvectors of the covariance matrix: computed with
+    ``np.linalg.eigh``, or with a randomized range finder when only a few components are kept, which costs
+    O(n_features² x n_components) instead of O(n_features³).
+
+    :param n_components: Number of components to keep when projecting with PCA
+    :param whiten: Flag variable stating if there projecting with whitening
+    """
+
+    def __init__(self, n_components: int, whiten: bool = False):
+        self.n_components = n_components
+        self.whiten = whiten
+        self.n_samples = 0
+        self.mean = None
+        self.components = None
+        self.explained_variance = None
+        self._shift = None
+        self._sum = None
+        self._sum_squares = None
+
+    def partial_fit(self, x_mat: np.ndarray) -> 'IncrementalPCA':
+        """
+        Updates the PCA with a batch of observations
+
+        :param x_mat: Matrix of shape (n_observations, n_features)
+        :return: itself
+        """
+        x_mat = np.asarray(x_mat, dtype=np.float64)
+        if self._shift is None:
+            self._shift = x_mat.mean(axis=0)
+            self._sum = np.zeros(x_mat.shape[1])
+            self._sum_squares = np.zeros((x_mat.shape[1], x_mat.shape[1]))
+        x_mat = x_mat - self._shift
+        self._sum += x_mat.sum(axis=0)
+        self._sum_squares += x_mat.T @ x_mat
+        self.n_samples += x_mat.shape[0]
+        # solved again on the next transform
+        self.components = None
+        return self
+
+    def fit(self, x_mat: np.ndarray) -> 'IncrementalPCA':
+        """
+        Computes the projection matrix of the PCA algorithm from scratch
+
+        :param x_mat: Matrix of shape (n_observations, n_features)
+        :return: itself
+        """
+        self.__init__(self.n_components, self.whiten)
+        self.partial_fit(x_mat)
+        self._solve()
+        return self
+
+    def _solve(self) -> None:
+        if self.components is not None:
+            return
+        if self.n_samples < 2:
+            raise ValueError(
+                f'PCA needs at least 2 observations, but got {self.n_samples}'
+            )
+        shifted_mean = self._sum / self.n_samples
+        cov = (
+            self._sum_squares - self.n_samples * np.outer(shifted_mean, shifted_mean)
+        ) / (self.n_samples - 1)
+        self.mean = self._shift + shifted_mean
+        e_values, self.components = top_eigh(cov, self.n_components)
+        self.explained_variance = np.maximum(e_values, 0)
+
+    def transform(self, x_mat: np.ndarray) -> np.ndarray:
+        """Projects data from n_features to self.n_components features.
+
+        :param x_mat: Matrix of shape (n_observations, n_features)
+        :return: Matrix of shape (n_observations, self.n_components), in the floating dtype of ``x_mat``
+        """
+        self._solve()
+        x_mat = np.asarray(x_mat)
+        projected = (x_mat - self.mean) @ self.components
+        if self.whiten:
+            projected /= np.sqrt(np.maximum(self.explained_variance, 1e-12))
+        if np.issubdtype(x_mat.dtype, np.floating):
+            return projected.astype(x_mat.dtype, copy=False)
+        return projected
+
+    def fit_transform(self, x_mat: np.ndarray) -> np.ndarray:
+        """Fits the PCA and returns a transformed data
+        :param x_mat:  Matrix of shape (n_observations, n_features)
+        :return: Matrix of shape (n_observations, self.n_components)
+        """
+        return self.fit(x_mat).transform(x_mat)
+
+
+def top_eigh(
+    sym_mat: np.ndarray,
+    k: int,
+    n_oversamples: int = 10,
+    n_iter: int = 7,
+    seed: int = 0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Computes the top eigenvalues & eigenvectors of a symmetric positive semi-definite matrix.
+
+    When ``k`` is small compared to the size of the matrix, a randomized range finder with power iterations
+    (Halko et al., 2011) gives an orthonormal basis of the top eigenspace first, and only its projection goes through
+    ``np.linalg.eigh``.
+
+    :param sym_mat: Matrix of shape (n, n)
+    :param k: the number of eigenpairs
+    :param n_oversamples: the number of extra vectors of the random basis, for accuracy
+    :param n_iter: the number of power iterations, for accuracy when the eigenvalues decay slowly
+    :param seed: the seed of the random basis
+    :return: the eigenvalues, in decreasing order, and the matrix of shape (n, k) of the eigenvectors as columns. Each
+        eigenvector has its largest absolute coordinate positive, for deterministic results.
+    """
+    n = sym_mat.shape[0]
+    k = min(k, n)
+    size = k + n_oversamples
+    if 2 * size >= n:
+        e_values, e_vectors = np.linalg.eigh(sym_mat)
+    else:
+        basis = np.random.default_rng(seed).standard_normal((n, size))
+        for _ in range(n_iter + 1):
+            basis, _ = np.linalg.qr(sym_mat @ basis)
+        e_values, small_vectors = np.linalg.eigh(basis.T @ sym_mat @ basis)
+        e_vectors = basis @ small_vectors
+    top = np.argsort(e_values)[::-1][:k]
+    e_values, e_vectors = e_values[top], e_vectors[:, top]
+    signs = np.sign(e_vectors[np.abs(e_vectors).argmax(axis=0), np.arange(k)])
+    signs[signs == 0] = 1
+    return e_values, e_vectors * signs
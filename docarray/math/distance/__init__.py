@@ -111,6 +111,15 @@ def cdist(
             from .paddle import euclidean
 
             dists = euclidean(x_mat, y_mat, device=device)
+    elif metric == 'dot':
+        if framework == 'scipy' and is_sparse:
+            from .numpy import sparse_dot
+
+            dists = sparse_dot(x_mat, y_mat)
+        elif framework == 'numpy':
+            from .numpy import dot
+
+            dists = dot(x_mat, y_mat)
     else:
         raise NotImplementedError(f'Input metric={metric} is not supported')
 
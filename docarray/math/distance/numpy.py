@@ -88,3 +88,24 @@ def euclidean(x_mat: 'ArrayType', y_mat: 'ArrayType') -> 'np.ndarray':
     :return: np.ndarray  with ndim=2
     """
     return np.sqrt(sqeuclidean(x_mat, y_mat))
+
+
+def dot(x_mat: 'np.ndarray', y_mat: 'np.ndarray') -> 'np.ndarray':
+    """Negated dot product between each row in x_mat and each row in y_mat, so that the smaller the closer.
+
+    :param x_mat: np.ndarray with ndim=2
+    :param y_mat: np.ndarray with ndim=2
+    :return: np.ndarray with ndim=2
+    """
+    return -np.dot(x_mat, y_mat.T)
+
+
+def sparse_dot(x_mat: 'ArrayType', y_mat: 'ArrayType') -> 'np.ndarray':
+    """Negated dot product between each row in x_mat and each row in y_mat, so that the smaller the closer.
+
+    :param x_mat:  scipy.sparse like array with ndim=2
+    :param y_mat:  scipy.sparse like array with ndim=2
+    :return: np.ndarray  with ndim=2
+    """
+    # we need the np.asarray otherwise we get a np.matrix object that iterates differently
+    return -np.asarray(x_mat.dot(y_mat.T).todense())
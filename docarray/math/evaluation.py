@@ -160,3 +160,120 @@ def ndcg_at_k(relevance: List[float], method: int = 0, k: Optional[int] = None):
     if not dcg_max:
         return 0.0
     return dcg_at_k(relevance, method=method, k=k) / dcg_max
+
+
+# The batched versions of the metrics above compute the metric of many queries at once. They take the binary relevance
+# of the matches of all queries as a bool matrix ``relevance``, one row per query, padded with ``False`` beyond the
+# ``num_matches`` of each query, and return a np.ndarray with the metric of each query.
+
+
+def _truncate(relevance: np.ndarray, num_matches: np.ndarray, k: Optional[int]):
+    _check_k(k)
+    if k is None:
+        return relevance, num_matches
+    return relevance[:, :k], np.minimum(num_matches, k)
+
+
+def _batch_r_precision(relevance: np.ndarray, num_matches: np.ndarray) -> np.ndarray:
+    num_rel = relevance.sum(axis=1)
+    last = relevance.shape[1] - np.argmax(relevance[:, ::-1], axis=1)
+    return np.where(num_rel > 0, num_rel / last, 0.0)
+
+
+def _batch_precision_at_k(
+    relevance: np.ndarray, num_matches: np.ndarray, k: Optional[int] = None
+) -> np.ndarray:
+    relevance, num_matches = _truncate(relevance, num_matches, k)
+    return relevance.sum(axis=1) / num_matches
+
+
+def _batch_hit_at_k(
+    relevance: np.ndarray, num_matches: np.ndarray, k: Optional[int] = None
+) -> np.ndarray:
+    relevance, _ = _truncate(relevance, num_matches, k)
+    return relevance.any(axis=1).astype(int)
+
+
+def _batch_average_precision(
+    relevance: np.ndarray, num_matches: np.ndarray
+) -> np.ndarray:
+    num_rel = relevance.sum(axis=1)
+    precisions = np.cumsum(relevance, axis=1) / np.arange(1, relevance.shape[1] + 1)
+    total = np.sum(precisions, axis=1, where=relevance)
+    return np.divide(total, num_rel, out=np.zeros(len(total)), where=num_rel > 0)
+
+
+def _batch_reciprocal_rank(
+    relevance: np.ndarray, num_matches: np.ndarray
+) -> np.ndarray:
+    return np.where(relevance.any(axis=1), 1.0 / (np.argmax(relevance, axis=1) + 1), 0)
+
+
+def _batch_recall_at_k(
+    relevance: np.ndarray,
+    num_matches: np.ndarray,
+    max_rel: int,
+    k: Optional[int] = None,
+) -> np.ndarray:
+    relevance, _ = _truncate(relevance, num_matches, k)
+    num_rel = relevance.sum(axis=1)
+    if np.any(num_rel > max_rel):
+        raise ValueError(f'Number of relevant Documents retrieved > {max_rel}')
+    return num_rel / max_rel
+
+
+def _batch_f1_score_at_k(
+    relevance: np.ndarray,
+    num_matches: np.ndarray,
+    max_rel: int,
+    k: Optional[int] = None,
+) -> np.ndarray:
+    p = _batch_precision_at_k(relevance, num_matches, k)
+    r = _batch_recall_at_k(relevance, num_matches, max_rel, k)
+    return np.divide(2 * p * r, p + r, out=np.zeros(len(p)), where=(p + r) > 0)
+
+
+def _dcg_weights(size: int, method: int) -> np.ndarray:
+    if method == 0:
+        return 1 / np.log2(np.maximum(np.arange(1, size + 1), 2))
+    elif method == 1:
+        return 1 / np.log2(np.arange(2, size + 2))
+    raise ValueError('method must be 0 or 1.')
+
+
+def _batch_dcg_at_k(
+    relevance: np.ndarray,
+    num_matches: np.ndarray,
+    method: int = 0,
+    k: Optional[int] = None,
+) -> np.ndarray:
+    relevance, _ = _truncate(relevance, num_matches, k)
+    return np.sum(relevance * _dcg_weights(relevance.shape[1], method), axis=1)
+
+
+def _batch_ndcg_at_k(
+    relevance: np.ndarray,
+    num_matches: np.ndarray,
+    method: int = 0,
+    k: Optional[int] = None,
+) -> np.ndarray:
+    dcg = _batch_dcg_at_k(relevance, num_matches, method, k)
+    # the ideal ranking puts all the relevant matches first
+    num_rel = relevance.sum(axis=1, keepdims=True)
+    ideal = np.arange(relevance.shape[1]) < num_rel
+    dcg_max = _batch_dcg_at_k(ideal, num_matches, method, k)
+    return np.divide(dcg, dcg_max, out=np.zeros(len(dcg)), where=dcg_max > 0)
+
+
+#: the batched version of each metric
+_BATCH_METRICS = {
+    'r_precision': _batch_r_precision,
+    'precision_at_k': _batch_precision_at_k,
+    'hit_at_k': _batch_hit_at_k,
+    'average_precision': _batch_average_precision,
+    'reciprocal_rank': _batch_reciprocal_rank,
+    'recall_at_k': _batch_recall_at_k,
+    'f1_score_at_k': _batch_f1_score_at_k,
+    'dcg_at_k': _batch_dcg_at_k,
+    'ndcg_at_k': _batch_ndcg_at_k,
+}
@@ -0,0 +1,165 @@
+from typing import List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from ..ndarray import ArrayType
+
+
+class SparseInvertedIndex:
+    """Inverted index over sparse embeddings (e.g. BM25 or SPLADE term weights), for top-k dot-product search.
+
+    Each term (column) maps to its postings: the rows holding it, sorted, and their weights. A query only touches the
+    postings of its own terms. With non-negative weights, the search uses MaxScore: terms are visited by decreasing
+    upper bound of their contribution, and once the terms left can not lift an unseen row into the top-k, they are
+    only looked up for the rows already seen.
+
+    :param y_mat: scipy.sparse like array with ndim=2, one row per indexed Document
+    :param ids: the ids of the indexed Documents, used to check the index is up to date
+    """
+
+    def __init__(self, y_mat: 'ArrayType', ids: Optional[Sequence[str]] = None):
+        import scipy.sparse as sp
+
+        y_mat = sp.csc_matrix(y_mat)
+        y_mat.sum_duplicates()
+        y_mat.sort_indices()
+        self.ids = list(ids) if ids is not None else None
+        self._load(
+            y_mat.shape[0],
+            y_mat.indptr.astype(np.int64),
+            y_mat.indices.astype(np.int64),
+            y_mat.data.astype(np.float64),
+        )
+
+    def _load(
+        self, num_rows: int, indptr: np.ndarray, rows: np.ndarray, weights: np.ndarray
+    ):
+        self.num_rows = num_rows
+        self._indptr = indptr
+        self._rows = rows
+        self._weights = weights
+        self._max_weights = np.zeros(len(indptr) - 1)
+        non_empty = np.flatnonzero(np.diff(indptr))
+        if len(non_empty):
+            self._max_weights[non_empty] = np.maximum.reduceat(
+                weights, indptr[non_empty]
+            )
+        self._non_negative = not np.any(weights < 0)
+
+    def save(self, path: str) -> None:
+        """Save the index to a ``.npz`` file
+
+        :param path: the file path
+        """
+        np.savez(
+            path,
+            num_rows=self.num_rows,
+            indptr=self._indptr,
+            rows=self._rows,
+            weights=self._weights,
+            ids=np.array(self.ids if self.ids is not None else [], dtype=str),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> 'SparseInvertedIndex':
+        """Load an index saved by :meth:`save`
+
+        :param path: the file path
+        :return: the index
+        """
+        with np.load(path) as f:
+            index = cls.__new__(cls)
+            index.ids = f['ids'].tolist()
+            index._load(int(f['num_rows']), f['indptr'], f['rows'], f['weights'])
+        return index
+
+    def search(
+        self, x_mat: 'ArrayType', limit: int
+    ) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        """Find the rows with the largest dot product with each query.
+
+        Rows sharing no term with a query are not returned, so a query may get fewer than ``limit`` rows.
+
+        :param x_mat: scipy.sparse like array with ndim=2, one row per query
+        :param limit: the max number of rows per query
+        :return: for each query, the negated dot products in ascending order (i.e. as distances) and the rows
+        """
+        import scipy.sparse as sp
+
+        x_mat = sp.csr_matrix(x_mat)
+        num_terms = len(self._indptr) - 1
+        if x_mat.shape[1] > num_terms:
+            raise ValueError(
+                f'queries have {x_mat.shape[1]} dimensions, whereas the index has {num_terms}'
+            )
+        dists, idx = [], []
+        for i in range(x_mat.shape[0]):
+            start, end = x_mat.indptr[i], x_mat.indptr[i + 1]
+            rows, scores = self._search_one(
+                x_mat.indices[start:end], x_mat.data[start:end], limit
+            )
+            dists.append(-scores)
+            idx.append(rows)
+        return dists, idx
+
+    def _postings(self, term: int) -> Tuple[np.ndarray, np.ndarray]:
+        start, end = self._indptr[term], self._indptr[term + 1]
+        return self._rows[start:end], self._weights[start:end]
+
+    def _search_one(
+        self, terms: np.ndarray, q_weights: np.ndarray, limit: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        limit = min(limit, self.num_rows)
+        upper_bounds = q_weights * self._max_weights[terms]
+        prune = self._non_negative and not np.any(q_weights < 0)
+        order = np.argsort(-upper_bounds, kind='stable')
+        # the max score a row can still get from the terms not visited yet
+        remaining = np.append(np.cumsum(upper_bounds[order][::-1])[::-1], 0)[1:]
+        total = upper_bounds.sum()
+
+        scores = np.zeros(self.num_rows)
+        seen = np.zeros(self.num_rows, dtype=bool)
+        # set once the terms left can not lift an unseen row into the top-k
+        cand_rows = cand_scores = None
+        for t, left in zip(order, remaining):
+            rows, weights = self._postings(terms[t])
+            contrib = q_weights[t] * weights
+            if cand_rows is None:
+                # postings hold every row at most once
+                scores[rows] += contrib
+                seen[rows] = True
+            else:
+                pos = np.searchsorted(rows, cand_rows)
+                found = pos < len(rows)
+                found[found] = rows[pos[found]] == cand_rows[found]
+                cand_scores[found] += contrib[pos[found]]
+
+            if not prune or not limit:
+                continue
+            if cand_rows is None:
+                # no row got more than the bounds of the terms visited so far
+                if total - left < left:
+                    continue
+                threshold = np.partition(scores, self.num_rows - limit)[
+                    self.num_rows - limit
+                ]
+                if threshold < left:
+                    continue
+                cand_rows = np.flatnonzero(seen & (scores + left >= threshold))
+                cand_scores = scores[cand_rows]
+            elif len(cand_scores) > limit:
+                threshold = np.partition(cand_scores, len(cand_scores) - limit)[
+                    len(cand_scores) - limit
+                ]
+                keep = cand_scores + left >= threshold
+                cand_rows, cand_scores = cand_rows[keep], cand_scores[keep]
+
+        if cand_rows is None:
+            cand_rows = np.flatnonzero(seen)
+            cand_scores = scores[cand_rows]
+        if len(cand_rows) > limit:
+            top = np.argpartition(-cand_scores, limit - 1)[:limit]
+            cand_rows, cand_scores = cand_rows[top], cand_scores[top]
+        top = np.argsort(-cand_scores, kind='stable')
+        return cand_rows[top], cand_scores[top]
@@ -1,27 +1,58 @@
+import functools
+import glob
 import itertools
 import mmap
 import os
 import shutil
 import tempfile
+import threading
 import warnings
-from collections import OrderedDict
 from collections.abc import MutableSequence
 from pathlib import Path
-from typing import Union, Iterable, Iterator, Optional, TYPE_CHECKING, List
+from typing import (
+    Union,
+    Iterable,
+    Iterator,
+    Optional,
+    TYPE_CHECKING,
+    List,
+    Tuple,
+    Dict,
+)
 
 import numpy as np
 
-from .bpm import BufferPoolManager
+from .bpm import BufferPoolManager, CachePolicy
+from .index import HeaderIndex
 from ..array.mixins import AllMixins
 from ..helper import __windows__
 
 _HEADER_NONE_ENTRY = (-1, -1, -1)
 _PAGE_SIZE = mmap.ALLOCATIONGRANULARITY
+#: the segment of a Document is stored in the high bits of its page offset, segment 0 being `body.bin`
+_SEGMENT_SHIFT = 40
+_SEGMENT_OFFSET_MASK = (1 << _SEGMENT_SHIFT) - 1
+_COMPACTION_BATCH_SIZE = 1024
+#: the number of Documents appended by `extend` between two commits
+_EXTEND_BATCH_SIZE = 10000
+#: the commit marker packs the generation in its high bits and the number of committed header rows in its low bits
+_COMMIT_SHIFT = 40
+_COMMIT_ROWS_MASK = (1 << _COMMIT_SHIFT) - 1
+_GENERATION_MASK = (1 << (63 - _COMMIT_SHIFT)) - 1
 
 if TYPE_CHECKING:
     from .. import Document, DocumentArray
 
 
+def _locked(func):
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return func(self, *args, **kwargs)
+
+    return wrapper
+
+
 class DocumentArrayMemmap(
     AllMixins,
     MutableSequence,
@@ -32,17 +63,35 @@ class DocumentArrayMemmap(
     Memory-mapped files are used for accessing :class:`Document` of large :class:`DocumentArray` on disk,
     without reading the entire file into memory.
 
-    The :class:`DocumentArrayMemmap` on-disk storage consists of two files:
-        - `header.bin`: stores id, offset, length and boundary info of each Document in `body.bin`;
-        - `body.bin`: stores Documents continuously
-
-    When loading :class:`DocumentArrayMemmap`, it loads the content of `header.bin` into memory, while storing
-    all `body.bin` data on disk. As `header.bin` is often much smaller than `body.bin`, memory is saved.
+    The :class:`DocumentArrayMemmap` on-disk storage consists of:
+        - `header.bin`: stores id, segment, offset, length and boundary info of each Document in the body;
+        - `body.bin`, `body.1.bin`, ...: the segments of the body, which store Documents continuously. Documents
+          are appended to the last segment, a new one is started once it exceeds `segment_size` bytes;
+        - `header.idx`: a hash index from ids to their rows in `header.bin`, along with the rows of the live
+          Documents, see :class:`HeaderIndex`;
+        - `commit.bin`: the commit marker, a single 64-bit word holding the number of header rows published to
+          readers and a generation, which the writer bumps whenever it changes published rows in place.
+
+    When loading :class:`DocumentArrayMemmap`, it memory-maps `header.bin` & `header.idx`, while storing all
+    body data on disk. The index is updated with the rows appended since it was written (e.g. after a crash),
+    and rebuilt if it is missing or stale. It is written on :meth:`flush`.
+
+    Deleted & updated Documents leave dead bytes in their segment. :meth:`compact` moves the live Documents of the
+    segments with the most dead bytes to the last segment and removes them, while the Documents stay readable.
+    Set `auto_compact` to do so in the background, once a segment has less than this ratio of live bytes.
+
+    One process may write to a :class:`DocumentArrayMemmap` while others open it with `read_only=True`. The writer
+    publishes its changes by atomically overwriting the commit marker, once the Documents & header rows it covers are
+    written, i.e. on every flushed append, delete, :meth:`extend` and :meth:`flush`. Readers check the marker on access:
+    they tail the header rows appended since the last committed row they saw, and reload the whole header only when
+    the generation changed, e.g. after a deletion or an update.
 
     :class:`DocumentArrayMemmap` also loads a portion of the documents in a memory buffer and keeps the memory documents
     synced with the disk. This helps ensure that modified documents are persisted to the disk.
     The memory buffer size is configured with parameter `buffer_pool_size` which represents the number of documents
-    that the buffer can store.
+    that the buffer can store, and optionally `buffer_pool_bytes`, the number of bytes of serialized documents. Set
+    `buffer_pool_policy` to `2q` so that scans (e.g. iterating or matching) do not evict the hot documents, see
+    :class:`BufferPoolManager`. Its counters are given by :attr:`buffer_pool_stats`.
 
     .. note::
             To make sure the documents you modify are persisted to disk, make sure that the number of referenced
@@ -76,18 +125,47 @@ class DocumentArrayMemmap(
         path: Optional[str] = None,
         key_length: int = 36,
         buffer_pool_size: int = 1000,
+        segment_size: int = 256 * 1024 * 1024,
+        auto_compact: Optional[float] = None,
+        read_only: bool = False,
+        buffer_pool_bytes: Optional[int] = None,
+        buffer_pool_policy: Union[str, CachePolicy] = 'lru',
     ):
         if path:
-            Path(path).mkdir(parents=True, exist_ok=True)
+            if not read_only:
+                Path(path).mkdir(parents=True, exist_ok=True)
         else:
             path = tempfile.mkdtemp()
         self._path = path
         self._header_path = os.path.join(path, 'header.bin')
         self._body_path = os.path.join(path, 'body.bin')
+        self._index_path = os.path.join(path, 'header.idx')
+        self._commit_path = os.path.join(path, 'commit.bin')
         self._key_length = key_length
+        self._header_dtype = np.dtype(
+            [
+                ('', (np.str_, key_length)),  # key_length x 4 bytes
+                ('', np.int64),  # 8 bytes
+                ('', np.int64),  # 8 bytes
+                ('', np.int64),  # 8 bytes
+            ]
+        )
+        self._header_entry_size = self._header_dtype.itemsize
+        self._segment_size = segment_size
+        self._auto_compact = auto_compact
+        self._read_only = read_only
+        self._commit_marker = None
+        self._rewritten = False
+        self._compaction_thread = None
+        # guards the locations of the Documents, which compaction changes from another thread
+        self._lock = threading.RLock()
         self._last_mmap = None
         self._load_header_body()
-        self._buffer_pool = BufferPoolManager(pool_size=buffer_pool_size)
+        self._buffer_pool = BufferPoolManager(
+            pool_size=buffer_pool_size,
+            max_bytes=buffer_pool_bytes,
+            policy=buffer_pool_policy,
+        )
 
     def insert(self, index: int, doc: 'Document') -> None:
         """Insert `doc` at `index`.
@@ -110,65 +188,386 @@ class DocumentArrayMemmap(
         self._load_header_body()
         self._buffer_pool.clear()
 
+    @_locked
     def _load_header_body(self, mode: str = 'a'):
         if hasattr(self, '_header'):
             self._header.close()
         if hasattr(self, '_body'):
             self._body.close()
-
-        open(self._header_path, mode).close()
-        open(self._body_path, mode).close()
-
-        self._header = open(self._header_path, 'r+b')
-        self._body = open(self._body_path, 'r+b')
-
-        tmp = np.frombuffer(
-            self._header.read(),
-            dtype=[
-                ('', (np.str_, self._key_length)),  # key_length x 4 bytes
-                ('', np.int64),  # 8 bytes
-                ('', np.int64),  # 8 bytes
-                ('', np.int64),  # 8 bytes
-            ],
+        self._commit_marker = None
+        # the header may be truncated below, which a mapping would prevent on Windows
+        self._last_header_mmap = None
+        self._last_header_keys = ()
+        self._last_mmap = None
+        for m in getattr(self, '_segment_mmaps', {}).values():
+            m.close()
+        self._segment_mmaps = {}
+        self._segment_live = None
+
+        if self._read_only:
+            self._header = open(self._header_path, 'rb')
+            self._segment_sizes = {}
+            self._active_segment = None
+            self._generation, num_rows = self._read_commit()
+        else:
+            open(self._header_path, mode).close()
+            if mode == 'wb':
+                for seg in self._list_segments():
+                    os.remove(self._segment_path(seg))
+                # the commit marker is kept, readers have it mapped
+                if os.path.exists(self._index_path):
+                    os.remove(self._index_path)
+            if not self._list_segments():
+                open(self._body_path, 'wb').close()
+
+            # unbuffered, so that the memory-mapped header always sees the rows written
+            self._header = open(self._header_path, 'r+b', buffering=0)
+            self._segment_sizes = {
+                seg: os.path.getsize(self._segment_path(seg))
+                for seg in self._list_segments()
+            }
+            self._open_segment(max(self._segment_sizes))
+            num_rows = os.path.getsize(self._header_path) // self._header_entry_size
+            self._generation = self._read_commit()[0]
+            # the rows may have changed since the last commit, e.g. by `prune`
+            self._rewritten = True
+
+        index = HeaderIndex.load(self._index_path, self._key_length)
+        if index is None or index.num_rows > num_rows:
+            index = HeaderIndex.build(
+                self._header_mmap(num_rows)[:num_rows], self._key_length
+            )
+            self._index_saved = False
+        else:
+            self._index_saved = index.num_rows == num_rows
+        self._index = index
+        # rows appended after the index was written, e.g. before a crash
+        self._tail(num_rows)
+        if not self._read_only:
+            self._commit()
+
+    def _tail(self, num_rows: int) -> None:
+        """Index the header rows appended up to `num_rows`"""
+        header = self._header_mmap(num_rows)
+        for row in range(self._index.num_rows, num_rows):
+            self._index.num_rows = row + 1
+            if header[row][1] != -1:
+                self._index_row(str(header[row][0]), row, append=True)
+
+    def _read_commit(self) -> Tuple[int, int]:
+        """Read the commit marker, which the writer creates on load
+
+        :return: the generation and the number of committed header rows
+        """
+        if self._commit_marker is None:
+            if not os.path.exists(self._commit_path):
+                if self._read_only:
+                    # written by an older version, all the rows are committed
+                    return (
+                        0,
+                        os.path.getsize(self._header_path) // self._header_entry_size,
+                    )
+                with open(self._commit_path, 'wb') as f:
+                    f.write(np.zeros(1, dtype=np.int64).tobytes())
+            self._commit_marker = np.memmap(
+                self._commit_path,
+                dtype=np.int64,
+                mode='r' if self._read_only else 'r+',
+                shape=(1,),
+            ).view(np.ndarray)
+        # a single aligned 64-bit word, which the writer overwrites at once
+        marker = self._commit_marker.item(0)
+        return marker >> _COMMIT_SHIFT, marker & _COMMIT_ROWS_MASK
+
+    def _commit(self) -> None:
+        """Publish the header rows written so far to the readers, the Documents they point to must be flushed"""
+        if self._rewritten:
+            self._generation = (self._generation + 1) & _GENERATION_MASK
+            self._rewritten = False
+        self._commit_marker[0] = (
+            self._generation << _COMMIT_SHIFT | self._index.num_rows
         )
-        self._header_entry_size = 24 + 4 * self._key_length
-        self._last_header_entry = len(tmp)
 
-        self._header_map = OrderedDict()
-        for idx, r in enumerate(tmp):
-            if not np.array_equal((r[1], r[2], r[3]), _HEADER_NONE_ENTRY):
-                self._header_map[r[0]] = (idx, r[1], r[2], r[3])
+    def refresh(self) -> None:
+        """Catch up with the changes committed by the writer, only needed for a read-only
+        :class:`DocumentArrayMemmap`. This is done on access anyway.
 
-        self._header_keys = list(self._header_map.keys())
+        Appended Documents are indexed incrementally, from the last header row seen. The whole header is reloaded
+        only when the writer changed rows in place, e.g. deleted or updated Documents.
+        """
+        if not self._read_only:
+            return
+        with self._lock:
+            generation, num_rows = self._read_commit()
+            if generation != self._generation:
+                self.reload()
+            elif num_rows > self._index.num_rows:
+                self._tail(num_rows)
+
+    def _check_writable(self) -> None:
+        if self._read_only:
+            raise RuntimeError(f'{self!r} is opened with `read_only=True`')
+
+    def _segment_path(self, seg: int) -> str:
+        return (
+            self._body_path if seg == 0 else os.path.join(self._path, f'body.{seg}.bin')
+        )
 
+    def _list_segments(self) -> List[int]:
+        segs = [
+            int(os.path.basename(p).split('.')[1])
+            for p in glob.glob(os.path.join(self._path, 'body.*.bin'))
+        ]
+        # `body.bin` is removed once compacted
+        if os.path.exists(self._body_path):
+            segs.append(0)
+        return sorted(segs)
+
+    def _open_segment(self, seg: int) -> None:
+        """Make `seg` the segment Documents are appended to"""
+        if hasattr(self, '_body') and not self._body.closed:
+            self._body.close()
+        path = self._segment_path(seg)
+        open(path, 'a').close()
+        self._active_segment = seg
+        self._body = open(path, 'r+b')
         self._body_fileno = self._body.fileno()
-        self._start = 0
-        if self._header_map:
-            self._start = tmp[-1][1] + tmp[-1][3]
-            self._body.seek(self._start)
+        self._start = os.path.getsize(path)
+        self._segment_sizes[seg] = self._start
+        self._body.seek(self._start)
+        self._last_mmap = None
+
+    def _header_mmap(self, num_rows: Optional[int] = None) -> np.ndarray:
+        num_rows = self._index.num_rows if num_rows is None else num_rows
+        if self._last_header_mmap is None or len(self._last_header_mmap) < num_rows:
+            # a plain view, indexing a np.memmap goes through Python
+            self._last_header_mmap = (
+                np.memmap(self._header_path, dtype=self._header_dtype, mode='r').view(
+                    np.ndarray
+                )
+                if num_rows
+                else np.empty(0, dtype=self._header_dtype)
+            )
+            self._last_header_keys = self._last_header_mmap['f0']
+        return self._last_header_mmap
+
+    def _header_entry(self, row: int) -> np.void:
+        return self._header_mmap(row + 1)[row]
+
+    def _key_at(self, row: int) -> str:
+        if row >= len(self._last_header_keys):
+            self._header_mmap(row + 1)
+        return self._last_header_keys[row]
+
+    def _find_row(self, key: str) -> Optional[int]:
+        self.refresh()
+        row = self._index.find(key, self._key_at)
+        if row is not None and self._header_entry(row)[1] != -1:
+            return row
+
+    def _index_row(self, key: str, row: int, append: bool) -> None:
+        old_row = self._index.insert(key, row, self._key_at)
+        if old_row == row:
+            return
+        if old_row is not None and self._header_entry(old_row)[1] != -1:
+            # an id is stored in one live row only, the previous one gets deleted
+            self._release(self._header_entry(old_row))
+            self._write_header_entry(old_row, key, *_HEADER_NONE_ENTRY)
+            self._index.remove_live(old_row)
+            self._invalidate_index()
+        elif not append:
+            self._invalidate_index()
+        if append:
+            self._index.append_live(row)
+        self._index_saved = False
+
+    def _invalidate_index(self) -> None:
+        """Remove the persisted index once it is stale in a way appending can not tell"""
+        # the readers can not tail such changes either
+        self._rewritten = True
+        if os.path.exists(self._index_path):
+            os.remove(self._index_path)
+
+    @_locked
+    def _write_header_entry(self, row: int, key: str, p: int, r: int, l: int) -> None:
+        self._header.seek(row * self._header_entry_size, 0)
+        self._header.write(np.array((key, p, r, l), dtype=self._header_dtype).tobytes())
+
+    def _write_body(self, value: bytes) -> Tuple[int, int]:
+        """Append `value` to the last segment
+
+        :param value: the serialized Document
+        :return: the page offset, with the segment in its high bits, and the remainder
+        """
+        if self._start and self._start >= self._segment_size:
+            self._body.flush()
+            self._open_segment(self._active_segment + 1)
+        p = int(self._start / _PAGE_SIZE) * _PAGE_SIZE  #: offset of the page
+        r = (
+            self._start % _PAGE_SIZE
+        )  #: the remainder, i.e. the start position given the offset
+        self._body.write(value)
+        self._start = p + r + len(value)
+        self._segment_sizes[self._active_segment] = self._start
+        return self._active_segment << _SEGMENT_SHIFT | p, r
+
+    def _compute_segment_live(self) -> None:
+        header = self._header_mmap()
+        live = self._index.live
+        p = header['f1'][live]
+        lengths = header['f3'][live] - header['f2'][live]
+        self._segment_live = dict.fromkeys(self._segment_sizes, 0)
+        segs, inverse = np.unique(p >> _SEGMENT_SHIFT, return_inverse=True)
+        for seg, nbytes in zip(segs.tolist(), np.bincount(inverse, weights=lengths)):
+            self._segment_live[seg] = int(nbytes)
+
+    def _add_live(self, seg: int, nbytes: int) -> None:
+        if self._segment_live is not None:
+            self._segment_live[seg] = self._segment_live.get(seg, 0) + nbytes
+
+    def _release(self, entry: np.void) -> None:
+        """Account for the bytes of an entry which is about to be deleted or overwritten"""
+        _, p, r, r_plus_l = entry.item()
+        if p == -1:
+            return
+        seg = p >> _SEGMENT_SHIFT
+        if self._auto_compact is not None and self._segment_live is None:
+            self._compute_segment_live()
+        self._add_live(seg, r - r_plus_l)
+        if (
+            self._auto_compact is not None
+            and seg != self._active_segment
+            and self._live_ratio(seg) < self._auto_compact
+        ):
+            self.compact(self._auto_compact, background=True)
+
+    def _live_ratio(self, seg: int) -> float:
+        size = self._segment_sizes.get(seg, 0)
+        return self._segment_live.get(seg, 0) / size if size else 1.0
+
+    def compact(
+        self, min_live_ratio: float = 0.5, background: bool = False
+    ) -> Optional[threading.Thread]:
+        """Reclaim the space of deleted & updated Documents, one segment at a time.
+
+        The live Documents of every segment but the last one, whose ratio of live bytes is below
+        ``min_live_ratio``, are appended to the last segment, worst segment first. Then the segment is removed.
+        Documents are moved in small batches, each one switching their header entries at once, so that the
+        :class:`DocumentArrayMemmap` keeps serving reads & writes meanwhile.
+
+        :param min_live_ratio: the segments with a lower ratio of live bytes are compacted
+        :param background: if set, compact in a background thread, unless one is already running
+        :return: the background thread if ``background`` is set, else None
+        """
+        self._check_writable()
+        if background:
+            with self._lock:
+                if (
+                    self._compaction_thread is None
+                    or not self._compaction_thread.is_alive()
+                ):
+                    self._compaction_thread = threading.Thread(
+                        target=self.compact,
+                        args=(min_live_ratio,),
+                        name=f'{self.__class__.__name__}-compaction',
+                        daemon=True,
+                    )
+                    self._compaction_thread.start()
+                return self._compaction_thread
+
+        with self._lock:
+            if self._segment_live is None:
+                self._compute_segment_live()
+            ratios = {
+                seg: self._live_ratio(seg)
+                for seg, size in self._segment_sizes.items()
+                if seg != self._active_segment and size
+            }
+        for seg in sorted(ratios, key=ratios.get):
+            if ratios[seg] < min_live_ratio:
+                self._compact_segment(seg)
+
+    def _compact_segment(self, seg: int) -> None:
+        with self._lock:
+            live = self._index.live
+            rows = live[(self._header_mmap()['f1'][live] >> _SEGMENT_SHIFT) == seg]
+        for start in range(0, len(rows), _COMPACTION_BATCH_SIZE):
+            # readers & writers get the lock back between batches
+            with self._lock:
+                self._move_rows(rows[start : start + _COMPACTION_BATCH_SIZE], seg)
+        with self._lock:
+            if self._segment_live.get(seg, 0) > 0:
+                # some entries still point to this segment, keep it
+                return
+            m = self._segment_mmaps.pop(seg, None)
+            if m is not None:
+                m.close()
+            os.remove(self._segment_path(seg))
+            del self._segment_sizes[seg]
+            self._segment_live.pop(seg, None)
+
+    def _move_rows(self, rows: np.ndarray, seg: int) -> None:
+        src = self._segment_mmap(seg)
+        moved = []
+        for row in rows.tolist():
+            key, p, r, r_plus_l = self._header_entry(row).item()
+            if p == -1 or p >> _SEGMENT_SHIFT != seg:
+                # deleted or rewritten meanwhile
+                continue
+            offset = p & _SEGMENT_OFFSET_MASK
+            new_p, new_r = self._write_body(src[offset + r : offset + r_plus_l])
+            moved.append((row, key, new_p, new_r, new_r + r_plus_l - r))
+        # the header only points to the new copies once they are on disk
+        self._body.flush()
         self._last_mmap = None
+        for row, key, p, r, r_plus_l in moved:
+            self._release(self._header_entry(row))
+            self._write_header_entry(row, key, p, r, r_plus_l)
+            self._add_live(p >> _SEGMENT_SHIFT, r_plus_l - r)
+        self._rewritten = True
+        self._commit()
+
+    def _wait_compaction(self) -> None:
+        if self._compaction_thread is not None:
+            self._compaction_thread.join()
 
     def __len__(self):
-        return len(self._header_map)
+        self.refresh()
+        return self._index.num_live
 
-    def extend(self, docs: Iterable['Document']) -> None:
+    def extend(self, docs: Iterable['Document'], update_buffer: bool = True) -> None:
         """Extend the :class:`DocumentArrayMemmap` by appending all the items from the iterable.
 
+        The Documents are flushed to disk & committed in batches, so that a long stream of Documents, e.g. from
+        :func:`~docarray.document.generators.from_files`, shows up to the readers while it is appended.
+
         :param docs: the iterable of Documents to extend this array with
+        :param update_buffer: If set, keep the Documents in the buffer pool. Unset it when the Documents are not used
+            afterwards, to spare the pool from evicting the Documents it holds to make room for them.
         """
         if not docs:
             return
 
-        for d in docs:
-            self.append(d, flush=False)
+        for i, d in enumerate(docs, start=1):
+            self.append(d, flush=False, update_buffer=update_buffer)
+            if i % _EXTEND_BATCH_SIZE == 0:
+                self._flush_appended()
+        self._flush_appended()
+
+    @_locked
+    def _flush_appended(self) -> None:
         self._header.flush()
         self._body.flush()
         self._last_mmap = None
+        self._commit()
 
     def clear(self) -> None:
         """Clear the on-disk data of :class:`DocumentArrayMemmap`"""
+        self._check_writable()
+        self._wait_compaction()
         self._load_header_body('wb')
 
+    @_locked
     def _update_or_append(
         self,
         doc: 'Document',
@@ -176,51 +575,39 @@ class DocumentArrayMemmap(
         flush: bool = True,
         update_buffer: bool = True,
     ) -> None:
+        self._check_writable()
         value = bytes(doc)
         l = len(value)  #: the length
-        p = int(self._start / _PAGE_SIZE) * _PAGE_SIZE  #: offset of the page
-        r = (
-            self._start % _PAGE_SIZE
-        )  #: the remainder, i.e. the start position given the offset
-
-        if idx is not None:
-            self._header.seek(idx * self._header_entry_size, 0)
 
         if (doc.id is not None) and len(doc.id) > self._key_length:
             warnings.warn(
                 f'The ID of doc ({doc.id}) will be truncated to the maximum length {self._key_length}'
             )
 
-        self._header.write(
-            np.array(
-                (doc.id, p, r, r + l),
-                dtype=[
-                    ('', (np.str_, self._key_length)),
-                    ('', np.int64),
-                    ('', np.int64),
-                    ('', np.int64),
-                ],
-            ).tobytes()
-        )
+        p, r = self._write_body(value)
         if idx is None:
-            self._header_map[doc.id] = (self._last_header_entry, p, r, r + l)
-            self._last_header_entry = self._last_header_entry + 1
-            self._header_keys.append(doc.id)
+            row = self._index.num_rows
+            self._index.num_rows += 1
         else:
-            self._header_map[doc.id] = (idx, p, r, r + l)
-            self._header_keys[idx] = doc.id
-            self._header.seek(0, 2)
-        self._start = p + r + l
-        self._body.write(value)
+            row = idx
+            self._release(self._header_entry(row))
+        self._write_header_entry(row, doc.id, p, r, r + l)
+        self._index_row(doc.id, row, append=idx is None)
+        self._add_live(self._active_segment, l)
         if flush:
             self._header.flush()
             self._body.flush()
             self._last_mmap = None
+            self._commit()
         if update_buffer:
-            result = self._buffer_pool.add_or_update(doc.id, doc)
-            if result:
-                _key, _doc = result
-                self._update(_doc, self._str2int_id(_key), update_buffer=False)
+            self._persist_evicted(self._buffer_pool.add(doc.id, doc, l))
+        else:
+            # a Document buffered under the same id is outdated
+            self._buffer_pool.delete_if_exists(doc.id)
+
+    def _persist_evicted(self, evicted: List[Tuple[str, 'Document']]) -> None:
+        for _key, _doc in evicted:
+            self._update(_doc, self._str2int_id(_key), update_buffer=False)
 
     def append(
         self, doc: 'Document', flush: bool = True, update_buffer: bool = True
@@ -295,6 +682,20 @@ class DocumentArrayMemmap(
             self._body.seek(self._start)
         return self._last_mmap
 
+    def _segment_mmap(self, seg: int, end: int = 0) -> 'mmap':
+        if seg == self._active_segment:
+            return self._mmap
+        m = self._segment_mmaps.get(seg)
+        if m is None or len(m) < end:
+            # the segments before the last one are never written to again, only readers see the last one growing
+            if m is not None:
+                m.close()
+            with open(self._segment_path(seg), 'rb') as f:
+                self._segment_mmaps[seg] = mmap.mmap(
+                    f.fileno(), length=0, access=mmap.ACCESS_READ
+                )
+        return self._segment_mmaps[seg]
+
     def _get_doc_by_key(self, key: str):
         """
         returns a document by key (ID) from disk
@@ -302,21 +703,35 @@ class DocumentArrayMemmap(
         :param key: id of the document
         :return: returns a document
         """
-        pos_info = self._header_map[key]
-        _, p, r, r_plus_l = pos_info
+        return self._load_doc(key)[0]
+
+    @_locked
+    def _load_doc(self, key: str) -> Tuple['Document', int]:
+        self.refresh()
+        row = self._index.find(key, self._key_at)
+        if row is None:
+            raise KeyError(key)
+        _, p, r, r_plus_l = self._header_entry(row).item()
+        if p == -1:
+            raise KeyError(key)
         from .. import Document
 
-        return Document(self._mmap[p + r : p + r_plus_l])
+        offset = p & _SEGMENT_OFFSET_MASK
+        doc = Document(
+            self._segment_mmap(p >> _SEGMENT_SHIFT, offset + r_plus_l)[
+                offset + r : offset + r_plus_l
+            ]
+        )
+        return doc, r_plus_l - r
 
     def __getitem__(self, key: Union[int, str, slice, List]):
         if isinstance(key, str):
-            if key in self._buffer_pool:
-                return self._buffer_pool[key]
-            doc = self._get_doc_by_key(key)
-            result = self._buffer_pool.add_or_update(key, doc)
-            if result:
-                _key, _doc = result
-                self._update(_doc, self._str2int_id(_key), update_buffer=False)
+            # a reader drops its buffer pool when the writer updated Documents
+            self.refresh()
+            doc = self._buffer_pool.get(key)
+            if doc is None:
+                doc, nbytes = self._load_doc(key)
+                self._persist_evicted(self._buffer_pool.add(key, doc, nbytes))
             return doc
 
         elif isinstance(key, int):
@@ -330,27 +745,16 @@ class DocumentArrayMemmap(
         else:
             raise TypeError(f'`key` must be int, str or slice, but receiving {key!r}')
 
+    @_locked
     def _del_doc(self, idx: int, str_key: str):
-        p = idx * self._header_entry_size
-        self._header.seek(p, 0)
-
-        self._header.write(
-            np.array(
-                (str_key, -1, -1, -1),
-                dtype=[
-                    ('', (np.str_, self._key_length)),
-                    ('', np.int64),
-                    ('', np.int64),
-                    ('', np.int64),
-                ],
-            ).tobytes()
-        )
-        self._header.seek(0, 2)
-        self._header.flush()
+        self._check_writable()
+        self._release(self._header_entry(idx))
+        self._write_header_entry(idx, str_key, *_HEADER_NONE_ENTRY)
         self._last_mmap = None
-        pop_idx = self._header_keys.index(str_key)
-        self._header_map.pop(str_key)
-        self._header_keys.pop(pop_idx)
+        self._index.remove_live(idx)
+        self._invalidate_index()
+        self._index_saved = False
+        self._commit()
         self._buffer_pool.delete_if_exists(str_key)
 
     def __delitem__(self, key: Union[int, str, slice]):
@@ -359,45 +763,44 @@ class DocumentArrayMemmap(
             str_key = key
             self._del_doc(idx, str_key)
         elif isinstance(key, int):
-            idx = key
-            str_key = self._int2str_id(idx)
-            self._del_doc(idx, str_key)
+            str_key = self._int2str_id(key)
+            self._del_doc(self._str2int_id(str_key), str_key)
         elif isinstance(key, slice):
             for idx in reversed(self._iteridx_by_slice(key)):
                 str_key = self._int2str_id(idx)
-                self._del_doc(idx, str_key)
+                self._del_doc(self._str2int_id(str_key), str_key)
         else:
             raise TypeError(f'`key` must be int, str or slice, but receiving {key!r}')
 
+    def _index_ids(self) -> List[str]:
+        self.refresh()
+        return self._header_mmap()['f0'][self._index.live].tolist()
+
     def _str2int_id(self, key: str) -> int:
-        return self._header_map[key][0]
+        # the row of the Document in the header
+        row = self._find_row(key)
+        if row is None:
+            raise KeyError(key)
+        return row
 
     def _int2str_id(self, key: int) -> str:
-        # i < 0 needs to be handled
-        return self._header_keys[key]
+        # the id of the Document at a position
+        return str(self._key_at(self._index.live[key]))
 
     def __iter__(self) -> Iterator['Document']:
-        for k in self._header_map.keys():
+        for k in self._index_ids():
             yield self[k]
 
     def __setitem__(self, key: Union[int, str], value: 'Document') -> None:
         if isinstance(key, int):
             if 0 <= key < len(self):
                 str_key = self._int2str_id(key)
-                # override an existing entry
-                self._update(value, key)
+                # override an existing entry, another entry with the same id is deleted
+                self._update(value, self._str2int_id(str_key))
 
                 # allows overwriting an existing document
                 if str_key != value.id:
-                    entry = self._header_map.pop(value.id)
-                    self._header_map = OrderedDict(
-                        [
-                            (value.id, entry) if k == str_key else (k, v)
-                            for k, v in self._header_map.items()
-                        ]
-                    )
-                    if str_key in self._buffer_pool.doc_map:
-                        self._buffer_pool.doc_map.pop(str_key)
+                    self._buffer_pool.delete_if_exists(str_key)
             else:
                 raise IndexError(f'`key`={key} is out of range')
         elif isinstance(key, str):
@@ -415,16 +818,24 @@ class DocumentArrayMemmap(
         )
 
     def __contains__(self, item: str):
-        return item in self._header_map
+        return self._find_row(item) is not None
 
+    @_locked
     def flush(self) -> None:
         """Persists memory loaded documents to disk"""
+        if self._read_only:
+            return
         docs_to_flush = self._buffer_pool.docs_to_flush()
         for key, doc in docs_to_flush:
             self._update(doc, self._str2int_id(key), flush=False)
         self._header.flush()
         self._body.flush()
         self._last_mmap = None
+        # committed first, so that the index never covers uncommitted rows
+        self._commit()
+        if not self._index_saved:
+            self._index.save(self._index_path)
+            self._index_saved = True
 
     def __del__(self):
         try:
@@ -434,26 +845,41 @@ class DocumentArrayMemmap(
 
     def prune(self) -> None:
         """Prune deleted Documents from this object, this yields a smaller on-disk storage. """
-        dam = DocumentArrayMemmap(key_length=self._key_length)
+        self._check_writable()
+        self._wait_compaction()
+        dam = DocumentArrayMemmap(
+            key_length=self._key_length, segment_size=self._segment_size
+        )
         dam.extend(self)
-        dam.reload()
-        if hasattr(self, '_body'):
-            self._body.close()
-        os.remove(self._body_path)
-        if hasattr(self, '_header'):
-            self._header.close()
-        os.remove(self._header_path)
-        shutil.copy(os.path.join(dam.path, 'header.bin'), self._header_path)
-        shutil.copy(os.path.join(dam.path, 'body.bin'), self._body_path)
+        dam.flush()
+        self.clear()
+        self._header.close()
+        self._body.close()
+        self._last_header_mmap = None
+        self._last_header_keys = ()
+        for seg in dam._list_segments():
+            shutil.copy(dam._segment_path(seg), self._segment_path(seg))
+        shutil.copy(dam._header_path, self._header_path)
+        shutil.copy(dam._index_path, self._index_path)
         self.reload()
 
+    @property
+    def buffer_pool_stats(self) -> Dict[str, Union[int, float]]:
+        """Get the counters of the buffer pool, to size it with `buffer_pool_size` & `buffer_pool_bytes`
+
+        :return: the number of hits, misses & evictions, the hit rate, the number of Documents & bytes in the buffer
+        """
+        return self._buffer_pool.stats
+
     @property
     def physical_size(self) -> int:
         """Return the on-disk physical size of this DocumentArrayMemmap, in bytes
 
         :return: the number of bytes
         """
-        return os.stat(self._header_path).st_size + os.stat(self._body_path).st_size
+        return os.stat(self._header_path).st_size + sum(
+            os.stat(self._segment_path(seg)).st_size for seg in self._list_segments()
+        )
 
     @staticmethod
     def _flatten(sequence):
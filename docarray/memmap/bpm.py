@@ -1,63 +1,360 @@
 from collections import OrderedDict
-from typing import Tuple, Optional, List, TYPE_CHECKING
+from typing import Tuple, Optional, List, Dict, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .. import Document
 
 
+class CachePolicy:
+    """
+    Decide which :class:`Document` leaves a full :class:`BufferPoolManager`.
+
+    The buffer pool calls :meth:`insert` when a Document enters the pool, :meth:`touch` when it is accessed or updated
+    again, :meth:`remove` when it leaves the pool and :meth:`victim` when it needs room.
+    """
+
+    def bind(self, pool_size: int, max_bytes: Optional[int]) -> None:
+        """
+        Receive the capacity of the buffer pool using this policy
+
+        :param pool_size: the max number of Documents in the pool
+        :param max_bytes: the max number of bytes of the Documents in the pool, None if unbounded
+        """
+
+    def insert(self, key: str, nbytes: int) -> None:
+        """
+        Track a Document entering the pool
+
+        :param key: document key
+        :param nbytes: the size of the Document
+        """
+        raise NotImplementedError
+
+    def touch(self, key: str) -> None:
+        """
+        Track an access to a Document in the pool
+
+        :param key: document key
+        """
+        raise NotImplementedError
+
+    def remove(self, key: str, evicted: bool) -> None:
+        """
+        Stop tracking a Document
+
+        :param key: document key
+        :param evicted: if the Document is evicted to make room, rather than deleted
+        """
+        raise NotImplementedError
+
+    def victim(self) -> str:
+        """
+        Choose the Document to evict, the pool is not empty
+
+        :return: the key of the Document
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Stop tracking all Documents"""
+        raise NotImplementedError
+
+
+class LRUPolicy(CachePolicy):
+    """Evict the least recently used :class:`Document`."""
+
+    def __init__(self):
+        self._order = OrderedDict()
+
+    def insert(self, key: str, nbytes: int) -> None:
+        """
+        Track a Document entering the pool
+
+        :param key: document key
+        :param nbytes: the size of the Document
+        """
+        self._order[key] = None
+
+    def touch(self, key: str) -> None:
+        """
+        Track an access to a Document in the pool
+
+        :param key: document key
+        """
+        self._order.move_to_end(key)
+
+    def remove(self, key: str, evicted: bool) -> None:
+        """
+        Stop tracking a Document
+
+        :param key: document key
+        :param evicted: if the Document is evicted to make room, rather than deleted
+        """
+        self._order.pop(key, None)
+
+    def victim(self) -> str:
+        """
+        Choose the least recently used Document
+
+        :return: the key of the Document
+        """
+        return next(iter(self._order))
+
+    def clear(self) -> None:
+        """Stop tracking all Documents"""
+        self._order.clear()
+
+
+class TwoQueuePolicy(CachePolicy):
+    """
+    Scan-resistant 2Q policy.
+
+    A :class:`Document` accessed for the first time enters a FIFO queue (`A1in`) limited to ``in_ratio`` of the pool,
+    it only moves to the LRU queue of hot Documents (`Am`) if it is accessed again after being evicted from `A1in`,
+    which a bounded queue of evicted keys (`A1out`) remembers. A sequential scan, e.g. iterating or matching over a
+    :class:`DocumentArrayMemmap`, thus only cycles through `A1in` and leaves the hot Documents in the pool.
+
+    :param in_ratio: the share of the pool, in Documents & bytes, above which `A1in` is evicted first
+    :param out_ratio: the number of keys `A1out` remembers, relative to `pool_size`
+    """
+
+    def __init__(self, in_ratio: float = 0.25, out_ratio: float = 0.5):
+        self.in_ratio = in_ratio
+        self.out_ratio = out_ratio
+        self._pool_size = None
+        self._max_bytes = None
+        self._in = OrderedDict()  # key: nbytes
+        self._in_nbytes = 0
+        self._out = OrderedDict()
+        self._main = OrderedDict()
+
+    def bind(self, pool_size: int, max_bytes: Optional[int]) -> None:
+        """
+        Receive the capacity of the buffer pool using this policy
+
+        :param pool_size: the max number of Documents in the pool
+        :param max_bytes: the max number of bytes of the Documents in the pool, None if unbounded
+        """
+        self._pool_size = pool_size
+        self._max_bytes = max_bytes
+
+    def insert(self, key: str, nbytes: int) -> None:
+        """
+        Track a Document entering the pool, in `Am` if `A1out` remembers it, else in `A1in`
+
+        :param key: document key
+        :param nbytes: the size of the Document
+        """
+        if self._out.pop(key, False) is None:
+            self._main[key] = None
+        else:
+            self._in[key] = nbytes
+            self._in_nbytes += nbytes
+        # trimmed here, so that the keys evicted to make room for this Document are not counted yet
+        while len(self._out) > max(int(self.out_ratio * self._pool_size), 1):
+            self._out.popitem(last=False)
+
+    def touch(self, key: str) -> None:
+        """
+        Track an access to a Document in the pool, only `Am` is reordered
+
+        :param key: document key
+        """
+        if key in self._main:
+            self._main.move_to_end(key)
+
+    def remove(self, key: str, evicted: bool) -> None:
+        """
+        Stop tracking a Document, `A1out` remembers it if it is evicted from `A1in`
+
+        :param key: document key
+        :param evicted: if the Document is evicted to make room, rather than deleted
+        """
+        if key in self._in:
+            self._in_nbytes -= self._in.pop(key)
+            if evicted:
+                self._out[key] = None
+        else:
+            self._main.pop(key, None)
+
+    def victim(self) -> str:
+        """
+        Choose the oldest Document of `A1in` if it exceeds its share of the pool, else the least recently used of `Am`
+
+        :return: the key of the Document
+        """
+        in_full = len(self._in) > self.in_ratio * self._pool_size or (
+            self._max_bytes is not None
+            and self._in_nbytes > self.in_ratio * self._max_bytes
+        )
+        if self._in and (in_full or not self._main):
+            return next(iter(self._in))
+        return next(iter(self._main))
+
+    def clear(self) -> None:
+        """Stop tracking all Documents"""
+        self._in.clear()
+        self._in_nbytes = 0
+        self._out.clear()
+        self._main.clear()
+
+
+_POLICIES = {'lru': LRUPolicy, '2q': TwoQueuePolicy}
+
+
 class BufferPoolManager:
     """
     Create a buffer pool manager that maps hot :class:`Document` s of a :class:`DocumentArrayMemmap` to a memory buffer.
 
     This helps keep access to memory-loaded :class:`Document` instances synced with :class:`DocumentArrayMemmap` values.
-    The memory buffer has a fixed size and uses an LRU strategy to empty spots when full.
+    The memory buffer holds at most `pool_size` Documents and, if set, `max_bytes` bytes of serialized Documents.
+    Which Document leaves a full buffer is decided by `policy`: `lru` evicts the least recently used one, `2q` is
+    resistant to sequential scans, see :class:`TwoQueuePolicy`.
+
+    :param pool_size: the max number of Documents in the buffer
+    :param max_bytes: the max number of bytes of the Documents in the buffer, None if unbounded
+    :param policy: the eviction policy, either a name (`lru`, `2q`) or a :class:`CachePolicy`
     """
 
-    def __init__(self, pool_size: int = 1000):
+    def __init__(
+        self,
+        pool_size: int = 1000,
+        max_bytes: Optional[int] = None,
+        policy: Union[str, CachePolicy] = 'lru',
+    ):
         self.pool_size = pool_size
+        self.max_bytes = max_bytes
+        if isinstance(policy, str):
+            if policy not in _POLICIES:
+                raise ValueError(
+                    f'`policy` must be one of {tuple(_POLICIES)}, but receiving {policy!r}'
+                )
+            policy = _POLICIES[policy]()
+        policy.bind(pool_size, max_bytes)
+        self.policy = policy
         self.doc_map = OrderedDict()  # dam_idx: (buffer_idx, version)
         self.buffer = []
         self._empty = []
+        self._nbytes = {}  # dam_idx: nbytes
+        #: the number of bytes of the Documents in the buffer, only tracked if `max_bytes` is set
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
-    def add_or_update(
-        self, idx: str, doc: 'Document'
-    ) -> Optional[Tuple[str, 'Document']]:
+    def get(self, key: str) -> Optional['Document']:
+        """
+        Get a document from the buffer, counting hits & misses
+
+        :param key: document key
+        :return: the document, None if it is not in the buffer
+        """
+        if key in self.doc_map:
+            self.hits += 1
+            return self[key]
+        self.misses += 1
+
+    def add(
+        self, idx: str, doc: 'Document', nbytes: Optional[int] = None
+    ) -> List[Tuple[str, 'Document']]:
         """
         Adds a document to the buffer pool or updates it if it already exists
 
         :param idx: index
         :param doc: document
-
-        :return: returns a couple of ID and :class:`Document` if there's a document to persist
+        :param nbytes: the size of the serialized document, computed if needed and not given
+        :return: the ID and :class:`Document` of the evicted documents to persist
         """
-        result = None
+        if self.max_bytes is None:
+            nbytes = 0
+        elif nbytes is None:
+            nbytes = doc.nbytes
+
         # if document is already in buffer, update it
         if idx in self.doc_map:
             self.buffer[self.doc_map[idx][0]] = doc
             self.doc_map.move_to_end(idx)
-        # else, if len is less than the size, append to buffer
-        elif len(self.buffer) < self.pool_size:
-            self.doc_map[idx] = (len(self.buffer), doc._version)
-            self.doc_map.move_to_end(idx)
-            self.buffer.append(doc)
-        # else, if buffer has empty spots, allocate them
-        elif self._empty:
-            empty_idx = self._empty.pop()
-            self.doc_map[idx] = (empty_idx, doc._version)
-            self.buffer[empty_idx] = doc
-            self.doc_map.move_to_end(idx)
-        # else, choose a spot to free and use it with LRU strategy
-        else:
-            # the least recently used item is the first item in doc_map
-            dam_idx, (buffer_idx, version) = self.doc_map.popitem(last=False)
-            if version != self.buffer[buffer_idx]._version:
-                result = dam_idx, self.buffer[buffer_idx]
-            self.doc_map[idx] = (buffer_idx, doc._version)
-            self.doc_map.move_to_end(idx)
+            self.policy.touch(idx)
+            self.nbytes += nbytes - self._nbytes[idx]
+            self._nbytes[idx] = nbytes
+            return self._evict(0, keep=idx)
+
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            # bigger than the whole buffer, it is not kept in memory
+            return []
+        result = self._evict(nbytes)
+        if self._empty:
+            buffer_idx = self._empty.pop()
             self.buffer[buffer_idx] = doc
+        else:
+            buffer_idx = len(self.buffer)
+            self.buffer.append(doc)
+        self.doc_map[idx] = (buffer_idx, doc._version)
+        self._nbytes[idx] = nbytes
+        self.nbytes += nbytes
+        self.policy.insert(idx, nbytes)
+        return result
+
+    def add_or_update(
+        self, idx: str, doc: 'Document'
+    ) -> Optional[Tuple[str, 'Document']]:
+        """
+        Adds a document to the buffer pool or updates it if it already exists, in a buffer bounded by `pool_size` only
+
+        :param idx: index
+        :param doc: document
 
+        :return: returns a couple of ID and :class:`Document` if there's a document to persist
+        """
+        if self.max_bytes is not None:
+            raise ValueError('use `add` in a buffer pool bounded by `max_bytes`')
+        result = self.add(idx, doc)
+        return result[0] if result else None
+
+    def _evict(
+        self, nbytes: int, keep: Optional[str] = None
+    ) -> List[Tuple[str, 'Document']]:
+        # make room for a Document of `nbytes`, `keep` is the Document just updated
+        result = []
+        while self.doc_map and (
+            len(self.doc_map) + (keep is None) > self.pool_size
+            or (self.max_bytes is not None and self.nbytes + nbytes > self.max_bytes)
+        ):
+            dam_idx = self.policy.victim()
+            if dam_idx == keep:
+                break
+            buffer_idx, version = self.doc_map[dam_idx]
+            doc = self.buffer[buffer_idx]
+            if version != doc._version:
+                result.append((dam_idx, doc))
+            self._remove(dam_idx, evicted=True)
+            self.evictions += 1
         return result
 
+    def _remove(self, key: str, evicted: bool) -> None:
+        buffer_idx, _ = self.doc_map.pop(key)
+        self.buffer[buffer_idx] = None
+        self._empty.append(buffer_idx)
+        self.nbytes -= self._nbytes.pop(key)
+        self.policy.remove(key, evicted)
+
+    @property
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Get the counters of the buffer pool, e.g. to size it
+
+        :return: the number of hits, misses & evictions, the hit rate, the number of Documents & bytes in the buffer
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'size': len(self.doc_map),
+            'nbytes': self.nbytes,
+        }
+
     def delete_if_exists(self, key):
         """
         Adds a document to the buffer pool or updates it if it already exists
@@ -86,18 +383,24 @@ class BufferPoolManager:
         """
         self.doc_map.clear()
         self.buffer = []
+        self._empty = []
+        self._nbytes.clear()
+        self.nbytes = 0
+        self.policy.clear()
 
     def __getitem__(self, key: str):
         if isinstance(key, str):
             doc = self.buffer[self.doc_map[key][0]]
             self.doc_map.move_to_end(key)
+            self.policy.touch(key)
             return doc
         else:
             raise TypeError(f'`key` must be str, but receiving {key!r}')
 
     def __delitem__(self, key):
-        buffer_idx, _ = self.doc_map.pop(key)
-        self._empty.append(buffer_idx)
+        if key not in self.doc_map:
+            raise KeyError(key)
+        self._remove(key, evicted=False)
 
     def __contains__(self, key):
         return key in self.doc_map
@@ -0,0 +1,283 @@
+import os
+import zlib
+from typing import Callable, Optional
+
+import numpy as np
+
+from ..helper import __windows__
+
+_INDEX_MAGIC = b'DAMIDX01'
+#: magic, key length, number of header rows covered, number of live rows, number of slots, number of used slots
+_INDEX_PREAMBLE_SIZE = len(_INDEX_MAGIC) + 5 * 8
+_MAX_LOAD_FACTOR = 0.7
+_BUILD_CHUNK_SIZE = 1 << 20
+
+
+def key_hash(key: str, key_length: int) -> int:
+    """Hash a Document id as it is stored in the header, i.e. truncated to ``key_length`` characters
+
+    :param key: the id
+    :param key_length: the max length of the ids stored in the header
+    :return: the 64-bit hash, whose low bits (i.e. the slot) come from CRC-32
+    """
+    data = key[:key_length].encode()
+    return zlib.adler32(data) << 32 | zlib.crc32(data)
+
+
+def key_hashes(keys: np.ndarray, key_length: int) -> np.ndarray:
+    """Hash the ids stored in the header
+
+    :param keys: np.ndarray of the ids
+    :param key_length: the max length of the ids stored in the header
+    :return: np.ndarray of the 64-bit hashes
+    """
+    return np.fromiter(
+        (key_hash(k, key_length) for k in keys.tolist()),
+        dtype=np.uint64,
+        count=len(keys),
+    )
+
+
+class HeaderIndex:
+    """Open-addressing hash index from Document ids to their rows in `header.bin`, along with the sorted rows of the
+    live (i.e. not deleted) Documents, which give the position of each Document.
+
+    Both are plain numpy arrays, persisted to a single file and memory-mapped on load, so that opening a
+    :class:`DocumentArrayMemmap` does not parse its whole header into Python objects. The index only stores rows & the
+    hashes of the ids, the ids, offsets and deletion flags are always read from the header itself.
+
+    :param key_length: the max length of the ids stored in the header
+    :param num_slots: the initial number of slots of the hash table, a power of 2
+    """
+
+    def __init__(self, key_length: int, num_slots: int = 1024):
+        self.key_length = key_length
+        #: number of header rows covered by this index
+        self.num_rows = 0
+        self.num_live = 0
+        self._live = np.empty(0, dtype=np.int64)
+        self._slot_rows = np.full(num_slots, -1, dtype=np.int64)
+        self._slot_hashes = np.zeros(num_slots, dtype=np.uint64)
+        self._num_used = 0
+
+    @property
+    def live(self) -> np.ndarray:
+        """Get the header rows of the live Documents, in ascending order
+
+        :return: np.ndarray of the rows, the position of a Document is the position of its row in it
+        """
+        return self._live[: self.num_live]
+
+    @classmethod
+    def build(cls, header: np.ndarray, key_length: int) -> 'HeaderIndex':
+        """Build the index of a whole header. When an id is stored in several live rows, the last one wins.
+
+        :param header: the structured np.ndarray of the header rows, e.g. memory-mapped from `header.bin`
+        :param key_length: the max length of the ids stored in the header
+        :return: the index
+        """
+        hashes, rows = [], []
+        for start in range(0, len(header), _BUILD_CHUNK_SIZE):
+            chunk = header[start : start + _BUILD_CHUNK_SIZE]
+            live = np.flatnonzero(chunk['f1'] != -1)
+            hashes.append(key_hashes(chunk['f0'][live], key_length))
+            rows.append(live + start)
+        hashes = np.concatenate(hashes) if hashes else np.empty(0, dtype=np.uint64)
+        rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+
+        # rows sharing a hash are either the same id appended twice, or (unlikely) a collision
+        order = np.argsort(hashes, kind='stable')
+        same = np.flatnonzero(hashes[order][1:] == hashes[order][:-1])
+        if len(same):
+            keep = np.ones(len(rows), dtype=bool)
+            last_rows = {}
+            for i in np.union1d(same, same + 1):
+                row = rows[order[i]]
+                key = (hashes[order[i]], header['f0'][row])
+                if key in last_rows:
+                    keep[order[last_rows[key]]] = False
+                last_rows[key] = i
+            hashes, rows = hashes[keep], rows[keep]
+
+        index = cls(key_length, _num_slots_for(len(rows)))
+        index._insert_many(hashes, rows)
+        index._live = rows.copy()
+        index.num_live = len(rows)
+        index.num_rows = len(header)
+        return index
+
+    def _insert_many(self, hashes: np.ndarray, rows: np.ndarray) -> None:
+        # linear probing, one round per probe: every pending id takes its current slot if it is free and no other
+        # pending id got it first, otherwise moves on to the next slot
+        mask = len(self._slot_rows) - 1
+        pos = (hashes & np.uint64(mask)).astype(np.int64)
+        pending = np.arange(len(rows))
+        while len(pending):
+            slots = pos[pending]
+            free = self._slot_rows[slots] == -1
+            candidates = pending[free]
+            taken, first = np.unique(slots[free], return_index=True)
+            winners = candidates[first]
+            self._slot_rows[taken] = rows[winners]
+            self._slot_hashes[taken] = hashes[winners]
+            placed = np.zeros(len(rows), dtype=bool)
+            placed[winners] = True
+            pending = pending[~placed[pending]]
+            pos[pending] = (pos[pending] + 1) & mask
+        self._num_used += len(rows)
+
+    def _probe(self, key: str, h: int, key_at: Callable[[int], str]) -> int:
+        mask = len(self._slot_rows) - 1
+        slot = h & mask
+        key = key[: self.key_length]
+        while True:
+            row = self._slot_rows.item(slot)
+            if row == -1 or (int(self._slot_hashes[slot]) == h and key_at(row) == key):
+                return slot
+            slot = (slot + 1) & mask
+
+    def find(self, key: str, key_at: Callable[[int], str]) -> Optional[int]:
+        """Find the last header row written for an id
+
+        :param key: the id
+        :param key_at: a function reading the id stored in a header row
+        :return: the row, None if the id was never written. The row may be deleted, which only the header tells.
+        """
+        row = self._slot_rows.item(
+            self._probe(key, key_hash(key, self.key_length), key_at)
+        )
+        return None if row == -1 else row
+
+    def insert(self, key: str, row: int, key_at: Callable[[int], str]) -> Optional[int]:
+        """Point an id to a header row, replacing the row it pointed to, if any
+
+        :param key: the id
+        :param row: the header row
+        :param key_at: a function reading the id stored in a header row
+        :return: the row the id pointed to, None if it was never written
+        """
+        if (self._num_used + 1) > _MAX_LOAD_FACTOR * len(self._slot_rows):
+            self._grow()
+        h = key_hash(key, self.key_length)
+        slot = self._probe(key, h, key_at)
+        old_row = self._slot_rows.item(slot)
+        if old_row == -1:
+            self._num_used += 1
+        self._slot_rows[slot] = row
+        self._slot_hashes[slot] = h
+        return None if old_row == -1 else old_row
+
+    def _grow(self) -> None:
+        used = np.flatnonzero(self._slot_rows != -1)
+        num_slots = _num_slots_for(len(used) * 2)
+        rows, hashes = self._slot_rows[used], self._slot_hashes[used]
+        self._slot_rows = np.full(num_slots, -1, dtype=np.int64)
+        self._slot_hashes = np.zeros(num_slots, dtype=np.uint64)
+        self._num_used = 0
+        self._insert_many(hashes, rows)
+
+    def append_live(self, row: int) -> None:
+        """Mark a row appended to the header as live, it must be after all the live rows
+
+        :param row: the header row
+        """
+        if self.num_live == len(self._live):
+            live = np.empty(max(2 * len(self._live), 1024), dtype=np.int64)
+            live[: self.num_live] = self.live
+            self._live = live
+        elif not self._live.flags.writeable:
+            self._live = np.array(self._live)
+        self._live[self.num_live] = row
+        self.num_live += 1
+
+    def remove_live(self, row: int) -> None:
+        """Mark a row as deleted
+
+        :param row: the header row
+        """
+        pos = int(np.searchsorted(self.live, row))
+        if pos < self.num_live and self._live[pos] == row:
+            if not self._live.flags.writeable:
+                self._live = np.array(self._live)
+            self._live[pos : self.num_live - 1] = self._live[pos + 1 : self.num_live]
+            self.num_live -= 1
+
+    def save(self, path: str) -> None:
+        """Atomically write the index to a file
+
+        :param path: the file path
+        """
+        if __windows__:
+            # a memory-mapped file can not be replaced on Windows
+            self._live = np.array(self._live)
+            self._slot_rows = np.array(self._slot_rows)
+            self._slot_hashes = np.array(self._slot_hashes)
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(_INDEX_MAGIC)
+            f.write(
+                np.array(
+                    [
+                        self.key_length,
+                        self.num_rows,
+                        self.num_live,
+                        len(self._slot_rows),
+                        self._num_used,
+                    ],
+                    dtype=np.int64,
+                ).tobytes()
+            )
+            f.write(self.live.tobytes())
+            f.write(self._slot_rows.tobytes())
+            f.write(self._slot_hashes.tobytes())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, key_length: int) -> Optional['HeaderIndex']:
+        """Memory-map an index written by :meth:`save`
+
+        :param path: the file path
+        :param key_length: the max length of the ids stored in the header
+        :return: the index, None if the file is missing or does not match ``key_length``
+        """
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            preamble = f.read(_INDEX_PREAMBLE_SIZE)
+        if len(preamble) != _INDEX_PREAMBLE_SIZE or not preamble.startswith(
+            _INDEX_MAGIC
+        ):
+            return None
+        _key_length, num_rows, num_live, num_slots, num_used = np.frombuffer(
+            preamble[len(_INDEX_MAGIC) :], dtype=np.int64
+        ).tolist()
+        expected_size = _INDEX_PREAMBLE_SIZE + 8 * (num_live + 2 * num_slots)
+        if _key_length != key_length or os.path.getsize(path) != expected_size:
+            return None
+
+        index = cls.__new__(cls)
+        index.key_length = key_length
+        index.num_rows = num_rows
+        index.num_live = num_live
+        offset = _INDEX_PREAMBLE_SIZE
+        # copy-on-write, changes are only persisted by `save`
+        index._live = _memmap(path, np.int64, offset, num_live)
+        offset += 8 * num_live
+        index._slot_rows = _memmap(path, np.int64, offset, num_slots)
+        offset += 8 * num_slots
+        index._slot_hashes = _memmap(path, np.uint64, offset, num_slots)
+        index._num_used = num_used
+        return index
+
+
+def _memmap(path: str, dtype, offset: int, size: int) -> np.ndarray:
+    if not size:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='c', offset=offset, shape=(size,))
+
+
+def _num_slots_for(num_keys: int) -> int:
+    num_slots = 1024
+    while num_keys > _MAX_LOAD_FACTOR * num_slots:
+        num_slots *= 2
+    return num_slots
@@ -118,6 +118,10 @@ class NdArray(BaseProtoView):
             for d, j in zip(docs, range(emb_shape0)):
                 row = getattr(value.getrow(j), f'to{sp_format}')()
                 setattr(d, field, row)
+        elif hasattr(value, 'getformat') and value.getformat() == 'csr':
+            # the rows are cut straight from the CSR arrays, slicing the matrix row by row is slow
+            for d, proto in zip(docs, _csr_to_row_protos(value)):
+                setattr(d, field, proto)
         elif isinstance(value, (list, tuple)):
             for d, j in zip(docs, value):
                 setattr(d, field, j)
@@ -288,6 +292,22 @@ class NdArray(BaseProtoView):
         return idx, val, shape
 
 
+def _csr_to_row_protos(value: 'scipy.sparse.csr_matrix') -> Iterator[NdArrayProto]:
+    # the same protos as setting each row, i.e. ``value[j]``, as a COO matrix of shape ``[1, D]``
+    indptr = value.indptr
+    indices = value.indices.astype(np.int32, copy=False)
+    for j in range(value.shape[0]):
+        cols = indices[indptr[j] : indptr[j + 1]]
+        proto = NdArrayProto(cls_name='scipy')
+        proto.parameters['sparse_format'] = 'csr'
+        _set_dense_array(
+            np.stack([np.zeros_like(cols), cols], axis=1), proto.sparse.indices
+        )
+        _set_dense_array(value.data[indptr[j] : indptr[j + 1]], proto.sparse.values)
+        proto.sparse.shape.extend([1, value.shape[1]])
+        yield proto
+
+
 def _get_dense_array(source):
     if source.buffer:
         x = np.frombuffer(source.buffer, dtype=source.dtype)
@@ -17,8 +17,10 @@ if TYPE_CHECKING:
 def Client(
     *,
     asyncio: Optional[bool] = False,
+    connections: Optional[int] = 1,
     host: Optional[str] = '0.0.0.0',
     https: Optional[bool] = False,
+    keep_order: Optional[bool] = False,
     port: Optional[int] = None,
     protocol: Optional[str] = 'GRPC',
     proxy: Optional[bool] = False,
@@ -35,8 +37,10 @@ def Client(
     """Create a Client. Client is how user interact with Flow
 
     :param asyncio: If set, then the input and output of this Client work in an asynchronous manner.
+    :param connections: The number of gRPC connections to the Gateway. The requests are spread over them, which helps to saturate a Gateway on many cores. Only used with the GRPC protocol.
     :param host: The host address of the runtime, by default it is 0.0.0.0.
     :param https: If set, connect to gateway using https
+    :param keep_order: If set and `--connections` is more than 1, the responses are returned in the order of the requests.
     :param port: The port of the Gateway, which the client should connect to.
     :param protocol: Communication protocol between server and client.
     :param proxy: If set, respect the http_proxy and https_proxy environment variables. otherwise, it will unset these proxy variables before start. gRPC seems to prefer no proxy
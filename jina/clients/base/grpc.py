@@ -1,6 +1,8 @@
 import asyncio
-from contextlib import nullcontext
-from typing import TYPE_CHECKING, Optional
+import inspect
+from collections import deque
+from contextlib import nullcontext, AsyncExitStack
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, List, Optional, Union
 
 import grpc
 
@@ -13,6 +15,7 @@ from jina.peapods.networking import GrpcConnectionPool
 
 if TYPE_CHECKING:
     from jina.clients.base import InputType, CallbackFnType
+    from jina.types.request import Request
 
 
 class GRPCBaseClient(BaseClient):
@@ -32,13 +35,27 @@ class GRPCBaseClient(BaseClient):
         try:
             self.inputs = inputs
             req_iter = self._get_requests(**kwargs)
-            async with GrpcConnectionPool.get_grpc_channel(
-                f'{self.args.host}:{self.args.port}',
-                asyncio=True,
-                https=self.args.https,
-            ) as channel:
-                stub = jina_pb2_grpc.JinaRPCStub(channel)
-                self.logger.debug(f'connected to {self.args.host}:{self.args.port}')
+            async with AsyncExitStack() as stack:
+                options = None
+                if self.args.connections > 1:
+                    # channels to the same address share their connection by default
+                    options = GrpcConnectionPool.get_default_grpc_options() + [
+                        ('grpc.use_local_subchannel_pool', 1)
+                    ]
+                stubs = []
+                for _ in range(max(1, self.args.connections)):
+                    channel = await stack.enter_async_context(
+                        GrpcConnectionPool.get_grpc_channel(
+                            f'{self.args.host}:{self.args.port}',
+                            options=options,
+                            asyncio=True,
+                            https=self.args.https,
+                        )
+                    )
+                    stubs.append(jina_pb2_grpc.JinaRPCStub(channel))
+                self.logger.debug(
+                    f'connected to {self.args.host}:{self.args.port} over {len(stubs)} connection(s)'
+                )
 
                 cm1 = (
                     ProgressBar(total_length=self._inputs_length)
@@ -47,7 +64,7 @@ class GRPCBaseClient(BaseClient):
                 )
 
                 with cm1 as p_bar:
-                    async for resp in stub.Call(req_iter):
+                    async for resp in self._call(stubs, req_iter):
                         callback_exec(
                             response=resp,
                             on_error=on_error,
@@ -87,3 +104,61 @@ class GRPCBaseClient(BaseClient):
                 ) from rpc_ex
             else:
                 raise BadClient(msg) from rpc_ex
+
+    async def _call(
+        self,
+        stubs: List['jina_pb2_grpc.JinaRPCStub'],
+        req_iter: Union[Iterator['Request'], AsyncIterator['Request']],
+    ) -> AsyncIterator['Request']:
+        if len(stubs) == 1:
+            async for resp in stubs[0].Call(req_iter):
+                yield resp
+            return
+
+        # every stream pulls its next request from the shared iterator
+        lock = asyncio.Lock()
+        is_async = inspect.isasyncgen(req_iter)
+        sent_ids = deque()
+        exhausted = False
+
+        async def _requests():
+            nonlocal exhausted
+            while True:
+                async with lock:
+                    if exhausted:
+                        return
+                    try:
+                        req = await req_iter.__anext__() if is_async else next(req_iter)
+                    except (StopIteration, StopAsyncIteration):
+                        exhausted = True
+                        return
+                    if self.args.keep_order:
+                        sent_ids.append(req.header.request_id)
+                yield req
+
+        responses = asyncio.Queue()
+
+        async def _stream(stub):
+            async for resp in stub.Call(_requests()):
+                responses.put_nowait(resp)
+
+        streams = asyncio.gather(*[_stream(stub) for stub in stubs])
+        # also wakes the consumer up as soon as one stream fails
+        streams.add_done_callback(lambda _: responses.put_nowait(None))
+        try:
+            pending = {}
+            while True:
+                resp = await responses.get()
+                if resp is None:
+                    break
+                if not self.args.keep_order:
+                    yield resp
+                    continue
+                pending[resp.header.request_id] = resp
+                while sent_ids and sent_ids[0] in pending:
+                    yield pending.pop(sent_ids.popleft())
+            await streams
+            for resp in pending.values():
+                yield resp
+        finally:
+            streams.cancel()
@@ -6,7 +6,24 @@ from jina.helper import run_async
 if TYPE_CHECKING:
     from jina.clients.base import CallbackFnType, InputType
     from jina.types.request import Response
-    from jina import DocumentArray
+    from jina import DocumentArray, DocumentArrayMemmap
+
+
+#: number of result Documents buffered before being written to ``results_to``
+_RESULTS_TO_BATCH_SIZE = 1024
+
+
+def _write_results(dam: 'DocumentArrayMemmap', docs: List) -> None:
+    new_docs = []
+    for d in docs:
+        if d.id in dam:
+            # the latest result of a Document wins
+            dam[d.id] = d
+        else:
+            new_docs.append(d)
+    # one flush for the whole batch
+    dam.extend(new_docs)
+    docs.clear()
 
 
 class PostMixin:
@@ -25,8 +42,9 @@ class PostMixin:
         show_progress: bool = False,
         continue_on_error: bool = False,
         return_results: bool = False,
+        results_to: Optional[str] = None,
         **kwargs,
-    ) -> Optional[Union['DocumentArray', List['Response']]]:
+    ) -> Optional[Union['DocumentArray', 'DocumentArrayMemmap', List['Response']]]:
         """Post a general data request to the Flow.
 
         :param inputs: input data which can be an Iterable, a function which returns an Iterable, or a single Document id.
@@ -40,8 +58,10 @@ class PostMixin:
         :param show_progress: if set, client will show a progress bar on receiving every request.
         :param continue_on_error: if set, a Request that causes callback error will be logged only without blocking the further requests.
         :param return_results: if set, the Documents resulting from all Requests will be returned as a DocumentArray. This is useful when one wants process Responses in bulk instead of using callback.
+        :param results_to: path of a :class:`DocumentArrayMemmap` to which the Documents of every Response are
+            appended as they arrive, instead of being kept in memory. A Document whose id is already there replaces it.
         :param kwargs: additional parameters
-        :return: None or DocumentArray containing all response Documents
+        :return: None or DocumentArray containing all response Documents, or the DocumentArrayMemmap at ``results_to``
 
         .. warning::
             ``target_executor`` uses ``re.match`` for checking if the pattern is matched.
@@ -53,6 +73,19 @@ class PostMixin:
             c = self.client
             c.show_progress = show_progress
             c.continue_on_error = continue_on_error
+
+            if results_to:
+                from jina import DocumentArrayMemmap
+
+                dam = DocumentArrayMemmap(results_to)
+                pending = []
+                async for resp in c._get_results(*args, **kwargs):
+                    pending.extend(resp.docs)
+                    if len(pending) >= _RESULTS_TO_BATCH_SIZE:
+                        _write_results(dam, pending)
+                _write_results(dam, pending)
+                return dam
+
             async for resp in c._get_results(*args, **kwargs):
                 if return_results:
                     result.append(resp)
@@ -1,5 +1,5 @@
 """Module for Jina Requests."""
-
+from collections import deque
 from typing import (
     Iterator,
     Union,
@@ -42,6 +42,8 @@ def request_generator(
     data_type: DataInputType = DataInputType.AUTO,
     target_executor: Optional[str] = None,
     parameters: Optional[Dict] = None,
+    num_worker: int = 0,
+    backend: str = 'thread',
     **kwargs,  # do not remove this, add on purpose to suppress unknown kwargs
 ) -> Iterator['Request']:
     """Generate a request iterator.
@@ -53,6 +55,10 @@ def request_generator(
             or an iterator over possible Document content (set to text, blob and buffer).
     :param parameters: a dictionary of parameters to be sent to the executor
     :param target_executor: a regex string. Only matching Executors will process the request.
+    :param num_worker: if > 0, build & serialize the requests in a pool of ``num_worker`` workers, while keeping
+        their order. Useful when building the `Documents` is the bottleneck of the client, e.g. on millions of inputs.
+    :param backend: if to use multi-`process` or multi-`thread` as the parallelization backend when ``num_worker`` > 0.
+        With `process`, the inputs must be picklable.
     :param kwargs: additional arguments
     :yield: request
     """
@@ -68,6 +74,19 @@ def request_generator(
         else:
             if not isinstance(data, Iterable):
                 data = [data]
+            if num_worker > 0:
+                yield from _build_requests_in_pool(
+                    data,
+                    request_size,
+                    num_worker,
+                    backend,
+                    _kwargs=kwargs,
+                    data_type=data_type,
+                    endpoint=exec_endpoint,
+                    target=target_executor,
+                    parameters=parameters,
+                )
+                return
             for batch in batch_iterator(data, request_size):
                 yield _new_data_request_from_batch(
                     _kwargs=kwargs,
@@ -81,3 +100,41 @@ def request_generator(
     except Exception as ex:
         # must be handled here, as grpc channel wont handle Python exception
         default_logger.critical(f'inputs is not valid! {ex!r}', exc_info=True)
+
+
+def _build_requests_in_pool(
+    data: Iterable, request_size: int, num_worker: int, backend: str, **kwargs
+) -> Iterator['Request']:
+    if backend == 'thread':
+        from concurrent.futures import ThreadPoolExecutor as PoolExecutor
+    elif backend == 'process':
+        from concurrent.futures import ProcessPoolExecutor as PoolExecutor
+    else:
+        raise ValueError(
+            f'`backend` must be either `process` or `thread`, receiving {backend}'
+        )
+
+    from jina.types.request.data import DataRequest
+
+    # bound the number of requests built ahead of the gRPC stream, so that memory stays flat
+    max_pending = 2 * num_worker
+    pending = deque()
+    pool = PoolExecutor(max_workers=num_worker)
+    try:
+        for batch in batch_iterator(data, request_size):
+            if len(pending) >= max_pending:
+                yield DataRequest(pending.popleft().result())
+            pending.append(
+                pool.submit(_build_serialized_request, batch=batch, **kwargs)
+            )
+        while pending:
+            yield DataRequest(pending.popleft().result())
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=False)
+
+
+def _build_serialized_request(**kwargs) -> bytes:
+    # the request is sent as is, serializing it in the worker saves the client loop from doing it
+    return _new_data_request_from_batch(**kwargs).proto.SerializePartialToString()
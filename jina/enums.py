@@ -200,6 +200,10 @@ class CompressAlgo(BetterEnum):
 
     .. note::
         LZ4 requires additional package, to install it use pip install "jina[lz4]"
+        ZSTD requires additional package, to install it use pip install "jina[zstandard]"
+
+    ``AUTO`` picks the algorithm per connection, from the sizes and compression ratios of the recent messages and the
+    throughput of the link, see :class:`jina.peapods.networking.AdaptiveCompressor`.
 
     .. seealso::
 
@@ -212,6 +216,8 @@ class CompressAlgo(BetterEnum):
     GZIP = 3
     BZ2 = 4
     LZMA = 5
+    ZSTD = 6
+    AUTO = 7
 
 
 class OnErrorStrategy(BetterEnum):
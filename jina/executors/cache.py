@@ -0,0 +1,294 @@
+"""Result cache of the endpoints decorated by ``@requests(cache=...)``"""
+import functools
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Callable, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+
+from jina.helper import iscoroutinefunction
+
+if TYPE_CHECKING:
+    from jina import DocumentArray, Document
+    from jina.executors import BaseExecutor
+
+#: the Document fields an endpoint is assumed to read, if not told otherwise
+DEFAULT_CACHE_FIELDS = ('text', 'blob', 'buffer', 'uri', 'mime_type')
+
+
+class _MemoryStore:
+    """In-memory store which evicts the least recently used entry once full
+
+    :param max_size: max number of entries
+    """
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class _DiskStore:
+    """SQLite-backed store which evicts the least recently used entry once full, it survives restarts
+
+    :param path: path of the database file
+    :param max_size: max number of entries
+    """
+
+    def __init__(self, path: str, max_size: int):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB, last_used INTEGER)'
+        )
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS cache_last_used ON cache (last_used)'
+        )
+        self._clock = (
+            self._conn.execute('SELECT MAX(last_used) FROM cache').fetchone()[0] or 0
+        )
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT value FROM cache WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._clock += 1
+            self._conn.execute(
+                'UPDATE cache SET last_used = ? WHERE key = ?', (self._clock, key)
+            )
+            self._conn.commit()
+            return row[0]
+
+    def put(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._clock += 1
+            self._conn.execute(
+                'INSERT OR REPLACE INTO cache VALUES (?, ?, ?)',
+                (key, value, self._clock),
+            )
+            self._conn.execute(
+                'DELETE FROM cache WHERE key IN '
+                '(SELECT key FROM cache ORDER BY last_used DESC LIMIT -1 OFFSET ?)',
+                (self._max_size,),
+            )
+            self._conn.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM cache').fetchone()[0]
+
+
+class RequestCache:
+    """Cache of the per-Document outputs of one endpoint of one Executor.
+
+    A Document is keyed by the hash of the fields the endpoint reads, along with the request parameters. The whole
+    output Document (e.g. its embedding & matches) is stored, so that a hit is filled in without calling the endpoint.
+
+    :param max_size: max number of cached Documents, the least recently used one is evicted first
+    :param fields: the Document fields the endpoint reads, only they are hashed
+    :param path: if given, persist the cache to this SQLite file, otherwise keep it in memory
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        fields: Tuple[str, ...] = DEFAULT_CACHE_FIELDS,
+        path: Optional[str] = None,
+    ):
+        self._fields = set(fields)
+        self._store = _DiskStore(path, max_size) if path else _MemoryStore(max_size)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._store)
+
+    def _key(self, doc: 'Document', params_hash: bytes) -> str:
+        from google.protobuf.field_mask_pb2 import FieldMask
+
+        masked = doc._PbMsg()
+        # merging an absent member of a oneof would clear the present one
+        present_fields = {f.name for f, _ in doc.proto.ListFields()}
+        FieldMask(paths=self._fields.intersection(present_fields)).MergeMessage(
+            doc.proto, masked
+        )
+        h = blake2b(params_hash, digest_size=16)
+        h.update(masked.SerializeToString(deterministic=True))
+        return h.hexdigest()
+
+    def lookup(
+        self, docs: 'DocumentArray', parameters: Optional[Dict]
+    ) -> Tuple[List[str], Dict[int, 'Document'], List[int]]:
+        """Look up the cached outputs of ``docs``
+
+        :param docs: the input Documents
+        :param parameters: the request parameters, part of the key
+        :return: the key of each Document, the cached outputs by position and the positions of the misses
+        """
+        from jina import Document
+
+        params_hash = blake2b(
+            json.dumps(parameters or {}, sort_keys=True, default=str).encode(),
+            digest_size=16,
+        ).digest()
+        keys = [self._key(d, params_hash) for d in docs]
+        hits = {}
+        miss_idx = []
+        for i, key in enumerate(keys):
+            value = self._store.get(key)
+            if value is None:
+                miss_idx.append(i)
+            else:
+                hits[i] = Document(value)
+        self.hits += len(hits)
+        self.misses += len(miss_idx)
+        return keys, hits, miss_idx
+
+    def fill(
+        self,
+        docs: 'DocumentArray',
+        keys: List[str],
+        hits: Dict[int, 'Document'],
+        miss_idx: List[int],
+        r_docs: Optional[Union['DocumentArray', Dict]],
+        miss_docs: 'DocumentArray',
+    ) -> Optional[Union['DocumentArray', Dict]]:
+        """Store the outputs of the misses and merge them with the hits, in the order of ``docs``
+
+        :param docs: the input Documents
+        :param keys: the key of each input Document
+        :param hits: the cached outputs by position
+        :param miss_idx: the positions of the misses
+        :param r_docs: what the endpoint returned on the misses
+        :param miss_docs: the misses sent to the endpoint
+        :return: what the endpoint would have returned on ``docs``
+        """
+        from jina import DocumentArray
+
+        if r_docs is None:
+            outputs = miss_docs
+        elif isinstance(r_docs, DocumentArray) and len(r_docs) == len(miss_idx):
+            outputs = r_docs
+        else:
+            # not a per-Document output, there is nothing to cache
+            return r_docs
+
+        for i, d in zip(miss_idx, outputs):
+            self._store.put(keys[i], d.proto.SerializePartialToString())
+        for i, d in hits.items():
+            # the output belongs to the input it is served to
+            d.id = docs[i].id
+
+        if r_docs is None:
+            for i, d in hits.items():
+                docs[i] = d
+            return None
+
+        outputs = iter(outputs)
+        return DocumentArray(
+            hits[i] if i in hits else next(outputs) for i in range(len(docs))
+        )
+
+
+def _get_cache(executor: 'BaseExecutor', name: str, config: Dict) -> RequestCache:
+    caches = executor.__dict__.setdefault('_request_caches', {})
+    if name not in caches:
+        config = dict(config)
+        if config.pop('on_disk', False):
+            if not executor.workspace:
+                raise ValueError(
+                    f'`{name}` caches its results on disk, but {executor!r} has no workspace'
+                )
+            os.makedirs(executor.workspace, exist_ok=True)
+            config['path'] = os.path.join(executor.workspace, f'{name}.cache.db')
+        caches[name] = RequestCache(**config)
+    return caches[name]
+
+
+def get_cache_config(cache: Union[bool, int, Dict]) -> Optional[Dict]:
+    """Normalize the ``cache`` argument of ``@requests``
+
+    :param cache: ``True`` for the default cache, an int for its max size, or a dict of :class:`RequestCache`
+        arguments, plus ``on_disk=True`` to persist it in the workspace of the Executor
+    :return: the :class:`RequestCache` arguments, None if caching is disabled
+    """
+    if cache is None or cache is False:
+        return None
+    if cache is True:
+        return {}
+    if isinstance(cache, int):
+        return {'max_size': cache}
+    if isinstance(cache, dict):
+        return cache
+    raise TypeError(f'`cache` must be a bool, an int or a dict, getting {cache!r}')
+
+
+def cache_results(fn: Callable, config: Dict) -> Callable:
+    """Wrap an endpoint so that only the Documents missing from its cache are sent to it
+
+    :param fn: the endpoint
+    :param config: the :class:`RequestCache` arguments
+    :return: the wrapped endpoint
+    """
+    from jina import DocumentArray
+
+    def _lookup(self, kwargs):
+        docs = kwargs.get('docs')
+        if not isinstance(docs, DocumentArray) or not docs:
+            return None
+        cache = _get_cache(self, fn.__name__, config)
+        keys, hits, miss_idx = cache.lookup(docs, kwargs.get('parameters'))
+        if not hits:
+            miss_docs = docs
+        else:
+            miss_docs = docs[miss_idx]
+            # matrices are not aligned with the misses anymore
+            kwargs.update(docs=miss_docs, docs_matrix=None, groundtruths_matrix=None)
+        return cache, docs, keys, hits, miss_idx, miss_docs
+
+    if iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def arg_wrapper(self, *args, **kwargs):
+            lookup = _lookup(self, kwargs)
+            if lookup is None:
+                return await fn(self, *args, **kwargs)
+            cache, docs, keys, hits, miss_idx, miss_docs = lookup
+            r_docs = await fn(self, *args, **kwargs) if miss_idx else None
+            return cache.fill(docs, keys, hits, miss_idx, r_docs, miss_docs)
+
+    else:
+
+        @functools.wraps(fn)
+        def arg_wrapper(self, *args, **kwargs):
+            lookup = _lookup(self, kwargs)
+            if lookup is None:
+                return fn(self, *args, **kwargs)
+            cache, docs, keys, hits, miss_idx, miss_docs = lookup
+            r_docs = fn(self, *args, **kwargs) if miss_idx else None
+            return cache.fill(docs, keys, hits, miss_idx, r_docs, miss_docs)
+
+    return arg_wrapper
@@ -76,6 +76,7 @@ def requests(
     ] = None,
     *,
     on: Optional[Union[str, Sequence[str]]] = None,
+    cache: Optional[Union[bool, int, Dict]] = None,
 ):
     """
     `@requests` defines when a function will be invoked. It has a keyword `on=` to define the endpoint.
@@ -85,9 +86,17 @@ def requests(
 
     :param func: the method to decorate
     :param on: the endpoint string, by convention starts with `/`
+    :param cache: cache the output of each Document, so that only the Documents not seen before are sent to the
+        function. ``True`` uses an in-memory LRU cache of 1024 Documents, an int sets its size. A dict gives the
+        arguments of :class:`jina.executors.cache.RequestCache` (e.g. ``fields`` the function reads), plus
+        ``on_disk=True`` to persist the cache in the workspace. The function must return `None` or one Document
+        per input Document, in the same order.
     :return: decorated function
     """
     from jina import __default_endpoint__, __args_executor_func__
+    from jina.executors.cache import get_cache_config, cache_results
+
+    cache_config = get_cache_config(cache)
 
     class FunctionMapper:
         def __init__(self, fn):
@@ -101,6 +110,9 @@ def requests(
                     f'please add `**kwargs` to the function signature.'
                 )
 
+            if cache_config is not None:
+                fn = cache_results(fn, cache_config)
+
             if iscoroutinefunction(fn):
 
                 @functools.wraps(fn)
@@ -85,8 +85,10 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         self,
         *,
         asyncio: Optional[bool] = False,
+        connections: Optional[int] = 1,
         host: Optional[str] = '0.0.0.0',
         https: Optional[bool] = False,
+        keep_order: Optional[bool] = False,
         port: Optional[int] = None,
         protocol: Optional[str] = 'GRPC',
         proxy: Optional[bool] = False,
@@ -96,8 +98,10 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         """Create a Flow. Flow is how Jina streamlines and scales Executors. This overloaded method provides arguments from `jina client` CLI.
 
         :param asyncio: If set, then the input and output of this Client work in an asynchronous manner.
+        :param connections: The number of gRPC connections to the Gateway. The requests are spread over them, which helps to saturate a Gateway on many cores. Only used with the GRPC protocol.
         :param host: The host address of the runtime, by default it is 0.0.0.0.
         :param https: If set, connect to gateway using https
+        :param keep_order: If set and `--connections` is more than 1, the responses are returned in the order of the requests.
         :param port: The port of the Gateway, which the client should connect to.
         :param protocol: Communication protocol between server and client.
         :param proxy: If set, respect the http_proxy and https_proxy environment variables. otherwise, it will unset these proxy variables before start. gRPC seems to prefer no proxy
@@ -115,6 +119,7 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
     def __init__(
         self,
         *,
+        coalesce_requests: Optional[bool] = False,
         compress: Optional[str] = 'NONE',
         compress_min_bytes: Optional[int] = 1024,
         compress_min_ratio: Optional[float] = 1.1,
@@ -127,6 +132,9 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         expose_endpoints: Optional[str] = None,
         expose_public: Optional[bool] = False,
         graph_description: Optional[str] = '{}',
+        hedge_budget: Optional[float] = 0.1,
+        hedge_endpoints: Optional[List[str]] = None,
+        hedge_percentile: Optional[float] = 95.0,
         host: Optional[str] = '0.0.0.0',
         host_in: Optional[str] = '0.0.0.0',
         log_config: Optional[str] = None,
@@ -139,6 +147,8 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         port_expose: Optional[int] = None,
         port_in: Optional[int] = None,
         prefetch: Optional[int] = 0,
+        prefetch_adaptive: Optional[bool] = False,
+        prefetch_global: Optional[int] = 0,
         protocol: Optional[str] = 'GRPC',
         proxy: Optional[bool] = False,
         py_modules: Optional[List[str]] = None,
@@ -163,10 +173,13 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
     ):
         """Create a Flow. Flow is how Jina streamlines and scales Executors. This overloaded method provides arguments from `jina gateway` CLI.
 
+        :param coalesce_requests: If set, identical requests (same endpoint, target, parameters and Document contents) arriving while one of them is in the Flow are not sent again, they get a copy of its response.
         :param compress: The compress algorithm used over the entire Flow.
 
               Note that this is not necessarily effective,
-              it depends on the settings of `--compress-min-bytes` and `compress-min-ratio`
+              it depends on the settings of `--compress-min-bytes` and `compress-min-ratio`.
+              `AUTO` chooses the algorithm for each connection from the measured compression ratio & speed and throughput of the
+              link. Connections to a local address are never compressed
         :param compress_min_bytes: The original message size must be larger than this number to trigger the compress algorithm, -1 means disable compression.
         :param compress_min_ratio: The compression ratio (uncompressed_size/compressed_size) must be higher than this number to trigger the compress algorithm.
         :param connection_list: dictionary JSON with a list of connections to configure
@@ -178,6 +191,9 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         :param expose_endpoints: A JSON string that represents a map from executor endpoints (`@requests(on=...)`) to HTTP endpoints.
         :param expose_public: If set, expose the public IP address to remote when necessary, by default it exposesprivate IP address, which only allows accessing under the same network/subnet. Important to set this to true when the Pea will receive input connections from remote Peas
         :param graph_description: Routing graph for the gateway
+        :param hedge_budget: The fraction of the requests to `--hedge-endpoints` endpoints that can be sent to another replica, so that hedging does not amplify the load of overloaded replicas.
+        :param hedge_endpoints: The idempotent endpoints, e.g. `/search`, whose requests are hedged across the replicas of the Pod: when a replica does not answer within `--hedge-percentile` of the recent latencies, the request is also sent to another replica, and the first response is used.
+        :param hedge_percentile: The percentile of the recent latencies of the replicas after which a request to a `--hedge-endpoints` endpoint is also sent to another replica.
         :param host: The host address of the runtime, by default it is 0.0.0.0.
         :param host_in: The host address for binding to, by default it is 0.0.0.0
         :param log_config: The YAML config of the logger used in this object.
@@ -209,6 +225,11 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         :param prefetch: Number of requests fetched from the client before feeding into the first Executor.
 
               Used to control the speed of data input into a Flow. 0 disables prefetch (disabled by default)
+        :param prefetch_adaptive: If set, the number of in-flight requests per client stream is adjusted from the observed latency of
+              the Flow: it grows while the latency stays low and halves when the latency rises (AIMD).
+
+              `--prefetch` is then the max number of in-flight requests per client stream, 0 means no max.
+        :param prefetch_global: Number of in-flight requests allowed across all client streams of the gateway. 0 disables the global limit (disabled by default)
         :param protocol: Communication protocol between server and client.
         :param proxy: If set, respect the http_proxy and https_proxy environment variables. otherwise, it will unset these proxy variables before start. gRPC seems to prefer no proxy
         :param py_modules: The customized python modules need to be imported before loading the executor
@@ -258,6 +279,9 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         self,
         *,
         env: Optional[dict] = None,
+        hedge_budget: Optional[float] = 0.1,
+        hedge_endpoints: Optional[List[str]] = None,
+        hedge_percentile: Optional[float] = 95.0,
         inspect: Optional[str] = 'COLLECT',
         log_config: Optional[str] = None,
         name: Optional[str] = None,
@@ -272,6 +296,9 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         """Create a Flow. Flow is how Jina streamlines and scales Executors. This overloaded method provides arguments from `jina flow` CLI.
 
         :param env: The map of environment variables that are available inside runtime
+        :param hedge_budget: The fraction of the requests to `--hedge-endpoints` endpoints that can be sent to another replica, so that hedging does not amplify the load of overloaded replicas.
+        :param hedge_endpoints: The idempotent endpoints, e.g. `/search`, whose requests are hedged across the replicas of the Pod: when a replica does not answer within `--hedge-percentile` of the recent latencies, the request is also sent to another replica, and the first response is used.
+        :param hedge_percentile: The percentile of the recent latencies of the replicas after which a request to a `--hedge-endpoints` endpoint is also sent to another replica.
         :param inspect: The strategy on those inspect pods in the flow.
 
               If `REMOVE` is given then all inspect pods are removed when building the flow.
@@ -555,6 +582,9 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         external: Optional[bool] = False,
         force_update: Optional[bool] = False,
         gpus: Optional[str] = None,
+        hedge_budget: Optional[float] = 0.1,
+        hedge_endpoints: Optional[List[str]] = None,
+        hedge_percentile: Optional[float] = 95.0,
         host: Optional[str] = '0.0.0.0',
         host_in: Optional[str] = '0.0.0.0',
         install_requirements: Optional[bool] = False,
@@ -610,6 +640,9 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
               - To access specified gpus based on device id, use `--gpus device=[YOUR-GPU-DEVICE-ID]`
               - To access specified gpus based on multiple device id, use `--gpus device=[YOUR-GPU-DEVICE-ID1],device=[YOUR-GPU-DEVICE-ID2]`
               - To specify more parameters, use `--gpus device=[YOUR-GPU-DEVICE-ID],runtime=nvidia,capabilities=display
+        :param hedge_budget: The fraction of the requests to `--hedge-endpoints` endpoints that can be sent to another replica, so that hedging does not amplify the load of overloaded replicas.
+        :param hedge_endpoints: The idempotent endpoints, e.g. `/search`, whose requests are hedged across the replicas of the Pod: when a replica does not answer within `--hedge-percentile` of the recent latencies, the request is also sent to another replica, and the first response is used.
+        :param hedge_percentile: The percentile of the recent latencies of the replicas after which a request to a `--hedge-endpoints` endpoint is also sent to another replica.
         :param host: The host address of the runtime, by default it is 0.0.0.0.
         :param host_in: The host address for binding to, by default it is 0.0.0.0
         :param install_requirements: If set, install `requirements.txt` in the Hub Executor bundle to local
@@ -37,3 +37,18 @@ def mixin_client_features_parser(parser):
         default=False,
         help="If set, return results as DocArray instead of Request.",
     )
+
+    parser.add_argument(
+        '--connections',
+        type=int,
+        default=1,
+        help='The number of gRPC connections to the Gateway. The requests are spread over them, '
+        'which helps to saturate a Gateway on many cores. Only used with the GRPC protocol.',
+    )
+
+    parser.add_argument(
+        '--keep-order',
+        action='store_true',
+        default=False,
+        help='If set and `--connections` is more than 1, the responses are returned in the order of the requests.',
+    )
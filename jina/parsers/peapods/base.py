@@ -133,3 +133,29 @@ When not given, then the default naming strategy will apply.
     
     ''',
     )
+
+    gp.add_argument(
+        '--hedge-endpoints',
+        type=str,
+        nargs='*',
+        default=[],
+        help='The idempotent endpoints, e.g. `/search`, whose requests are hedged across the replicas of the Pod: '
+        'when a replica does not answer within `--hedge-percentile` of the recent latencies, the request is also sent '
+        'to another replica, and the first response is used.',
+    )
+
+    gp.add_argument(
+        '--hedge-percentile',
+        type=float,
+        default=95.0,
+        help='The percentile of the recent latencies of the replicas after which a request to a `--hedge-endpoints` '
+        'endpoint is also sent to another replica.',
+    )
+
+    gp.add_argument(
+        '--hedge-budget',
+        type=float,
+        default=0.1,
+        help='The fraction of the requests to `--hedge-endpoints` endpoints that can be sent to another replica, '
+        'so that hedging does not amplify the load of overloaded replicas.',
+    )
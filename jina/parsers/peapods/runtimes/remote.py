@@ -58,6 +58,14 @@ def mixin_gateway_parser(parser):
         help='The port that the gateway exposes for clients for GRPC connections.',
     )
 
+    gp.add_argument(
+        '--coalesce-requests',
+        action='store_true',
+        default=False,
+        help='If set, identical requests (same endpoint, target, parameters and Document contents) arriving '
+        'while one of them is in the Flow are not sent again, they get a copy of its response.',
+    )
+
     parser.add_argument(
         '--graph-description',
         type=str,
@@ -185,6 +193,25 @@ def mixin_prefetch_parser(parser=None):
     Used to control the speed of data input into a Flow. 0 disables prefetch (disabled by default)''',
     )
 
+    gp.add_argument(
+        '--prefetch-adaptive',
+        action='store_true',
+        default=False,
+        help='''
+    If set, the number of in-flight requests per client stream is adjusted from the observed latency of
+    the Flow: it grows while the latency stays low and halves when the latency rises (AIMD).
+
+    `--prefetch` is then the max number of in-flight requests per client stream, 0 means no max.''',
+    )
+
+    gp.add_argument(
+        '--prefetch-global',
+        type=int,
+        default=0,
+        help='''
+    Number of in-flight requests allowed across all client streams of the gateway. 0 disables the global limit (disabled by default)''',
+    )
+
 
 def mixin_compressor_parser(parser=None):
     """Add the options for compressors
@@ -201,7 +228,9 @@ def mixin_compressor_parser(parser=None):
     The compress algorithm used over the entire Flow.
 
     Note that this is not necessarily effective,
-    it depends on the settings of `--compress-min-bytes` and `compress-min-ratio`''',
+    it depends on the settings of `--compress-min-bytes` and `compress-min-ratio`.
+    `AUTO` chooses the algorithm for each connection from the measured compression ratio & speed and throughput of the
+    link. Connections to a local address are never compressed''',
     )
 
     gp.add_argument(
@@ -1,14 +1,18 @@
 import asyncio
 import ipaddress
-from threading import Thread
-from typing import Optional, List, Dict, TYPE_CHECKING, Tuple
+import os
+import time
+import weakref
+from collections import deque
+from threading import Thread, Lock
+from typing import Optional, List, Dict, TYPE_CHECKING, Tuple, Callable, Hashable
 
 import grpc
 from grpc.aio import AioRpcError
 
 from jina.logging.logger import JinaLogger
 from jina.proto import jina_pb2_grpc
-from jina.enums import PollingType
+from jina.enums import PollingType, CompressAlgo
 from jina.helper import get_or_reuse_loop
 from jina.types.request import Request
 from jina.types.request.control import ControlRequest
@@ -18,12 +22,300 @@ if TYPE_CHECKING:
     import kubernetes
 
 
+#: a cached channel not used for this many seconds is closed
+CHANNEL_IDLE_TIMEOUT = 60.0
+
+
+class _ChannelCache:
+    """
+    A process-wide cache of grpc channels for the one-off requests of :meth:`GrpcConnectionPool.send_request_sync` &
+    :meth:`GrpcConnectionPool.send_request_async`, so that polling a Pea or activating workers reuses the same
+    HTTP/2 connection to a target instead of opening a new one for every request.
+
+    Channels are keyed by their target & security settings, and are evicted when unused for
+    :data:`CHANNEL_IDLE_TIMEOUT` or when a request on them finds the target unavailable. A cache inherited by a forked
+    process is dropped, as grpc channels can not be used across a fork.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._channels = {}
+        self._pid = os.getpid()
+
+    def get(
+        self,
+        key: Hashable,
+        create: Callable[[], grpc.Channel],
+        is_healthy: Optional[Callable[[grpc.Channel], bool]] = None,
+    ) -> Tuple[grpc.Channel, List[Tuple[Hashable, grpc.Channel]]]:
+        """
+        Get the channel of a key, creating it if needed
+
+        :param key: the key of the channel
+        :param create: creates the channel if the key has none
+        :param is_healthy: if given, a cached channel it returns False for is replaced
+        :returns: the channel, and the keys & channels to close: the idle channels and the replaced one
+        """
+        now = time.monotonic()
+        to_close = []
+        with self._lock:
+            if self._pid != os.getpid():
+                self._channels.clear()
+                self._pid = os.getpid()
+            for k, (channel, last_used) in list(self._channels.items()):
+                if k != key and now - last_used > CHANNEL_IDLE_TIMEOUT:
+                    to_close.append((k, self._channels.pop(k)[0]))
+            channel = self._channels.get(key, (None,))[0]
+            if channel is not None and is_healthy and not is_healthy(channel):
+                to_close.append((key, channel))
+                channel = None
+            if channel is None:
+                channel = create()
+            self._channels[key] = (channel, now)
+        return channel, to_close
+
+    def evict(self, key: Hashable, channel: grpc.Channel) -> bool:
+        """
+        Remove a channel from the cache, unless it was already replaced
+
+        :param key: the key of the channel
+        :param channel: the channel to remove
+        :returns: True if the channel was removed, the caller should close it then
+        """
+        with self._lock:
+            if self._channels.get(key, (None,))[0] is channel:
+                del self._channels[key]
+                return True
+        return False
+
+    def pop_all(self) -> List[Tuple[Hashable, grpc.Channel]]:
+        """
+        Remove all channels from the cache
+
+        :returns: the keys & channels removed, the caller should close them
+        """
+        with self._lock:
+            channels = [(k, channel) for k, (channel, _) in self._channels.items()]
+            self._channels.clear()
+        return channels
+
+
+_sync_channels = _ChannelCache()
+_async_channels = _ChannelCache()
+
+
+class AdaptiveCompressor:
+    """
+    Compresses the :class:`DataRequest` sent over a connection, choosing the algorithm for this hop.
+
+    With :attr:`CompressAlgo.AUTO`, the available fast algorithms, LZ4 & Zstd, each with & without the byte-shuffle of
+    float buffers, are measured every :attr:`PROBE_INTERVAL` requests on the request to send: its compression ratio and
+    the compression speed. Each request is then compressed with the algorithm that minimizes the estimated time to
+    compress & send it, given the throughput of the link, or is sent as is if none is faster. The throughput of the
+    link is estimated from the best recent throughput of the calls, as these also include the processing of the
+    request by the receiver.
+
+    With another algorithm, every request is compressed with it. Either way, requests smaller than
+    ``compress_min_bytes`` or compressing less than ``compress_min_ratio`` are sent as is, and requests to a local
+    address are never compressed.
+
+    The receiving :class:`DataRequest` finds the algorithm in the compressed request, and decompresses it on first
+    access, see :mod:`jina.types.request.compression`.
+
+    :param address: the address of the connection
+    :param compress: the compression algorithm, or :attr:`CompressAlgo.AUTO`
+    :param compress_min_bytes: the minimum size of the requests to compress, -1 means disable compression
+    :param compress_min_ratio: the minimum compression ratio (uncompressed_size/compressed_size) to send a request
+        compressed
+    """
+
+    #: the candidate algorithms are measured again every this many requests
+    PROBE_INTERVAL = 64
+    #: the candidate algorithms are measured on at most this many bytes of a request
+    PROBE_BYTES = 1 << 20
+    #: the link throughput, in bytes per second, assumed until calls are measured
+    DEFAULT_THROUGHPUT = 125e6
+
+    _EWMA_WEIGHT = 0.3
+    _THROUGHPUT_DECAY = 0.95
+
+    def __init__(
+        self,
+        address: str,
+        compress: CompressAlgo = CompressAlgo.NONE,
+        compress_min_bytes: int = 1024,
+        compress_min_ratio: float = 1.1,
+    ):
+        from jina.types.request.compression import is_available
+
+        self._min_bytes = compress_min_bytes
+        self._min_ratio = compress_min_ratio
+        self._adaptive = compress == CompressAlgo.AUTO
+        if self._adaptive:
+            self._candidates = [
+                (algo, shuffle)
+                for algo in (CompressAlgo.LZ4, CompressAlgo.ZSTD)
+                if is_available(algo)
+                for shuffle in (False, True)
+            ]
+        elif compress != CompressAlgo.NONE and is_available(compress):
+            self._candidates = [(compress, False)]
+        else:
+            self._candidates = []
+        self.enabled = (
+            bool(self._candidates)
+            and compress_min_bytes >= 0
+            and not _is_local_address(address)
+        )
+        self._ratios = {}
+        self._speeds = {}
+        self._throughput = self.DEFAULT_THROUGHPUT
+        self._num_requests = 0
+
+    def compress(self, request: DataRequest) -> DataRequest:
+        """
+        Get the request to send for a request
+
+        :param request: the request
+        :return: the request itself, or a serialized & possibly compressed copy of it
+        """
+        from jina.types.request.compression import compress
+
+        if not self.enabled or not request.is_decompressed:
+            # a request that was not deserialized is forwarded as it was received
+            return request
+        buffer = request.proto.SerializePartialToString()
+        if len(buffer) < self._min_bytes:
+            return DataRequest(buffer)
+
+        if self._adaptive and self._num_requests % self.PROBE_INTERVAL == 0:
+            self._probe(buffer)
+        self._num_requests += 1
+        choice = self._choose(len(buffer))
+        if choice is None:
+            return DataRequest(buffer)
+        compressed = compress(buffer, *choice)
+        if len(buffer) / len(compressed) < self._min_ratio:
+            return DataRequest(buffer)
+        return DataRequest(compressed)
+
+    def record_call(self, num_bytes: int, seconds: float):
+        """
+        Record the duration of a call, to estimate the throughput of the link
+
+        :param num_bytes: the number of bytes sent
+        :param seconds: the duration of the call
+        """
+        if seconds > 0:
+            self._throughput = max(
+                self._throughput * self._THROUGHPUT_DECAY, num_bytes / seconds
+            )
+
+    def _probe(self, buffer: bytes):
+        from jina.types.request.compression import compress
+
+        sample = buffer[: self.PROBE_BYTES]
+        for candidate in self._candidates:
+            start = time.perf_counter()
+            compressed = compress(sample, *candidate)
+            seconds = max(time.perf_counter() - start, 1e-9)
+            for stats, value in (
+                (self._ratios, len(sample) / len(compressed)),
+                (self._speeds, len(sample) / seconds),
+            ):
+                previous = stats.get(candidate, value)
+                stats[candidate] = previous + self._EWMA_WEIGHT * (value - previous)
+
+    def _choose(self, size: int) -> Optional[Tuple[CompressAlgo, bool]]:
+        if not self._adaptive:
+            return self._candidates[0]
+        best, best_seconds = None, size / self._throughput
+        for candidate, ratio in self._ratios.items():
+            if ratio < self._min_ratio:
+                continue
+            seconds = size / self._speeds[candidate] + size / ratio / self._throughput
+            if seconds < best_seconds:
+                best, best_seconds = candidate, seconds
+        return best
+
+
+class HedgingPolicy:
+    """
+    Decides when a request to the replicas of a Pod is hedged, i.e. also sent to a second replica.
+
+    A request is hedged when it is not answered within the ``percentile`` of the recent latencies of the replicas, so
+    that a single slow replica, e.g. during GC or warm-up, does not set the tail latency of the Flow. Hedging is paid
+    from a token bucket: each request deposits ``budget`` tokens, up to ``burst`` tokens, and each hedged request
+    takes one token, so at most about ``budget`` of the requests are hedged and hedging cannot amplify an overload.
+
+    :param percentile: the percentile of the recent latencies after which a request is hedged
+    :param budget: the fraction of the requests that can be hedged
+    :param burst: the number of requests that can be hedged in a row
+    """
+
+    #: the number of recent latencies kept per list of replicas
+    WINDOW_SIZE = 1000
+    #: requests are hedged only once this many latencies are known
+    MIN_SAMPLES = 20
+
+    def __init__(self, percentile: float = 95.0, budget: float = 0.1, burst: int = 10):
+        self._percentile = percentile
+        self._budget = budget
+        self._burst = burst
+        self._tokens = float(burst)
+        self._latencies = weakref.WeakKeyDictionary()
+
+    def get_delay(self, replicas: 'ReplicaList') -> Optional[float]:
+        """
+        Get the delay after which a request to some replicas is hedged
+
+        :param replicas: the replicas the request is sent to
+        :return: the delay in seconds, None if the request is not hedged
+        """
+        self._tokens = min(self._burst, self._tokens + self._budget)
+        latencies = self._latencies.get(replicas)
+        if (
+            not latencies
+            or len(latencies) < self.MIN_SAMPLES
+            or len(replicas.get_all_connections()) < 2
+        ):
+            return None
+        import numpy as np
+
+        return float(np.percentile(latencies, self._percentile))
+
+    def acquire(self) -> bool:
+        """
+        Take a token from the hedge budget
+
+        :return: True if the request can be hedged
+        """
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def record_latency(self, replicas: 'ReplicaList', seconds: float):
+        """
+        Record the latency of a call to some replicas
+
+        :param replicas: the replicas the request was sent to
+        :param seconds: the latency of the call
+        """
+        if replicas not in self._latencies:
+            self._latencies[replicas] = deque(maxlen=self.WINDOW_SIZE)
+        self._latencies[replicas].append(seconds)
+
+
 class ReplicaList:
     """
     Maintains a list of connections to replicas and uses round robin for selecting a replica
+
+    :param compression: the keyword arguments of the :class:`AdaptiveCompressor` of each connection
     """
 
-    def __init__(self):
+    def __init__(self, compression: Optional[Dict] = None):
+        self._compression = compression or {}
         self._connections = []
         self._address_to_connection_idx = {}
         self._address_to_channel = {}
@@ -44,7 +336,14 @@ class ReplicaList:
             ) = GrpcConnectionPool.create_async_channel_stub(address)
             self._address_to_channel[address] = channel
 
-            self._connections.append((single_data_stub, data_stub, control_stub))
+            self._connections.append(
+                (
+                    single_data_stub,
+                    data_stub,
+                    control_stub,
+                    AdaptiveCompressor(address, **self._compression),
+                )
+            )
 
     async def remove_connection(self, address: str):
         """
@@ -126,11 +425,18 @@ class GrpcConnectionPool:
     Manages a list of grpc connections.
 
     :param logger: the logger to use
+    :param compress: the compression algorithm of the data requests, see :class:`AdaptiveCompressor`
+    :param compress_min_bytes: the minimum size of the data requests to compress, -1 means disable compression
+    :param compress_min_ratio: the minimum compression ratio to send a data request compressed
+    :param hedge_percentile: the percentile of the recent latencies of the replicas after which a hedged request is
+        sent to another replica, see :class:`HedgingPolicy`
+    :param hedge_budget: the fraction of the hedged requests that can be sent to another replica
     """
 
     class _ConnectionPoolMap:
-        def __init__(self, logger: Optional[JinaLogger]):
+        def __init__(self, logger: Optional[JinaLogger], compression: Dict):
             self._logger = logger
+            self._compression = compression
             # this maps pods to shards or heads
             self._pods: Dict[str, Dict[str, Dict[int, ReplicaList]]] = {}
             # dict stores last entity id used for a particular pod, used for round robin
@@ -211,7 +517,7 @@ class GrpcConnectionPool:
         ):
             self._add_pod(pod)
             if entity_id not in self._pods[pod][type]:
-                connection_list = ReplicaList()
+                connection_list = ReplicaList(self._compression)
                 self._pods[pod][type][entity_id] = connection_list
 
             if not self._pods[pod][type][entity_id].has_connection(address):
@@ -243,9 +549,25 @@ class GrpcConnectionPool:
                 return connection
             return None
 
-    def __init__(self, logger: Optional[JinaLogger] = None):
+    def __init__(
+        self,
+        logger: Optional[JinaLogger] = None,
+        compress: CompressAlgo = CompressAlgo.NONE,
+        compress_min_bytes: int = 1024,
+        compress_min_ratio: float = 1.1,
+        hedge_percentile: float = 95.0,
+        hedge_budget: float = 0.1,
+    ):
         self._logger = logger or JinaLogger(self.__class__.__name__)
-        self._connections = self._ConnectionPoolMap(self._logger)
+        self._hedging = HedgingPolicy(hedge_percentile, hedge_budget)
+        self._connections = self._ConnectionPoolMap(
+            self._logger,
+            dict(
+                compress=compress,
+                compress_min_bytes=compress_min_bytes,
+                compress_min_ratio=compress_min_ratio,
+            ),
+        )
 
     def send_request(
         self,
@@ -255,6 +577,7 @@ class GrpcConnectionPool:
         shard_id: Optional[int] = None,
         polling_type: PollingType = PollingType.ANY,
         endpoint: Optional[str] = None,
+        hedge: bool = False,
     ) -> List[asyncio.Task]:
         """Send a single message to target via one or all of the pooled connections, depending on polling_type. Convenience function wrapper around send_messages
         :param request: a single request to send
@@ -263,6 +586,7 @@ class GrpcConnectionPool:
         :param shard_id: Send to a specific shard of the pod, ignored for polling ALL
         :param polling_type: defines if the message should be send to any or all pooled connections for the target
         :param endpoint: endpoint to target with the request
+        :param hedge: if the request is idempotent and can be hedged, see :class:`HedgingPolicy`
         :return: list of asyncio.Task items for each send call
         """
         return self.send_requests(
@@ -272,6 +596,7 @@ class GrpcConnectionPool:
             shard_id=shard_id,
             polling_type=polling_type,
             endpoint=endpoint,
+            hedge=hedge,
         )
 
     def send_requests(
@@ -282,6 +607,7 @@ class GrpcConnectionPool:
         shard_id: Optional[int] = None,
         polling_type: PollingType = PollingType.ANY,
         endpoint: Optional[str] = None,
+        hedge: bool = False,
     ) -> List[asyncio.Task]:
         """Send a request to target via one or all of the pooled connections, depending on polling_type
 
@@ -291,23 +617,28 @@ class GrpcConnectionPool:
         :param shard_id: Send to a specific shard of the pod, ignored for polling ALL
         :param polling_type: defines if the request should be send to any or all pooled connections for the target
         :param endpoint: endpoint to target with the requests
+        :param hedge: if the request is idempotent and can be hedged, see :class:`HedgingPolicy`
         :return: list of asyncio.Task items for each send call
         """
         results = []
-        connections = []
+        connection_lists = []
         if polling_type == PollingType.ANY:
             connection_list = self._connections.get_replicas(pod, head, shard_id)
             if connection_list:
-                connections.append(connection_list.get_next_connection())
+                connection_lists.append(connection_list)
         elif polling_type == PollingType.ALL:
             connection_lists = self._connections.get_replicas_all_shards(pod)
-            for connection_list in connection_lists:
-                connections.append(connection_list.get_next_connection())
         else:
             raise ValueError(f'Unsupported polling type {polling_type}')
 
-        for connection in connections:
-            task = self._send_requests(requests, connection, endpoint)
+        hedge = hedge and len(requests) == 1 and type(requests[0]) == DataRequest
+        for connection_list in connection_lists:
+            if hedge:
+                task = self._send_hedged_requests(requests, connection_list, endpoint)
+            else:
+                task = self._send_requests(
+                    requests, connection_list.get_next_connection(), endpoint
+                )
             results.append(task)
 
         return results
@@ -412,6 +743,57 @@ class GrpcConnectionPool:
         """
         await self._connections.close()
 
+    def _send_hedged_requests(
+        self,
+        requests: List[Request],
+        replicas: ReplicaList,
+        endpoint: Optional[str] = None,
+    ) -> asyncio.Task:
+        async def task_wrapper():
+            delay = self._hedging.get_delay(replicas)
+            starts = {}
+
+            def send():
+                task = self._send_requests(
+                    requests, replicas.get_next_connection(), endpoint
+                )
+                starts[task] = time.perf_counter()
+                return task
+
+            tasks = {send()}
+            try:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and self._hedging.acquire():
+                    self._logger.debug(
+                        f'no response after {delay:.3f}s, hedging the request'
+                    )
+                    tasks.add(send())
+
+                errors = []
+                while tasks:
+                    done, tasks = await asyncio.wait(
+                        tasks, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        if task.exception() is None:
+                            self._hedging.record_latency(
+                                replicas, time.perf_counter() - starts[task]
+                            )
+                            for loser in tasks:
+                                # its elapsed time is a lower bound of its latency, which keeps the slow calls in the window
+                                self._hedging.record_latency(
+                                    replicas, time.perf_counter() - starts[loser]
+                                )
+                            return task.result()
+                        errors.append(task.exception())
+                raise errors[0]
+            finally:
+                # the losing call, or all of them when this task is cancelled
+                for task in tasks:
+                    task.cancel()
+
+        return asyncio.create_task(task_wrapper())
+
     def _send_requests(
         self, requests: List[Request], connection, endpoint: Optional[str] = None
     ) -> asyncio.Task:
@@ -419,11 +801,14 @@ class GrpcConnectionPool:
         # the grpc call function is not a coroutine but some _AioCall
         async def task_wrapper(requests, stubs, endpoint):
             metadata = (('endpoint', endpoint),) if endpoint else None
+            compressor = stubs[3]
+            if type(requests[0]) == DataRequest and len(requests) == 1:
+                requests = [compressor.compress(requests[0])]
             for i in range(3):
                 try:
                     request_type = type(requests[0])
                     if request_type == DataRequest and len(requests) == 1:
-
+                        start = time.perf_counter()
                         call_result = stubs[0].process_single_data(
                             requests[0], metadata=metadata
                         )
@@ -431,6 +816,10 @@ class GrpcConnectionPool:
                             await call_result.trailing_metadata(),
                             await call_result,
                         )
+                        if not requests[0].is_decompressed:
+                            compressor.record_call(
+                                len(requests[0].buffer), time.perf_counter() - start
+                            )
                         return response, metadata
                     if request_type == DataRequest and len(requests) > 1:
                         call_result = stubs[1].process_data(requests, metadata=metadata)
@@ -594,24 +983,35 @@ class GrpcConnectionPool:
         :returns: the response request
         """
 
+        key = (target, https, root_certificates)
         for i in range(3):
-            try:
-                with GrpcConnectionPool.get_grpc_channel(
+            channel, to_close = _sync_channels.get(
+                key,
+                lambda: GrpcConnectionPool.get_grpc_channel(
                     target,
                     https=https,
                     root_certificates=root_certificates,
-                ) as channel:
-                    if type(request) == DataRequest:
-                        metadata = (('endpoint', endpoint),) if endpoint else None
-                        stub = jina_pb2_grpc.JinaSingleDataRequestRPCStub(channel)
-                        response, call = stub.process_single_data.with_call(
-                            request, timeout=timeout, metadata=metadata
-                        )
-                    elif type(request) == ControlRequest:
-                        stub = jina_pb2_grpc.JinaControlRequestRPCStub(channel)
-                        response = stub.process_control(request, timeout=timeout)
-                    return response
+                ),
+            )
+            for _, c in to_close:
+                c.close()
+            try:
+                if type(request) == DataRequest:
+                    metadata = (('endpoint', endpoint),) if endpoint else None
+                    stub = jina_pb2_grpc.JinaSingleDataRequestRPCStub(channel)
+                    response, call = stub.process_single_data.with_call(
+                        request, timeout=timeout, metadata=metadata
+                    )
+                elif type(request) == ControlRequest:
+                    stub = jina_pb2_grpc.JinaControlRequestRPCStub(channel)
+                    response = stub.process_control(request, timeout=timeout)
+                return response
             except grpc.RpcError as e:
+                if e.code() == grpc.StatusCode.UNAVAILABLE:
+                    # the next attempt, or request, reconnects on a new channel instead of waiting for the
+                    # backoff of this one
+                    if _sync_channels.evict(key, channel):
+                        channel.close()
                 if e.code() != grpc.StatusCode.UNAVAILABLE or i == 2:
                     raise
 
@@ -647,18 +1047,45 @@ class GrpcConnectionPool:
         :returns: the response request
         """
 
-        async with GrpcConnectionPool.get_grpc_channel(
-            target,
-            asyncio=True,
-            https=https,
-            root_certificates=root_certificates,
-        ) as channel:
+        # async channels are bound to the event loop they are created in
+        loop = asyncio.get_running_loop()
+        key = (loop, target, https, root_certificates)
+        channel, to_close = _async_channels.get(
+            key,
+            lambda: GrpcConnectionPool.get_grpc_channel(
+                target,
+                asyncio=True,
+                https=https,
+                root_certificates=root_certificates,
+            ),
+            is_healthy=_is_healthy_async_channel,
+        )
+        for k, c in to_close:
+            await _close_async_channel(k[0], c)
+        try:
             if type(request) == DataRequest:
                 stub = jina_pb2_grpc.JinaSingleDataRequestRPCStub(channel)
                 return await stub.process_single_data(request, timeout=timeout)
             elif type(request) == ControlRequest:
                 stub = jina_pb2_grpc.JinaControlRequestRPCStub(channel)
                 return await stub.process_control(request, timeout=timeout)
+        except AioRpcError as e:
+            if e.code() == grpc.StatusCode.UNAVAILABLE and _async_channels.evict(
+                key, channel
+            ):
+                await _close_async_channel(loop, channel)
+            raise
+
+    @staticmethod
+    async def close_cached_channels():
+        """
+        Close the channels cached by :meth:`send_request_sync` & :meth:`send_request_async` in this process.
+        The async channels are closed in the event loop they belong to, if it is still open.
+        """
+        for _, channel in _sync_channels.pop_all():
+            channel.close()
+        for (loop, *_), channel in _async_channels.pop_all():
+            await _close_async_channel(loop, channel)
 
     @staticmethod
     def create_async_channel_stub(
@@ -702,6 +1129,12 @@ class K8sGrpcConnectionPool(GrpcConnectionPool):
     :param namespace: K8s namespace to operate in
     :param client: K8s client
     :param logger: the logger to use
+    :param compress: the compression algorithm of the data requests, see :class:`AdaptiveCompressor`
+    :param compress_min_bytes: the minimum size of the data requests to compress, -1 means disable compression
+    :param compress_min_ratio: the minimum compression ratio to send a data request compressed
+    :param hedge_percentile: the percentile of the recent latencies of the replicas after which a hedged request is
+        sent to another replica, see :class:`HedgingPolicy`
+    :param hedge_budget: the fraction of the hedged requests that can be sent to another replica
     """
 
     K8S_PORT_EXPOSE = 8080
@@ -714,8 +1147,20 @@ class K8sGrpcConnectionPool(GrpcConnectionPool):
         namespace: str,
         client: 'kubernetes.client.CoreV1Api',
         logger: JinaLogger = None,
+        compress: CompressAlgo = CompressAlgo.NONE,
+        compress_min_bytes: int = 1024,
+        compress_min_ratio: float = 1.1,
+        hedge_percentile: float = 95.0,
+        hedge_budget: float = 0.1,
     ):
-        super().__init__(logger=logger)
+        super().__init__(
+            logger=logger,
+            compress=compress,
+            compress_min_bytes=compress_min_bytes,
+            compress_min_ratio=compress_min_ratio,
+            hedge_percentile=hedge_percentile,
+            hedge_budget=hedge_budget,
+        )
 
         self._namespace = namespace
         self._process_events_task = None
@@ -833,6 +1278,24 @@ class K8sGrpcConnectionPool(GrpcConnectionPool):
         return None
 
 
+def _is_healthy_async_channel(channel: grpc.aio.Channel) -> bool:
+    # a channel in TRANSIENT_FAILURE waits for its reconnect backoff, a new one connects right away
+    return channel.get_state() not in (
+        grpc.ChannelConnectivity.TRANSIENT_FAILURE,
+        grpc.ChannelConnectivity.SHUTDOWN,
+    )
+
+
+async def _close_async_channel(
+    loop: asyncio.AbstractEventLoop, channel: grpc.aio.Channel
+):
+    # a channel is closed in the event loop it was created in, the channels of a closed loop are already unusable
+    if loop is asyncio.get_running_loop():
+        await channel.close(0)
+    elif not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(channel.close(0), loop)
+
+
 def is_remote_local_connection(first: str, second: str):
     """
     Decides, whether ``first`` is remote host and ``second`` is localhost
@@ -866,14 +1329,32 @@ def create_connection_pool(
     k8s_connection_pool: bool = False,
     k8s_namespace: Optional[str] = None,
     logger: Optional[JinaLogger] = None,
+    compress: CompressAlgo = CompressAlgo.NONE,
+    compress_min_bytes: int = 1024,
+    compress_min_ratio: float = 1.1,
+    hedge_percentile: float = 95.0,
+    hedge_budget: float = 0.1,
 ) -> GrpcConnectionPool:
     """
     Creates the appropriate connection pool based on parameters
     :param k8s_namespace: k8s namespace the pool will live in, None if outside K8s
     :param k8s_connection_pool: flag to indicate if K8sGrpcConnectionPool should be used, defaults to true in K8s
     :param logger: the logger to use
+    :param compress: the compression algorithm of the data requests, see :class:`AdaptiveCompressor`
+    :param compress_min_bytes: the minimum size of the data requests to compress, -1 means disable compression
+    :param compress_min_ratio: the minimum compression ratio to send a data request compressed
+    :param hedge_percentile: the percentile of the recent latencies of the replicas after which a hedged request is
+        sent to another replica, see :class:`HedgingPolicy`
+    :param hedge_budget: the fraction of the hedged requests that can be sent to another replica
     :return: A connection pool object
     """
+    options = dict(
+        compress=compress,
+        compress_min_bytes=compress_min_bytes,
+        compress_min_ratio=compress_min_ratio,
+        hedge_percentile=hedge_percentile,
+        hedge_budget=hedge_budget,
+    )
     if k8s_connection_pool and k8s_namespace:
         import kubernetes
         from kubernetes import client
@@ -883,10 +1364,18 @@ def create_connection_pool(
         k8s_client = client.ApiClient()
         core_client = client.CoreV1Api(api_client=k8s_client)
         return K8sGrpcConnectionPool(
-            namespace=k8s_namespace, client=core_client, logger=logger
+            namespace=k8s_namespace, client=core_client, logger=logger, **options
         )
     else:
-        return GrpcConnectionPool(logger=logger)
+        return GrpcConnectionPool(logger=logger, **options)
+
+
+def _is_local_address(address: str) -> bool:
+    try:
+        return host_is_local(address.rsplit(':', 1)[0])
+    except (ValueError, OSError):
+        # not an ip address
+        return False
 
 
 def host_is_local(hostname):
@@ -27,6 +27,9 @@ class GatewayRuntime(AsyncNewLoopRuntime, ABC):
             logger=self.logger,
             k8s_connection_pool=self.args.k8s_connection_pool,
             k8s_namespace=self.args.k8s_namespace,
+            compress=self.args.compress,
+            compress_min_bytes=self.args.compress_min_bytes,
+            compress_min_ratio=self.args.compress_min_ratio,
         )
         for pod_name, addresses in pods_addresses.items():
             for address in addresses:
@@ -39,7 +39,9 @@ class GRPCGatewayRuntime(GatewayRuntime):
         self.streamer = RequestStreamer(
             args=self.args,
             request_handler=handle_request(
-                graph=self._topology_graph, connection_pool=self._connection_pool
+                graph=self._topology_graph,
+                connection_pool=self._connection_pool,
+                coalesce=self.args.coalesce_requests,
             ),
             result_handler=handle_result,
         )
@@ -1,7 +1,8 @@
 import copy
 import asyncio
+from hashlib import blake2b
 
-from typing import List, TYPE_CHECKING, Callable
+from typing import Dict, List, TYPE_CHECKING, Callable, Tuple
 
 from jina.peapods.runtimes.gateway.graph.topology_graph import TopologyGraph
 from jina.peapods.networking import GrpcConnectionPool
@@ -11,13 +12,17 @@ if TYPE_CHECKING:
 
 
 def handle_request(
-    graph: 'TopologyGraph', connection_pool: 'GrpcConnectionPool'
+    graph: 'TopologyGraph',
+    connection_pool: 'GrpcConnectionPool',
+    coalesce: bool = False,
 ) -> Callable[['Request'], 'asyncio.Future']:
     """
     Function that handles the requests arriving to the gateway. This will be passed to the streamer.
 
     :param graph: The TopologyGraph of the Flow.
     :param connection_pool: The connection pool to be used to send messages to specific nodes of the graph
+    :param coalesce: if set, a request identical to one already in the Flow is not sent, it waits for the response of
+        the latter instead
     :return: Return a Function that given a Request will return a Future from where to extract the response
     """
 
@@ -77,6 +82,56 @@ def handle_request(
             _process_results_at_end_gateway(tasks_to_respond, request_graph)
         )
 
+    if coalesce:
+        return _coalesce_requests(_handle_request)
+    return _handle_request
+
+
+def _fingerprint(request: 'Request') -> Tuple[str, List[str]]:
+    h = blake2b(digest_size=16)
+    h.update(request.header.exec_endpoint.encode())
+    h.update(b'\0')
+    h.update(request.header.target_executor.encode())
+    h.update(b'\0')
+    h.update(request.proto.parameters.SerializeToString(deterministic=True))
+    doc_ids = []
+    for d in request.docs:
+        h.update(d.content_hash.encode())
+        doc_ids.append(d.id)
+    return h.hexdigest(), doc_ids
+
+
+def _coalesce_requests(
+    handle: Callable[['Request'], 'asyncio.Future']
+) -> Callable[['Request'], 'asyncio.Future']:
+    # fingerprint -> (future of the request in the Flow, ids of its Documents)
+    in_flight: Dict[str, Tuple['asyncio.Future', List[str]]] = {}
+
+    async def _copy_response(
+        leader: 'asyncio.Future', leader_doc_ids: List[str], request: 'Request'
+    ) -> 'Request':
+        response = copy.deepcopy(await asyncio.shield(leader))
+        response.header.request_id = request.header.request_id
+        docs = response.docs
+        if [d.id for d in docs] == leader_doc_ids:
+            # the Executors kept the Documents, so hand them back under the ids this client knows
+            for d, request_doc in zip(docs, request.docs):
+                d.id = request_doc.id
+        return response
+
+    def _handle_request(request: 'Request') -> 'asyncio.Future':
+        key, doc_ids = _fingerprint(request)
+        if key in in_flight:
+            leader, leader_doc_ids = in_flight[key]
+            return asyncio.ensure_future(
+                _copy_response(leader, leader_doc_ids, request)
+            )
+
+        future = handle(request)
+        in_flight[key] = (future, doc_ids)
+        future.add_done_callback(lambda _: in_flight.pop(key, None))
+        return future
+
     return _handle_request
 
 
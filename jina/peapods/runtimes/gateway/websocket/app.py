@@ -56,7 +56,9 @@ def get_fastapi_app(
     streamer = RequestStreamer(
         args=args,
         request_handler=handle_request(
-            graph=topology_graph, connection_pool=connection_pool
+            graph=topology_graph,
+            connection_pool=connection_pool,
+            coalesce=args.coalesce_requests,
         ),
         result_handler=handle_result,
     )
@@ -15,7 +15,7 @@ from jina.peapods.runtimes.request_handlers.data_request_handler import (
     DataRequestHandler,
 )
 from jina.peapods.networking import create_connection_pool, K8sGrpcConnectionPool
-from jina.enums import PollingType
+from jina.enums import PollingType, CompressAlgo
 from jina.proto import jina_pb2_grpc
 from jina.types.request.control import ControlRequest
 from jina.types.request.data import DataRequest
@@ -52,7 +52,13 @@ class HeadRuntime(AsyncNewLoopRuntime, ABC):
             logger=self.logger,
             k8s_connection_pool=args.k8s_connection_pool,
             k8s_namespace=args.k8s_namespace,
+            compress=getattr(args, 'compress', CompressAlgo.NONE),
+            compress_min_bytes=getattr(args, 'compress_min_bytes', 1024),
+            compress_min_ratio=getattr(args, 'compress_min_ratio', 1.1),
+            hedge_percentile=getattr(args, 'hedge_percentile', 95.0),
+            hedge_budget=getattr(args, 'hedge_budget', 0.1),
         )
+        self._hedge_endpoints = set(getattr(args, 'hedge_endpoints', None) or [])
 
         polling = getattr(args, 'polling', self.DEFAULT_POLLING.name)
         try:
@@ -261,6 +267,7 @@ class HeadRuntime(AsyncNewLoopRuntime, ABC):
             requests=requests,
             pod=self._pod_name,
             polling_type=self._polling[endpoint],
+            hedge=endpoint in self._hedge_endpoints,
         )
 
         worker_results = await asyncio.gather(*worker_send_tasks)
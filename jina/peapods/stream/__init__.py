@@ -1,5 +1,7 @@
+import sys
 import asyncio
 import argparse
+import functools
 from typing import (
     List,
     Union,
@@ -11,7 +13,7 @@ from typing import (
     Awaitable,
 )
 
-from jina.peapods.stream.helper import AsyncRequestsIterator
+from jina.peapods.stream.helper import AsyncRequestsIterator, AdaptiveWindow
 from jina.logging.logger import JinaLogger
 
 __all__ = ['RequestStreamer']
@@ -49,6 +51,14 @@ class RequestStreamer:
         self.args = args
         self.logger = logger or JinaLogger(self.__class__.__name__, **vars(args))
         self._prefetch = getattr(self.args, 'prefetch', 0)
+        self._prefetch_adaptive = getattr(self.args, 'prefetch_adaptive', False)
+        self._prefetch_global = getattr(self.args, 'prefetch_global', 0)
+        # shared by all the client streams, created lazily to bind to the running loop
+        self._global_credits: Optional[asyncio.Semaphore] = None
+        # requests pulled ahead from a blocking client iterator must not exceed the prefetch window
+        self._iterator_kwargs = (
+            {'max_chunk_size': self._prefetch} if self._prefetch > 0 else {}
+        )
         self._request_handler = request_handler
         self._result_handler = result_handler
         self._end_of_iter_handler = end_of_iter_handler
@@ -61,11 +71,16 @@ class RequestStreamer:
         :param args: positional arguments
         :yield: responses from Executors
         """
-        async_iter: AsyncIterator = (
-            self._stream_requests_with_prefetch(request_iterator, self._prefetch)
-            if self._prefetch > 0
-            else self._stream_requests(request_iterator)
-        )
+        if self._prefetch_adaptive or self._prefetch_global > 0:
+            async_iter: AsyncIterator = self._stream_requests_with_credits(
+                request_iterator
+            )
+        elif self._prefetch > 0:
+            async_iter = self._stream_requests_with_prefetch(
+                request_iterator, self._prefetch
+            )
+        else:
+            async_iter = self._stream_requests(request_iterator)
 
         async for response in async_iter:
             yield response
@@ -134,6 +149,115 @@ class RequestStreamer:
             except self._EndOfStreaming:
                 pass
 
+    async def _stream_requests_with_credits(
+        self, request_iterator: Union[Iterator, AsyncIterator]
+    ) -> AsyncIterator:
+        """Implements request and response handling with credit-based flow control.
+
+        A request is only pulled from the client iterator once a credit is available in the window of
+        this stream, and only handed to the Flow once a credit is available in the window shared by all
+        streams (if `prefetch_global` is set), so that a stream waiting on its client holds no shared
+        credit. Both credits are given back once the response has been consumed. With
+        `prefetch_adaptive`, the window of the stream follows the latency of completed requests
+        (see :class:`AdaptiveWindow`), otherwise it is fixed to `prefetch` (no limit if 0).
+
+        :param request_iterator: requests iterator from Client
+        :yield: responses
+        """
+        loop = asyncio.get_event_loop()
+        if self._prefetch_global > 0 and self._global_credits is None:
+            self._global_credits = asyncio.Semaphore(self._prefetch_global)
+        global_credits = self._global_credits
+
+        if self._prefetch_adaptive:
+            window = AdaptiveWindow(max_window=self._prefetch)
+        else:
+            fixed_window = self._prefetch if self._prefetch > 0 else sys.maxsize
+            window = AdaptiveWindow(min_window=fixed_window, max_window=fixed_window)
+
+        result_queue = asyncio.Queue()
+        end_of_iter = asyncio.Event()
+        requests_to_handle = self._RequestsCounter()
+        # global credits taken by this stream and not given back yet
+        global_credits_held = self._RequestsCounter()
+
+        def release_credits():
+            window.release()
+            if global_credits is not None and global_credits_held.count > 0:
+                global_credits_held.count -= 1
+                global_credits.release()
+
+        def callback(start: float, future: 'asyncio.Future'):
+            # a failed request says nothing about the latency of the Flow
+            if (
+                self._prefetch_adaptive
+                and not future.cancelled()
+                and future.exception() is None
+            ):
+                window.update(loop.time() - start)
+            result_queue.put_nowait(future)
+
+        async def iterate_requests() -> None:
+            requests = AsyncRequestsIterator(
+                iterator=request_iterator, **self._iterator_kwargs
+            ).__aiter__()
+            try:
+                while True:
+                    await window.acquire()
+                    try:
+                        request = await requests.__anext__()
+                        if global_credits is not None:
+                            await global_credits.acquire()
+                            global_credits_held.count += 1
+                        future: 'asyncio.Future' = self._request_handler(
+                            request=request
+                        )
+                    except BaseException:
+                        release_credits()
+                        raise
+                    requests_to_handle.count += 1
+                    future.add_done_callback(functools.partial(callback, loop.time()))
+            except StopAsyncIteration:
+                if self._end_of_iter_handler is not None:
+                    self._end_of_iter_handler()
+            except Exception as ex:
+                # hand the error over to the consumer, which would otherwise wait forever
+                result_queue.put_nowait(ex)
+            finally:
+                end_of_iter.set()
+                # wake up the consumer in case all responses are already consumed
+                result_queue.put_nowait(None)
+
+        iterate_task = asyncio.create_task(iterate_requests())
+        num_responses = 0
+        try:
+            while not (end_of_iter.is_set() and requests_to_handle.count == 0):
+                future = await result_queue.get()
+                if future is None:
+                    continue
+                if isinstance(future, Exception):
+                    raise future
+                try:
+                    response = self._result_handler(future.result())
+                    num_responses += 1
+                    yield response
+                finally:
+                    requests_to_handle.count -= 1
+                    release_credits()
+            if num_responses == 0:
+                self.logger.error(
+                    'receive an empty stream from the client! '
+                    'please check your client\'s inputs, '
+                    'you can use "Client.check_input(inputs)"'
+                )
+        finally:
+            if not iterate_task.done():
+                iterate_task.cancel()
+            # requests still in flight when the consumer stops early don't hold shared credits anymore
+            while global_credits is not None and global_credits_held.count > 0:
+                global_credits_held.count -= 1
+                global_credits.release()
+
     async def _stream_requests_with_prefetch(
         self, request_iterator: Union[Iterator, AsyncIterator], prefetch: int
     ):
@@ -156,13 +280,17 @@ class RequestStreamer:
             :return: False if append task to `fetch_to` else False
             """
             count = 0
-            async for request in AsyncRequestsIterator(iterator=request_iterator):
+            async for request in requests:
                 fetch_to.append(self._request_handler(request))
                 count += 1
                 if count == num_req:
                     return False
             return True
 
+        # shared by all `iterate_requests` calls, as it may hold requests pulled ahead
+        requests = AsyncRequestsIterator(
+            iterator=request_iterator, max_chunk_size=prefetch
+        )
         prefetch_task = []
         is_req_empty = await iterate_requests(prefetch, prefetch_task)
         if is_req_empty and not prefetch_task:
@@ -1,18 +1,38 @@
-from typing import Iterator, AsyncIterator, Union
+import time
+import asyncio
+from collections import deque
+from typing import Iterator, AsyncIterator, List, Optional, Tuple, Union
 
 from jina.helper import get_or_reuse_loop
 
 
 class AsyncRequestsIterator:
-    """Iterator to allow async iteration of blocking/non-blocking iterator from the Client"""
+    """Iterator to allow async iteration of blocking/non-blocking iterator from the Client
 
-    def __init__(self, iterator: Union[Iterator, AsyncIterator]) -> None:
+    A blocking iterator is pulled in the default executor, in chunks so that a cheap generator doesn't
+    pay one thread hop per request. The chunk size doubles (up to `max_chunk_size`) as long as a whole
+    chunk is pulled within `chunk_latency` seconds, and shrinks to what could be pulled in that time
+    otherwise, so that a slow generator never holds back requests it already produced.
+    """
+
+    def __init__(
+        self,
+        iterator: Union[Iterator, AsyncIterator],
+        max_chunk_size: int = 64,
+        chunk_latency: float = 0.005,
+    ) -> None:
         """Async request iterator
-        TODO (Deepankar): accept `num_req`
 
         :param iterator: request iterator
+        :param max_chunk_size: max number of requests pulled from a blocking iterator per executor hop
+        :param chunk_latency: seconds after which a chunk is returned even if not full
         """
         self.iterator = iterator
+        self._max_chunk_size = max(max_chunk_size, 1)
+        self._chunk_latency = chunk_latency
+        self._chunk_size = 1
+        self._buffer = deque()
+        self._exhausted = False
 
     def iterator__next__(self):
         """
@@ -26,6 +46,24 @@ class AsyncRequestsIterator:
         except StopIteration:
             return None
 
+    def iterator__next_chunk__(self, chunk_size: int) -> Tuple[List, bool]:
+        """
+        Executed inside a `ThreadPoolExecutor`, pulls up to `chunk_size` requests within `chunk_latency`.
+
+        :param chunk_size: max number of requests to pull
+        :return: the pulled requests and whether the iterator is exhausted
+        """
+        chunk = []
+        start = time.perf_counter()
+        try:
+            while len(chunk) < chunk_size:
+                chunk.append(self.iterator.__next__())
+                if time.perf_counter() - start > self._chunk_latency:
+                    break
+        except StopIteration:
+            return chunk, True
+        return chunk, False
+
     def __aiter__(self):
         return self
 
@@ -35,20 +73,108 @@ class AsyncRequestsIterator:
             An `Iterator` indicates "blocking" code, which might block all tasks in the event loop.
             Hence we iterate in the default executor provided by asyncio.
             """
-            request = await get_or_reuse_loop().run_in_executor(
-                None, self.iterator__next__
-            )
+            if not self._buffer and not self._exhausted:
+                chunk, self._exhausted = await get_or_reuse_loop().run_in_executor(
+                    None, self.iterator__next_chunk__, self._chunk_size
+                )
+                if len(chunk) == self._chunk_size:
+                    self._chunk_size = min(self._chunk_size * 2, self._max_chunk_size)
+                else:
+                    self._chunk_size = max(len(chunk), 1)
+                self._buffer.extend(chunk)
 
             """
             `iterator.__next__` can be executed directly and that'd raise `StopIteration` in the executor,
             which raises the following exception while chaining states in futures.
             "StopIteration interacts badly with generators and cannot be raised into a Future"
-            To avoid that, we handle the raise by a `return None`
+            To avoid that, the end of iteration is returned as a flag along with the chunk
             """
-            if request is None:
+            if not self._buffer:
                 raise StopAsyncIteration
+            request = self._buffer.popleft()
         elif isinstance(self.iterator, AsyncIterator):
             # we assume that `AsyncIterator` doesn't block the event loop
             request = await self.iterator.__anext__()
 
         return request
+
+
+class AdaptiveWindow:
+    """
+    Credit-based window of in-flight requests, adjusted from the observed latency in the style of AIMD.
+
+    The window starts small and grows by one per completed request (slow start) until the latency rises
+    above `latency_tolerance` times the best recently observed latency. From then on, it grows by one per
+    window of completed requests while latency stays low and halves whenever latency rises.
+
+    :param max_window: upper bound of the window, 0 means no upper bound
+    :param min_window: lower bound of the window
+    :param latency_tolerance: ratio of the baseline latency from which latency is considered too high
+    """
+
+    def __init__(
+        self,
+        max_window: int = 0,
+        min_window: int = 1,
+        latency_tolerance: float = 2.0,
+    ):
+        self.max_window = max_window
+        self.min_window = min_window
+        self.window = float(min_window)
+        self.in_flight = 0
+        self._latency_tolerance = latency_tolerance
+        self._base_latency: Optional[float] = None
+        self._slow_start = True
+        self._completed_since_decrease = 0
+        self._available = asyncio.Event()
+        self._available.set()
+
+    def _clip(self, window: float) -> float:
+        window = max(window, self.min_window)
+        if self.max_window > 0:
+            window = min(window, self.max_window)
+        return window
+
+    def _notify(self) -> None:
+        if self.in_flight < int(self.window):
+            self._available.set()
+        else:
+            self._available.clear()
+
+    async def acquire(self) -> None:
+        """Wait until the window has a free credit and take it"""
+        while self.in_flight >= int(self.window):
+            self._available.clear()
+            await self._available.wait()
+        self.in_flight += 1
+        self._notify()
+
+    def release(self) -> None:
+        """Give a credit back to the window"""
+        self.in_flight -= 1
+        self._notify()
+
+    def update(self, latency: float) -> None:
+        """
+        Adjust the window from the latency of a completed request
+
+        :param latency: seconds between sending the request and receiving its response
+        """
+        if self._base_latency is None or latency < self._base_latency:
+            self._base_latency = latency
+        else:
+            # let the baseline slowly follow the latency, so that a lasting change of the workload is adopted
+            self._base_latency += (latency - self._base_latency) * 0.01
+
+        self._completed_since_decrease += 1
+        if latency > self._base_latency * self._latency_tolerance:
+            # decrease at most once per window, all requests of the window saw the same congestion
+            if self._completed_since_decrease >= self.window:
+                self.window = self._clip(self.window / 2)
+                self._slow_start = False
+                self._completed_since_decrease = 0
+        elif self._slow_start:
+            self.window = self._clip(self.window + 1)
+        else:
+            self.window = self._clip(self.window + 1 / self.window)
+        self._notify()
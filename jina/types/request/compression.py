@@ -0,0 +1,122 @@
+"""Compression of the serialized requests sent between Peas.
+
+A compressed request is framed as ``b'\\x00' + <algorithm> + <shuffled> + <compressed bytes>``. A serialized protobuf
+message never starts with a zero byte, as field numbers start at 1, so the receiving :class:`DataRequest` tells the
+compressed requests from the plain ones without any other metadata, and decompresses them on first access.
+"""
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+from jina.enums import CompressAlgo
+
+_FRAME_MAGIC = b'\x00'
+_FRAME_HEADER_SIZE = 3
+
+#: shuffled buffers have the bytes of their 4-byte words grouped by position before compressing, so that e.g. the sign
+#: & exponent bytes of the float32 values of embeddings end up next to each other
+_SHUFFLE_ITEMSIZE = 4
+
+_CODECS: Dict[CompressAlgo, Tuple[Callable, Callable]] = {}
+
+
+def _get_codec(algo: CompressAlgo) -> Tuple[Callable, Callable]:
+    if algo not in _CODECS:
+        if algo == CompressAlgo.LZ4:
+            import lz4.frame
+
+            codec = lz4.frame.compress, lz4.frame.decompress
+        elif algo == CompressAlgo.ZSTD:
+            import zstandard
+
+            codec = (
+                zstandard.ZstdCompressor(level=3).compress,
+                zstandard.ZstdDecompressor().decompress,
+            )
+        elif algo == CompressAlgo.ZLIB:
+            import zlib
+
+            codec = lambda x: zlib.compress(x, 1), zlib.decompress
+        elif algo == CompressAlgo.GZIP:
+            import gzip
+
+            codec = lambda x: gzip.compress(x, 1), gzip.decompress
+        elif algo == CompressAlgo.BZ2:
+            import bz2
+
+            codec = bz2.compress, bz2.decompress
+        elif algo == CompressAlgo.LZMA:
+            import lzma
+
+            codec = lzma.compress, lzma.decompress
+        else:
+            raise ValueError(f'{algo!r} is not a compression algorithm')
+        _CODECS[algo] = codec
+    return _CODECS[algo]
+
+
+def is_available(algo: CompressAlgo) -> bool:
+    """
+    Check if the package required by a compression algorithm is installed
+
+    :param algo: the compression algorithm
+    :return: True if requests can be compressed with ``algo``
+    """
+    try:
+        _get_codec(algo)
+    except (ImportError, ValueError):
+        return False
+    return True
+
+
+def compress(buffer: bytes, algo: CompressAlgo, shuffle: bool = False) -> bytes:
+    """
+    Compress a serialized request into a frame that :func:`decompress` reverts
+
+    :param buffer: the serialized request
+    :param algo: the compression algorithm
+    :param shuffle: if to group the bytes of the 4-byte words by position before compressing, which helps on float
+        buffers such as embeddings
+    :return: the compressed frame
+    """
+    if shuffle:
+        buffer = _shuffle(buffer)
+    return _FRAME_MAGIC + bytes((int(algo), int(shuffle))) + _get_codec(algo)[0](buffer)
+
+
+def is_compressed(buffer: bytes) -> bool:
+    """
+    Check if a buffer is a compressed frame
+
+    :param buffer: the buffer received
+    :return: True if ``buffer`` was compressed by :func:`compress`
+    """
+    return buffer[:1] == _FRAME_MAGIC and len(buffer) >= _FRAME_HEADER_SIZE
+
+
+def decompress(buffer: bytes) -> bytes:
+    """
+    Decompress a frame from :func:`compress`, other buffers are returned as they are
+
+    :param buffer: the buffer received
+    :return: the serialized request
+    """
+    if not is_compressed(buffer):
+        return buffer
+    algo, shuffle = CompressAlgo(buffer[1]), buffer[2]
+    buffer = _get_codec(algo)[1](memoryview(buffer)[_FRAME_HEADER_SIZE:])
+    if shuffle:
+        buffer = _unshuffle(buffer)
+    return buffer
+
+
+def _shuffle(buffer: bytes) -> bytes:
+    x = np.frombuffer(buffer, dtype=np.uint8)
+    n = len(x) - len(x) % _SHUFFLE_ITEMSIZE
+    return x[:n].reshape(-1, _SHUFFLE_ITEMSIZE).T.tobytes() + x[n:].tobytes()
+
+
+def _unshuffle(buffer: bytes) -> bytes:
+    x = np.frombuffer(buffer, dtype=np.uint8)
+    n = len(x) - len(x) % _SHUFFLE_ITEMSIZE
+    return x[:n].reshape(_SHUFFLE_ITEMSIZE, -1).T.tobytes() + x[n:].tobytes()
@@ -100,8 +100,10 @@ class DataRequest(Request):
         return self._pb_body
 
     def _decompress(self):
+        from jina.types.request.compression import decompress
+
         self._pb_body = jina_pb2.DataRequestProto()
-        self._pb_body.ParseFromString(self.buffer)
+        self._pb_body.ParseFromString(decompress(self.buffer))
         self.buffer = None
 
     @property
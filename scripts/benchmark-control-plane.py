@@ -0,0 +1,71 @@
+## under jina root dir
+# python scripts/benchmark-control-plane.py
+## compares the control requests of a 50-replica `rolling_update` on cached channels & on a new channel per request
+
+import asyncio
+import multiprocessing
+import time
+
+import grpc
+
+from jina.helper import random_port
+from jina.peapods.networking import GrpcConnectionPool
+from jina.proto import jina_pb2_grpc
+from jina.types.request.control import ControlRequest
+
+REPLICAS = 50
+STATUS_POLLS = 5
+
+
+def serve(port, ready):
+    class ControlServer:
+        async def process_control(self, request, *args):
+            return request
+
+    async def start():
+        server = grpc.aio.server()
+        jina_pb2_grpc.add_JinaControlRequestRPCServicer_to_server(
+            ControlServer(), server
+        )
+        server.add_insecure_port(f'localhost:{port}')
+        await server.start()
+        ready.set()
+        await server.wait_for_termination()
+
+    asyncio.run(start())
+
+
+async def rolling_update(head, uncached):
+    # what `rolling_update` sends for each replica: deactivate the old one, poll the new one until ready, activate it
+    async def after_request():
+        if uncached:
+            await GrpcConnectionPool.close_cached_channels()
+
+    for i in range(REPLICAS):
+        await GrpcConnectionPool.deactivate_worker('localhost', 10000 + i, head)
+        await after_request()
+        for _ in range(STATUS_POLLS):
+            GrpcConnectionPool.send_request_sync(ControlRequest('STATUS'), head)
+            await after_request()
+        await GrpcConnectionPool.activate_worker('localhost', 10000 + i, head)
+        await after_request()
+
+
+if __name__ == '__main__':
+    port = random_port()
+    ready = multiprocessing.Event()
+    server = multiprocessing.Process(target=serve, args=(port, ready), daemon=True)
+    server.start()
+    ready.wait()
+
+    head = f'localhost:{port}'
+    for uncached in (True, False):
+        start = time.perf_counter()
+        asyncio.run(rolling_update(head, uncached))
+        elapsed = time.perf_counter() - start
+        requests = REPLICAS * (STATUS_POLLS + 2)
+        print(
+            f'{"new channel per request" if uncached else "cached channels"}: '
+            f'{elapsed:.3f}s for {requests} control requests, {elapsed / requests * 1e3:.2f}ms per request'
+        )
+    server.terminate()
@@ -1,7 +1,10 @@
 import os
+import asyncio
 import json
 import time
 
+import pytest
+
 from daemon.helper import get_workspace_path
 from daemon.models import DaemonID
 from daemon.models.containers import ContainerArguments
@@ -111,3 +114,70 @@ def test_logstream_valid(fastapi_client):
         received = websocket.receive_json()
     assert received is not None
     assert received == json.loads(line)
+
+
+def test_logstream_shared_by_subscribers(fastapi_client):
+    from daemon.api.endpoints.logs import _managers
+
+    line = '{"host":"test-host","process":"12034","type":"INFO","name":"Flow","uptime":"2021-04-02T20:58:10.819138","context":"Flow","workspace_path":"...","log_id":"...","message":"shared"}\n'
+
+    with fastapi_client.websocket_connect(
+        f'/logstream/{flow_id}?timeout=3'
+    ) as first, fastapi_client.websocket_connect(
+        f'/logstream/{flow_id}?timeout=3'
+    ) as second:
+        time.sleep(0.25)
+        assert len(_managers) == 1
+        _write_to_logfile(line, True)
+        assert first.receive_json() == json.loads(line)
+        assert second.receive_json() == json.loads(line)
+
+
+def test_connection_manager_drops_for_slow_consumer():
+    from daemon.api.endpoints.logs import ConnectionManager
+
+    manager = ConnectionManager('logging.log', max_queue_size=2)
+    websocket = object()
+    manager.active_connections[websocket] = asyncio.Queue(maxsize=2)
+    manager.num_dropped[websocket] = 0
+    for i in range(5):
+        manager.broadcast({'message': i})
+
+    queue = manager.active_connections[websocket]
+    assert [queue.get_nowait()['message'] for _ in range(queue.qsize())] == [3, 4]
+    assert manager.num_dropped[websocket] == 3
+
+
+@pytest.mark.asyncio
+async def test_connection_manager_follows_rotation_and_deletion(tmpdir):
+    from daemon.api.endpoints.logs import ConnectionManager
+
+    filepath = os.path.join(tmpdir, 'logging.log')
+    with open(filepath, 'w') as f:
+        f.write('{"message": "old"}\n')
+
+    manager = ConnectionManager(filepath)
+    websocket = object()
+    queue = manager.active_connections[websocket] = asyncio.Queue()
+    manager.num_dropped[websocket] = 0
+    task = manager._tail_task = asyncio.get_event_loop().create_task(manager._tail())
+
+    async def _write_and_receive(line, mode='a'):
+        await asyncio.sleep(0.3)
+        with open(filepath, mode) as f:
+            f.write(line)
+        return await asyncio.wait_for(queue.get(), 3)
+
+    try:
+        assert await _write_and_receive('{"message": 1}\n') == {'message': 1}
+
+        os.rename(filepath, f'{filepath}.1')
+        assert await _write_and_receive('{"message": 2}\n', 'w') == {'message': 2}
+
+        os.remove(filepath)
+        assert await _write_and_receive('{"message": 3}\n', 'w') == {'message': 3}
+        assert queue.empty()
+        assert manager._tail_task is task and not task.done()
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
@@ -0,0 +1,135 @@
+import os
+
+import pytest
+
+from daemon.models import DaemonID
+from daemon.models.base import StoreItem
+from daemon.stores.base import BaseStore
+from daemon.stores.journal import get_journal
+
+
+class JournaledStore(BaseStore):
+    _kind = 'journaled'
+
+    @BaseStore.dump
+    def add(self, id: DaemonID, **kwargs):
+        self[id] = StoreItem()
+        return id
+
+    @BaseStore.dump
+    def delete(self, id: DaemonID, **kwargs):
+        del self[id]
+
+    @BaseStore.dump
+    async def async_add(self, id: DaemonID, **kwargs):
+        self[id] = StoreItem()
+        return id
+
+
+@pytest.fixture
+def workspace(tmpdir, monkeypatch):
+    monkeypatch.setattr('daemon.stores.base.__root_workspace__', str(tmpdir))
+    return str(tmpdir)
+
+
+def test_journal_replay_on_load(workspace):
+    store = JournaledStore()
+    ids = [store.add(DaemonID('jflow')) for _ in range(5)]
+    store.delete(ids[0])
+
+    loaded_store = JournaledStore.load()
+    assert loaded_store == store
+    assert ids[0] not in loaded_store
+    assert loaded_store.status.num_add == 5
+    assert loaded_store.status.num_del == 1
+    assert os.path.getsize(os.path.join(workspace, 'journaled.store.journal')) > 0
+
+    # mutations on the loaded store keep appending to the same journal
+    loaded_store.delete(ids[1])
+    assert JournaledStore.load() == loaded_store
+
+
+@pytest.mark.asyncio
+async def test_journal_async_mutation(workspace):
+    store = JournaledStore()
+    id = await store.async_add(DaemonID('jflow'))
+    assert id in JournaledStore.load()
+
+
+def test_journal_compaction(workspace, monkeypatch):
+    monkeypatch.setattr(JournaledStore, '_snapshot_every', 3)
+    store = JournaledStore()
+    for _ in range(7):
+        store.add(DaemonID('jflow'))
+    JournaledStore.load()
+
+    num_records = len(list(get_journal(store._filepath()).replay()))
+    assert num_records < 3
+    assert os.path.isfile(os.path.join(workspace, 'journaled.store.backup'))
+    assert len(JournaledStore.load()) == 7
+
+
+def test_journal_torn_tail(workspace):
+    store = JournaledStore()
+    store.add(DaemonID('jflow'))
+    store.add(DaemonID('jflow'))
+    JournaledStore.load()
+
+    journal_path = os.path.join(workspace, 'journaled.store.journal')
+    with open(journal_path, 'ab') as f:
+        f.write(b'\x10\x00\x00\x00partial')
+
+    assert JournaledStore.load() == store
+    assert len(list(get_journal(store._filepath()).replay())) == 1
+
+
+def test_journal_reads_are_not_recorded(workspace):
+    store = JournaledStore()
+    ids = [store.add(DaemonID('jflow')) for _ in range(3)]
+    JournaledStore.load()
+
+    assert ids[0] in store
+    store[ids[1]]
+    store.delete(ids[2])
+    JournaledStore.load()
+
+    *_, record = get_journal(store._filepath()).replay()
+    assert record['set'] == {}
+    assert record['del'] == [ids[2]]
+
+
+def test_journal_of_previous_generation_is_skipped(workspace):
+    store = JournaledStore()
+    old_id = store.add(DaemonID('jflow'))
+    JournaledStore.load()
+    journal_path = os.path.join(workspace, 'journaled.store.journal')
+    with open(journal_path, 'rb') as f:
+        old_records = f.read()
+
+    # a fresh store (e.g. `--no-store`) snapshots over the journal of the previous run,
+    # emulate a crash before that journal got truncated
+    fresh_store = JournaledStore()
+    fresh_store.add(DaemonID('jflow'))
+    JournaledStore.load()
+    with open(journal_path, 'wb') as f:
+        f.write(old_records)
+
+    loaded_store = JournaledStore.load()
+    assert old_id not in loaded_store
+    assert loaded_store == fresh_store
+
+
+def test_journal_write_failure_is_retried(workspace, mocker):
+    store = JournaledStore()
+    store.add(DaemonID('jflow'))
+    journal = get_journal(store._filepath())
+    assert journal.flush()
+
+    write = journal._write
+    mocker.patch.object(journal, '_write', side_effect=OSError('no space left'))
+    store.add(DaemonID('jflow'))
+    assert not journal.flush(timeout=5)
+
+    journal._write = write
+    assert journal.flush(timeout=5)
+    assert JournaledStore.load() == store
@@ -194,3 +194,65 @@ def test_buffer_dam_add_or_update(tmpdir):
     assert 4 in dam._buffer_pool._empty
     dam._buffer_pool.add_or_update(docs[7].id, docs[7])
     assert dam._buffer_pool.doc_map[docs[7].id][0] == 4
+
+
+def test_buffer_max_bytes():
+    buffer_pool = BufferPoolManager(pool_size=100, max_bytes=100)
+    docs = list(random_docs(10))
+    for doc in docs[:4]:
+        assert not buffer_pool.add(doc.id, doc, nbytes=30)
+    # 4 x 30 bytes do not fit, the least recently used leaves
+    assert docs[0].id not in buffer_pool
+    assert buffer_pool.nbytes == 90
+
+    docs[1].content = 'new'
+    assert buffer_pool.add(docs[4].id, docs[4], nbytes=60) == [(docs[1].id, docs[1])]
+    assert buffer_pool.nbytes == 90
+    assert [docs[3].id, docs[4].id] == list(buffer_pool.doc_map)
+
+    # bigger than the whole buffer
+    assert not buffer_pool.add(docs[5].id, docs[5], nbytes=200)
+    assert docs[5].id not in buffer_pool
+    assert buffer_pool.stats['evictions'] == 3
+
+
+def test_buffer_2q_scan_resistant():
+    buffer_pool = BufferPoolManager(pool_size=8, policy='2q')
+    hot = list(random_docs(4))
+    for doc in hot:
+        buffer_pool.add(doc.id, doc)
+    # the hot docs leave A1in, and get in Am on their next access
+    for doc in random_docs(8, start_id=100):
+        buffer_pool.add(doc.id, doc)
+    for doc in hot:
+        assert buffer_pool.get(doc.id) is None
+        buffer_pool.add(doc.id, doc)
+
+    for doc in random_docs(100, start_id=1000):
+        assert buffer_pool.get(doc.id) is None
+        buffer_pool.add(doc.id, doc)
+    for doc in hot:
+        assert buffer_pool.get(doc.id) is not None
+    assert buffer_pool.stats['hits'] == 4
+    assert buffer_pool.stats['size'] == 8
+
+
+def test_buffer_bad_policy():
+    with pytest.raises(ValueError):
+        BufferPoolManager(policy='mru')
+
+
+@pytest.mark.parametrize('policy', ['lru', '2q'])
+def test_buffer_dam_bytes(tmpdir, policy):
+    docs = list(random_docs(100))
+    dam = DocumentArrayMemmap(tmpdir, buffer_pool_bytes=2000, buffer_pool_policy=policy)
+    dam.extend(docs)
+    assert 0 < dam.buffer_pool_stats['nbytes'] <= 2000
+    for i, doc in enumerate(dam):
+        doc.content = f'new {i}'
+    dam.flush()
+    assert [d.content for d in DocumentArrayMemmap(tmpdir)] == [
+        f'new {i}' for i in range(100)
+    ]
+    stats = dam.buffer_pool_stats
+    assert stats['misses'] > 0 and stats['evictions'] > 0
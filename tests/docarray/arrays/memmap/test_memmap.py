@@ -602,3 +602,163 @@ def test_traverse_flat_root_itself(tmpdir):
     res = dam.traverse_flat(['r'])
     assert isinstance(res, DocumentArrayMemmap)
     assert id(res) == id(dam)
+
+
+def _assert_same_docs(dam, docs):
+    assert len(dam) == len(docs)
+    assert [d.id for d in dam] == [d.id for d in docs]
+    for i, d in enumerate(docs):
+        assert d.id in dam
+        assert dam[d.id].text == d.text
+        assert dam[i].id == d.id
+
+
+def test_memmap_open_from_index(tmpdir, mocker):
+    from docarray.memmap.index import HeaderIndex
+
+    docs = [Document(text=f'doc {i}') for i in range(3000)]
+    dam = DocumentArrayMemmap(tmpdir)
+    dam.extend(docs)
+    dam.flush()
+    assert os.path.exists(os.path.join(tmpdir, 'header.idx'))
+
+    build = mocker.spy(HeaderIndex, 'build')
+    _assert_same_docs(DocumentArrayMemmap(tmpdir), docs)
+    build.assert_not_called()
+
+
+def test_memmap_index_catches_up_appends(tmpdir):
+    docs = [Document(text=f'doc {i}') for i in range(100)]
+    dam = DocumentArrayMemmap(tmpdir)
+    dam.extend(docs[:50])
+    dam.flush()
+    # rows appended after the index was written, as if the process crashed before the next flush
+    dam.extend(docs[50:])
+    _assert_same_docs(DocumentArrayMemmap(tmpdir), docs)
+
+
+@pytest.mark.parametrize('flush', [False, True])
+def test_memmap_index_after_delete_update(tmpdir, flush):
+    docs = [Document(text=f'doc {i}') for i in range(100)]
+    dam = DocumentArrayMemmap(tmpdir)
+    dam.extend(docs)
+    dam.flush()
+    del dam[10]
+    del dam[docs[20].id]
+    dam[0] = Document(id='new', text='new')
+    # the stale index is removed on the first delete, and written again on flush
+    assert not os.path.exists(os.path.join(tmpdir, 'header.idx'))
+    if flush:
+        dam.flush()
+    expected = [Document(id='new', text='new')] + [
+        d for i, d in enumerate(docs) if i not in (0, 10, 20)
+    ]
+    _assert_same_docs(DocumentArrayMemmap(tmpdir), expected)
+
+
+def test_memmap_append_existing_id(tmpdir):
+    dam = DocumentArrayMemmap(tmpdir)
+    dam.extend(Document(id=str(i), text='old') for i in range(3))
+    dam.append(Document(id='1', text='new'))
+    expected = [
+        Document(id='0', text='old'),
+        Document(id='2', text='old'),
+        Document(id='1', text='new'),
+    ]
+    _assert_same_docs(dam, expected)
+    _assert_same_docs(DocumentArrayMemmap(tmpdir), expected)
+
+
+def test_memmap_index_grows(tmpdir):
+    from docarray.memmap.index import HeaderIndex
+
+    index = HeaderIndex(key_length=36)
+    keys = [f'key-{i}' for i in range(5000)]
+    for row, key in enumerate(keys):
+        assert index.insert(key, row, lambda r: keys[r]) is None
+    assert len(index._slot_rows) > 5000
+    for row, key in enumerate(keys):
+        assert index.find(key, lambda r: keys[r]) == row
+    assert index.find('missing', lambda r: keys[r]) is None
+
+
+@pytest.mark.parametrize('background', [False, True])
+def test_memmap_compact(tmpdir, background):
+    docs = [Document(text=f'doc {i}' * 10) for i in range(300)]
+    dam = DocumentArrayMemmap(tmpdir, segment_size=4096)
+    dam.extend(docs)
+    assert os.path.exists(os.path.join(tmpdir, 'body.2.bin'))
+    for d in docs[:200]:
+        del dam[d.id]
+    size = dam.physical_size
+
+    thread = dam.compact(background=background)
+    if background:
+        thread.join()
+    assert not os.path.exists(os.path.join(tmpdir, 'body.bin'))
+    assert dam.physical_size < size
+    _assert_same_docs(dam, docs[200:])
+    dam.flush()
+    _assert_same_docs(DocumentArrayMemmap(tmpdir), docs[200:])
+
+
+def test_memmap_auto_compact(tmpdir):
+    docs = [Document(text=f'doc {i}' * 10) for i in range(300)]
+    dam = DocumentArrayMemmap(tmpdir, segment_size=4096, auto_compact=0.5)
+    dam.extend(docs)
+    for i, d in enumerate(docs[:100]):
+        dam[d.id] = Document(id=d.id, text='new')
+    dam._wait_compaction()
+    assert not os.path.exists(os.path.join(tmpdir, 'body.bin'))
+    expected = [Document(id=d.id, text='new') for d in docs[:100]] + docs[100:]
+    _assert_same_docs(dam, expected)
+
+
+def test_memmap_reader_tails_appends(tmpdir, mocker):
+    docs = [Document(text=f'doc {i}') for i in range(100)]
+    writer = DocumentArrayMemmap(tmpdir)
+    writer.extend(docs[:50])
+    reader = DocumentArrayMemmap(tmpdir, read_only=True)
+    _assert_same_docs(reader, docs[:50])
+
+    reload = mocker.spy(reader, 'reload')
+    writer.extend(docs[50:90])
+    for d in docs[90:]:
+        writer.append(d, flush=False)
+    # only the committed rows are visible
+    _assert_same_docs(reader, docs[:90])
+    assert docs[95].id not in reader
+    writer.flush()
+    _assert_same_docs(reader, docs)
+    reload.assert_not_called()
+
+
+def test_memmap_reader_sees_rewrites(tmpdir):
+    docs = [Document(text=f'doc {i}') for i in range(20)]
+    writer = DocumentArrayMemmap(tmpdir, segment_size=128)
+    writer.extend(docs)
+    reader = DocumentArrayMemmap(tmpdir, read_only=True)
+    assert reader[docs[1].id].text == 'doc 1'
+
+    del writer[docs[0].id]
+    writer[docs[1].id] = Document(id=docs[1].id, text='new')
+    assert len(reader) == 19
+    assert reader[docs[1].id].text == 'new'
+
+    writer.compact(min_live_ratio=1.0)
+    _assert_same_docs(reader, writer)
+    writer.clear()
+    assert len(reader) == 0
+
+
+def test_memmap_reader_is_read_only(tmpdir):
+    writer = DocumentArrayMemmap(tmpdir)
+    writer.append(Document(id='a'))
+    reader = DocumentArrayMemmap(tmpdir, read_only=True)
+    with pytest.raises(RuntimeError):
+        reader.append(Document(id='b'))
+    with pytest.raises(RuntimeError):
+        del reader['a']
+    with pytest.raises(RuntimeError):
+        reader.clear()
+    assert 'a' in reader
@@ -3,7 +3,8 @@ import copy
 import numpy as np
 import pytest
 
-from docarray import DocumentArray, Document
+from docarray import DocumentArray, DocumentArrayMemmap, Document
+from docarray.math.evaluation import precision_at_k
 
 
 @pytest.mark.parametrize(
@@ -105,3 +106,48 @@ def test_adding_noise():
 
     for d in da2:
         assert 0.0 < d.evaluations['precision_at_k'].value < 1.0
+
+
+@pytest.mark.parametrize('da_cls', [DocumentArray, DocumentArrayMemmap])
+def test_evaluate_multiple_metrics(tmpdir, da_cls):
+    da = DocumentArray.empty(10)
+    da.embeddings = np.random.random([10, 3])
+    da.match(da, exclude_self=True, limit=5)
+    groundtruth = copy.deepcopy(da)
+    for d in groundtruth:
+        d.matches = d.matches[:2]
+    if da_cls is DocumentArrayMemmap:
+        dam = DocumentArrayMemmap(str(tmpdir))
+        dam.extend(da)
+        da = dam
+
+    r = da.evaluate(
+        groundtruth,
+        metric=['precision_at_k', 'hit_at_k', lambda rel: precision_at_k(rel, 2)],
+        metric_name=['p', 'hit', 'p@2'],
+    )
+    assert r == [0.4, 1.0, 1.0]
+    for d in da:
+        assert d.evaluations['p'].value == pytest.approx(0.4)
+        assert d.evaluations['hit'].value == 1.0
+        assert d.evaluations['p@2'].value == 1.0
+
+
+def test_evaluate_hash_fn():
+    da = DocumentArray.empty(10)
+    da.embeddings = np.random.random([10, 3])
+    da.match(da, exclude_self=True, limit=4)
+    for d in da:
+        d.tags['label'] = d.id
+        for m in d.matches:
+            m.tags['label'] = m.id
+    groundtruth = copy.deepcopy(da)
+    for d in groundtruth:
+        # relevant under another id
+        d.matches = d.matches[1:2]
+        d.matches[0].id = 'other'
+
+    r = da.evaluate(
+        groundtruth, metric='reciprocal_rank', hash_fn=lambda d: d.tags['label']
+    )
+    assert r == 0.5
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from docarray import Document, DocumentArray, DocumentArrayMemmap
+
+
+def _docs():
+    return [
+        Document(
+            id=str(i),
+            embedding=np.array([i, 0, 0]),
+            modality='image' if i % 3 == 0 else 'text',
+            tags={'lang': 'en' if i % 2 else 'de', 'year': 2000 + i},
+        )
+        for i in range(10)
+    ]
+
+
+@pytest.fixture(params=['da', 'dam'])
+def docs(request, tmpdir):
+    if request.param == 'da':
+        return DocumentArray(_docs())
+    dam = DocumentArrayMemmap(str(tmpdir))
+    dam.extend(_docs())
+    return dam
+
+
+@pytest.mark.parametrize('indexed', [False, True])
+@pytest.mark.parametrize(
+    'filter, expected',
+    [
+        ({'tags__lang': 'en'}, ['1', '3', '5', '7', '9']),
+        ({'tags__lang': 'en', 'modality': 'image'}, ['3', '9']),
+        ({'modality': {'$ne': 'image'}, 'tags__lang': 'de'}, ['2', '4', '8']),
+        ({'tags__year': {'$gte': 2004, '$lt': 2007}}, ['4', '5', '6']),
+        ({'tags__year': {'$gt': 2007}}, ['8', '9']),
+        ({'tags__year': {'$lte': 2001}}, ['0', '1']),
+        ({'tags__year': {'$in': [2001, 2003, 1999]}}, ['1', '3']),
+        ({'tags__year': {'$nin': [2001, 2003]}, 'tags__lang': 'en'}, ['5', '7', '9']),
+        ({'tags__missing': None}, [str(i) for i in range(10)]),
+        ({'tags__lang': 'fr'}, []),
+    ],
+)
+def test_find(docs, indexed, filter, expected):
+    if indexed:
+        docs.build_index('modality', 'tags__lang', 'tags__year')
+    assert [d.id for d in docs.find(filter)] == expected
+
+
+def test_find_rebuilds_stale_index(docs):
+    docs.build_index('tags__lang')
+    docs.append(Document(id='10', tags={'lang': 'en'}))
+    del docs['1']
+    assert [d.id for d in docs.find({'tags__lang': 'en'})] == ['3', '5', '7', '9', '10']
+
+
+def test_find_bad_operator(docs):
+    with pytest.raises(ValueError):
+        docs.find({'tags__year': {'$between': [1, 2]}})
+
+
+@pytest.mark.parametrize('indexed', [False, True])
+def test_match_with_filter(docs, indexed):
+    if indexed:
+        docs.build_index('tags__lang')
+    query = DocumentArray([Document(embedding=np.array([4, 0, 0]))])
+    query.match(docs, metric='euclidean', limit=3, filter={'tags__lang': 'en'})
+    assert [m.id for m in query[0].matches] == ['3', '5', '1']
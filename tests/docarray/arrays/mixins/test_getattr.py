@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from docarray import Document, DocumentArray, DocumentArrayMemmap
+
+
+def _docs():
+    docs = []
+    for i in range(6):
+        d = Document(
+            id=str(i),
+            text=f'hello {i}',
+            weight=i / 2,
+            granularity=i,
+            embedding=np.array([i, i + 1]),
+            tags={'year': 2000 + i, 'lang': 'en', 'nested': {'x': i}},
+        )
+        if i % 2:
+            d.scores['cosine'] = i
+            d.tags['odd'] = True
+        docs.append(d)
+    return docs
+
+
+@pytest.fixture(params=['da', 'dam'])
+def docs(request, tmpdir):
+    if request.param == 'da':
+        return DocumentArray(_docs())
+    dam = DocumentArrayMemmap(str(tmpdir))
+    dam.extend(_docs())
+    return dam
+
+
+def test_get_attributes_as_columns(docs):
+    ids, weights, granularity, embeddings = docs.get_attributes(
+        'id', 'weight', 'granularity', 'embedding', as_columns=True
+    )
+    assert ids == [str(i) for i in range(6)]
+    np.testing.assert_array_equal(weights, np.arange(6) / 2)
+    assert weights.dtype == np.float32
+    np.testing.assert_array_equal(granularity, np.arange(6))
+    np.testing.assert_array_equal(embeddings, [[i, i + 1] for i in range(6)])
+    assert docs.get_attributes('text', as_columns=True) == docs.get_attributes('text')
+
+
+def test_get_attributes_as_columns_tags(docs):
+    years = docs.get_attributes('tags__year', as_columns=True)
+    np.testing.assert_array_equal(years, 2000 + np.arange(6))
+    assert docs.get_attributes('tags__lang', as_columns=True) == ['en'] * 6
+    np.testing.assert_array_equal(
+        docs.get_attributes('tags__nested__x', as_columns=True), np.arange(6)
+    )
+    odd = docs.get_attributes('tags__odd', as_columns=True)
+    assert odd == [None, True] * 3
+    assert docs.get_attributes('tags__missing', as_columns=True) == [None] * 6
+
+
+def test_get_attributes_as_columns_scores(docs):
+    np.testing.assert_array_equal(
+        docs.get_attributes('scores__cosine__value', as_columns=True),
+        [np.nan, 1, np.nan, 3, np.nan, 5],
+    )
+    assert docs.get_attributes('scores__cosine__op_name', as_columns=True) == [
+        d.get_attributes('scores__cosine__op_name') for d in docs
+    ]
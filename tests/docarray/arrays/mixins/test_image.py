@@ -0,0 +1,82 @@
+import os
+
+import numpy as np
+import pytest
+
+from docarray import Document, DocumentArray, DocumentArrayMemmap
+from docarray.array.mixins.parallel import WorkerPool
+
+cur_dir = os.path.dirname(os.path.abspath(__file__))
+image_uri = os.path.join(cur_dir, '../../document/test.png')
+
+
+def _expected(d, shape, channel_axis):
+    if d.blob is None:
+        d.load_uri_to_image_blob()
+    if shape:
+        d.set_image_blob_shape(shape)
+    return (
+        d.set_image_blob_normalization()
+        .set_image_blob_channel_axis(-1, channel_axis)
+        .blob
+    )
+
+
+@pytest.mark.parametrize('da_cls', [DocumentArray, DocumentArrayMemmap])
+@pytest.mark.parametrize('shape', [None, (32, 48)])
+@pytest.mark.parametrize('channel_axis', [-1, 0])
+def test_preprocess_images(tmpdir, da_cls, shape, channel_axis):
+    rng = np.random.default_rng(0)
+    docs = [Document(uri=image_uri) for _ in range(5)]
+    size = Document(uri=image_uri).load_uri_to_image_blob().blob.shape
+    if shape:
+        # images of other sizes are resized along
+        size = (20, 30, 3)
+    docs += [
+        Document(blob=rng.integers(0, 256, size, dtype=np.uint8)) for _ in range(4)
+    ]
+    expected = np.stack(
+        [_expected(Document(d, copy=True), shape, channel_axis) for d in docs]
+    )
+
+    da = da_cls() if da_cls is DocumentArray else da_cls(str(tmpdir))
+    da.extend(docs)
+    assert da.preprocess_images(shape, channel_axis=channel_axis, batch_size=4) is da
+    np.testing.assert_array_equal(da.blobs, expected)
+    assert da.blobs.dtype == np.float32
+
+
+def test_preprocess_images_pool():
+    da = DocumentArray(Document(uri=image_uri) for _ in range(3))
+    with WorkerPool('thread', 2) as pool:
+        da.preprocess_images((16, 16), normalize=False, pool=pool)
+    assert da.blobs.shape == (3, 16, 16, 3)
+    assert da.blobs.dtype == np.uint8
+
+    with WorkerPool('process', 1) as pool:
+        with pytest.raises(ValueError):
+            da.preprocess_images(pool=pool)
+
+
+def test_preprocess_images_bad_dtype():
+    da = DocumentArray(Document(blob=np.zeros((4, 4, 3), dtype=np.float32)))
+    with pytest.raises(ValueError):
+        da.preprocess_images()
+
+
+@pytest.mark.parametrize('dtype', [np.uint8, np.float32])
+@pytest.mark.parametrize('strides', [None, (2, 3)])
+def test_sliding_windows(dtype, strides):
+    blob = np.arange(10 * 12 * 3).reshape((10, 12, 3)).astype(dtype)
+    d = Document(blob=blob, location=[1, 2])
+    d.convert_image_blob_to_sliding_windows((4, 4), strides=strides, as_chunks=True)
+    stride_h, stride_w = strides or (4, 4)
+    expected = [
+        (h, w)
+        for h in range(0, 10 - 4 + 1, stride_h)
+        for w in range(0, 12 - 4 + 1, stride_w)
+    ]
+    assert len(d.chunks) == len(expected)
+    for c, (h, w) in zip(d.chunks, expected):
+        assert list(c.location) == [h + 1, w + 2, 4, 4]
+        np.testing.assert_array_equal(c.blob, blob[h : h + 4, w : w + 4])
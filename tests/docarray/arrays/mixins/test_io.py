@@ -113,3 +113,55 @@ def test_push_pull_io(da_cls, show_progress):
 
     assert len(da1) == len(da2) == 10
     assert da1.texts == da2.texts == random_texts
+
+
+@pytest.mark.parametrize('backend', ['thread', 'process'])
+@pytest.mark.parametrize('da', [DocumentArray, DocumentArrayMemmap])
+def test_from_files_parallel(tmpdir, backend, da):
+    for i in range(600):
+        with open(os.path.join(tmpdir, f'{i:04d}.txt'), 'w') as fp:
+            fp.write(f'hello {i}')
+    pattern = os.path.join(tmpdir, '*.txt')
+    expected = da.from_files(pattern, read_mode='r')
+    _da = da.from_files(pattern, read_mode='r', num_worker=2, backend=backend)
+    assert len(_da) == 600
+    assert _da.get_attributes('uri', 'text') == expected.get_attributes('uri', 'text')
+
+
+@pytest.mark.parametrize('backend', ['thread', 'process'])
+def test_from_ndjson_parallel(backend):
+    lines = [
+        '{"document": {"text": "q%d"}, "groundtruth": {"text": "g%d"}}' % (i, i)
+        if i % 2
+        else '{"text": "d%d"}' % i
+        for i in range(600)
+    ]
+    from docarray.document.generators import from_ndjson
+
+    docs = list(from_ndjson(lines, num_worker=2, backend=backend))
+    assert len(docs) == 600
+    for i, d in enumerate(docs):
+        if i % 2:
+            assert [d[0].text, d[1].text] == [f'q{i}', f'g{i}']
+        else:
+            assert d.text == f'd{i}'
+
+
+@pytest.mark.parametrize('backend', ['thread', 'process'])
+def test_from_csv_parallel(tmpdir, backend):
+    path = os.path.join(tmpdir, 'docs.csv')
+    with open(path, 'w') as fp:
+        fp.write('text,tag\n')
+        fp.writelines(f'hello {i},{i}\n' for i in range(600))
+    _da = DocumentArray.from_csv(path, num_worker=2, backend=backend, size=500)
+    assert _da.texts == [f'hello {i}' for i in range(500)]
+
+
+def test_dam_extend_update_buffer(tmpdir):
+    from docarray import Document
+
+    dam = DocumentArrayMemmap(str(tmpdir), buffer_pool_size=10)
+    dam.append(Document(id='a', text='old'))
+    dam.extend([Document(id='a', text='new')], update_buffer=False)
+    assert dam['a'].text == 'new'
+    assert len(dam) == 1
@@ -0,0 +1,68 @@
+import os
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from docarray import Document, DocumentArray, DocumentArrayMemmap
+
+
+def _docs(n, seed):
+    mat = sp.random(n, 100, density=0.1, format='csr', random_state=seed)
+    return [Document(id=f'{seed}-{i}', embedding=mat[i]) for i in range(n)]
+
+
+@pytest.fixture(params=['da', 'dam'])
+def index_docs(request, tmpdir):
+    if request.param == 'da':
+        return DocumentArray(_docs(200, 0))
+    dam = DocumentArrayMemmap(str(tmpdir))
+    dam.extend(_docs(200, 0))
+    return dam
+
+
+def _match_ids(da):
+    return [[m.id for m in d.matches] for d in da]
+
+
+def _match_scores(da):
+    return [[m.scores['dot'].value for m in d.matches] for d in da]
+
+
+def test_match_use_index_equals_brute_force(index_docs):
+    queries = DocumentArray(_docs(10, 1))
+    expected = DocumentArray(_docs(10, 1))
+    expected.match(index_docs, metric='dot', limit=5)
+    queries.match(index_docs, metric='dot', limit=5, use_index=True)
+    for exp_scores, scores in zip(_match_scores(expected), _match_scores(queries)):
+        # the index never returns Documents without any overlap, i.e. of score 0
+        exp_scores = [s for s in exp_scores if s != 0]
+        np.testing.assert_allclose(scores[: len(exp_scores)], exp_scores)
+
+
+def test_match_use_index_rebuilt_on_change(index_docs):
+    query = DocumentArray([Document(embedding=sp.csr_matrix(np.ones((1, 100))))])
+    query.match(index_docs, metric='dot', limit=1, use_index=True)
+    top = Document(id='top', embedding=sp.csr_matrix(np.full((1, 100), 10.0)))
+    index_docs.append(top)
+    query.match(index_docs, metric='dot', limit=1, use_index=True)
+    assert query[0].matches[0].id == 'top'
+
+
+def test_match_use_index_persisted_with_dam(tmpdir):
+    dam = DocumentArrayMemmap(str(tmpdir))
+    dam.extend(_docs(50, 0))
+    queries = DocumentArray(_docs(5, 1))
+    queries.match(dam, metric='dot', limit=3, use_index=True)
+    expected = _match_ids(queries)
+    assert os.path.exists(os.path.join(str(tmpdir), 'sparse_index.npz'))
+
+    reopened = DocumentArrayMemmap(str(tmpdir))
+    queries.match(reopened, metric='dot', limit=3, use_index=True)
+    assert _match_ids(queries) == expected
+
+
+def test_match_use_index_requires_dot():
+    da = DocumentArray(_docs(5, 0))
+    with pytest.raises(ValueError):
+        da.match(da, metric='cosine', use_index=True)
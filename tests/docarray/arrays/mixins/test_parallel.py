@@ -95,3 +95,50 @@ def test_map_lambda(pytestconfig, da_cls):
 
     for d in da.map(lambda x: x.load_uri_to_image_blob()):
         assert d.blob is not None
+
+
+def upper(d: Document):
+    d.text = d.text.upper()
+    return d
+
+
+def text_length(d: Document):
+    return len(d.text)
+
+
+def upper_batch(da: DocumentArray):
+    for d in da:
+        upper(d)
+    return da
+
+
+@pytest.mark.parametrize('da_cls', [DocumentArray, DocumentArrayMemmap])
+@pytest.mark.parametrize('backend', ['process', 'thread'])
+def test_worker_pool_reused(tmpdir, da_cls, backend):
+    from docarray.array.mixins.parallel import WorkerPool
+
+    with WorkerPool(backend, num_worker=2) as pool:
+        for j in range(2):
+            da = da_cls() if da_cls is DocumentArray else da_cls(f'{tmpdir}/{j}')
+            da.extend(Document(text=f'doc {i}') for i in range(100))
+            assert list(da.map(text_length, pool=pool)) == [
+                len(f'doc {i}') for i in range(100)
+            ]
+            doc = da[10]
+            da.apply(upper, pool=pool)
+            assert da.texts == [f'DOC {i}' for i in range(100)]
+            if da_cls is DocumentArray:
+                # written back in place
+                assert doc.text == 'DOC 10'
+            batches = list(da.map_batch(upper_batch, batch_size=30, pool=pool))
+            assert [len(b) for b in batches] == [30, 30, 30, 10]
+            assert isinstance(batches[0], DocumentArray)
+
+
+def test_worker_pool_rejects_lambda():
+    from docarray.array.mixins.parallel import WorkerPool
+
+    da = DocumentArray(Document(text='hello') for _ in range(3))
+    with WorkerPool(num_worker=1) as pool:
+        with pytest.raises(ValueError):
+            list(da.map(lambda d: d, pool=pool))
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from docarray import Document, DocumentArray, DocumentArrayMemmap
+
+
+@pytest.fixture
+def embeddings():
+    rng = np.random.default_rng(0)
+    return rng.standard_normal((100, 4)) @ rng.standard_normal((4, 32))
+
+
+@pytest.mark.parametrize('da_cls', [DocumentArray, DocumentArrayMemmap])
+def test_reduce_dim(tmpdir, da_cls, embeddings):
+    da = da_cls() if da_cls is DocumentArray else da_cls(str(tmpdir))
+    da.extend(Document(id=str(i), embedding=e) for i, e in enumerate(embeddings))
+    pca = da.reduce_dim(4, batch_size=16)
+    assert da.embeddings.shape == (100, 4)
+    np.testing.assert_allclose(da.embeddings, pca.transform(embeddings), atol=1e-6)
+
+    queries = DocumentArray(Document(embedding=e) for e in embeddings[:3])
+    assert queries.reduce_dim(4, pca=pca) is pca
+    np.testing.assert_allclose(queries.embeddings, da.embeddings[:3], atol=1e-6)
+    if da_cls is DocumentArrayMemmap:
+        da.flush()
+        assert DocumentArrayMemmap(str(tmpdir)).embeddings.shape == (100, 4)
+
+
+def test_reduce_dim_needs_numpy():
+    da = DocumentArray(Document(text='hello') for _ in range(3))
+    with pytest.raises(ValueError):
+        da.reduce_dim(2)
@@ -97,3 +97,26 @@ def test_convert_text_blob_random_text(da):
 
     assert texts
     assert da.texts == texts
+
+
+@pytest.mark.parametrize('da', da_and_dam())
+def test_da_vocabulary_num_worker(da):
+    da.extend(Document(text=f'word{i % 7} hello, world{i}') for i in range(50))
+    vocab = da.get_vocabulary()
+    assert da.get_vocabulary(num_worker=2) == vocab
+    assert list(da.get_vocabulary(num_worker=2)) == list(vocab)
+    assert da.get_vocabulary(2, num_worker=2) == da.get_vocabulary(2)
+
+
+@pytest.mark.parametrize('da', da_and_dam())
+def test_da_texts_to_sparse(da):
+    da.append(Document(text='hello hello unknown'))
+    vocab = da.get_vocabulary(min_freq=2)
+    assert da.texts_to_sparse(vocab) is da
+    embeddings = da.embeddings
+    assert embeddings.shape == (4, 4)
+    np.testing.assert_array_equal(
+        embeddings.toarray(),
+        [[0, 0, 1, 0], [0, 0, 1, 1], [0, 0, 0, 1], [0, 0, 2, 0]],
+    )
+    assert embeddings.dtype == np.float32
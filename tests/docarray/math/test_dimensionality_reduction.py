@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from docarray.math.dimensionality_reduction import PCA, IncrementalPCA, top_eigh
+
+
+@pytest.fixture
+def x_mat():
+    rng = np.random.default_rng(0)
+    # strong correlations, far from the origin
+    return rng.standard_normal((500, 8)) @ rng.standard_normal((8, 64)) + 1000
+
+
+def _sklearn_like_pca(x_mat, n_components):
+    x_mat = x_mat - x_mat.mean(axis=0)
+    _, s, vt = np.linalg.svd(x_mat, full_matrices=False)
+    return s[:n_components] ** 2 / (len(x_mat) - 1), vt[:n_components].T
+
+
+@pytest.mark.parametrize('n_components', [2, 8, 40])
+def test_incremental_pca(x_mat, n_components):
+    pca = IncrementalPCA(n_components)
+    for start in range(0, len(x_mat), 64):
+        pca.partial_fit(x_mat[start : start + 64])
+    projected = pca.transform(x_mat)
+    assert projected.shape == (len(x_mat), n_components)
+
+    e_values, e_vectors = _sklearn_like_pca(x_mat, n_components)
+    np.testing.assert_allclose(pca.explained_variance[:8], e_values[:8], rtol=1e-6)
+    # same subspace, up to signs
+    np.testing.assert_allclose(
+        np.abs(pca.components[:, :8].T @ e_vectors[:, :8]).diagonal(), 1, rtol=1e-6
+    )
+    np.testing.assert_allclose(projected.mean(axis=0), 0, atol=1e-6)
+    np.testing.assert_allclose(
+        IncrementalPCA(n_components).fit_transform(x_mat), projected, atol=1e-6
+    )
+
+
+def test_incremental_pca_whiten_dtype(x_mat):
+    projected = IncrementalPCA(2, whiten=True).fit_transform(x_mat.astype(np.float32))
+    assert projected.dtype == np.float32
+    np.testing.assert_allclose(projected.std(axis=0, ddof=1), 1, rtol=1e-3)
+
+
+def test_incremental_pca_not_enough_observations(x_mat):
+    with pytest.raises(ValueError):
+        IncrementalPCA(2).fit(x_mat[:1])
+
+
+def test_top_eigh_randomized():
+    rng = np.random.default_rng(1)
+    basis, _ = np.linalg.qr(rng.standard_normal((200, 200)))
+    # a few strong directions over noise, as in embeddings
+    e_values = np.concatenate([[100, 50, 20, 10, 5], np.geomspace(1, 1e-3, 195)])
+    sym_mat = (basis * e_values) @ basis.T
+    values, vectors = top_eigh(sym_mat, 3)
+    np.testing.assert_allclose(values, e_values[:3], rtol=1e-8)
+    np.testing.assert_allclose(np.abs(vectors.T @ basis[:, :3]).diagonal(), 1)
+
+
+def test_pca_real_eigenvalues(x_mat):
+    pca = PCA(n_components=2)
+    pca.fit(x_mat)
+    assert not np.iscomplexobj(pca.e_values)
+    assert not np.iscomplexobj(pca.w)
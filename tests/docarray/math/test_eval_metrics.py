@@ -2,6 +2,10 @@
 # the original code is licensed under Apache-2.0
 
 
+import numpy as np
+import pytest
+
+from docarray.math import evaluation
 from docarray.math.evaluation import (
     hit_at_k,
     r_precision,
@@ -145,3 +149,34 @@ def test_ndcg_at_k():
     ndcg_k = ndcg_at_k([1], k=2)
 
     assert NDCG_K_VAL == ndcg_k
+
+
+@pytest.mark.parametrize(
+    'metric, kwargs',
+    [
+        ('r_precision', {}),
+        ('precision_at_k', {}),
+        ('precision_at_k', {'k': 3}),
+        ('hit_at_k', {'k': 2}),
+        ('average_precision', {}),
+        ('reciprocal_rank', {}),
+        ('recall_at_k', {'max_rel': 12, 'k': 5}),
+        ('f1_score_at_k', {'max_rel': 12}),
+        ('dcg_at_k', {'method': 1, 'k': 4}),
+        ('ndcg_at_k', {}),
+        ('ndcg_at_k', {'method': 1, 'k': 3}),
+    ],
+)
+def test_batch_metrics(metric, kwargs):
+    rng = np.random.default_rng(0)
+    num_matches = rng.integers(1, 12, 50)
+    relevance = np.zeros((50, 12), dtype=bool)
+    for r, n in zip(relevance, num_matches):
+        r[:n] = rng.random(n) < 0.3
+
+    values = evaluation._BATCH_METRICS[metric](relevance, num_matches, **kwargs)
+    expected = [
+        getattr(evaluation, metric)(r[:n].astype(int).tolist(), **kwargs)
+        for r, n in zip(relevance, num_matches)
+    ]
+    np.testing.assert_allclose(values, expected)
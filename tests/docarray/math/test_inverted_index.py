@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from docarray.math.distance import cdist
+from docarray.math.inverted_index import SparseInvertedIndex
+
+
+def _random_sparse(n, dim, density, seed, negative=False):
+    mat = sp.random(n, dim, density=density, format='csr', random_state=seed)
+    if negative:
+        mat.data -= 0.5
+    return mat
+
+
+def _brute_force(x_mat, y_mat, limit):
+    scores = np.asarray(x_mat.dot(y_mat.T).todense())
+    overlap = np.asarray((abs(x_mat) > 0).dot((abs(y_mat) > 0).T).todense()) > 0
+    expected = []
+    for row, mask in zip(scores, overlap):
+        candidates = np.flatnonzero(mask)
+        expected.append(candidates[np.argsort(-row[candidates], kind='stable')][:limit])
+    return scores, expected
+
+
+@pytest.mark.parametrize('negative', [False, True])
+@pytest.mark.parametrize('limit', [1, 5, 50])
+def test_inverted_index_search_is_exact(negative, limit):
+    y_mat = _random_sparse(300, 200, 0.05, 0, negative)
+    x_mat = _random_sparse(20, 200, 0.05, 1, negative)
+    index = SparseInvertedIndex(y_mat)
+    dists, idx = index.search(x_mat, limit)
+    scores, expected = _brute_force(x_mat, y_mat, limit)
+    for i, (d, rows) in enumerate(zip(dists, idx)):
+        assert len(rows) == len(expected[i])
+        np.testing.assert_allclose(-d, scores[i, rows])
+        # ties may be broken differently, compare the scores
+        np.testing.assert_allclose(
+            np.sort(scores[i, rows]), np.sort(scores[i, expected[i]])
+        )
+        assert np.all(np.diff(d) >= 0)
+
+
+def test_inverted_index_no_overlap():
+    index = SparseInvertedIndex(sp.csr_matrix([[1.0, 0, 0], [0, 2.0, 0]]))
+    dists, idx = index.search(sp.csr_matrix([[0, 0, 1.0], [0, 1.0, 0]]), 5)
+    assert len(idx[0]) == 0
+    assert idx[1].tolist() == [1]
+    assert dists[1].tolist() == [-2.0]
+
+
+def test_inverted_index_save_load(tmpdir):
+    y_mat = _random_sparse(50, 30, 0.1, 0)
+    x_mat = _random_sparse(5, 30, 0.1, 1)
+    ids = [str(i) for i in range(50)]
+    index = SparseInvertedIndex(y_mat, ids)
+    path = str(tmpdir / 'index.npz')
+    index.save(path)
+    loaded = SparseInvertedIndex.load(path)
+    assert loaded.ids == ids
+    for a, b in zip(index.search(x_mat, 3), loaded.search(x_mat, 3)):
+        for x, y in zip(a, b):
+            np.testing.assert_array_equal(x, y)
+
+
+def test_inverted_index_query_too_wide():
+    index = SparseInvertedIndex(sp.csr_matrix(np.eye(3)))
+    with pytest.raises(ValueError):
+        index.search(sp.csr_matrix(np.ones((1, 4))), 1)
+
+
+@pytest.mark.parametrize('to_sparse', [np.array, sp.csr_matrix])
+def test_cdist_dot(to_sparse):
+    x_mat = np.array([[1.0, 2.0], [0, 1.0]])
+    y_mat = np.array([[3.0, 0], [1.0, 1.0], [0, 0]])
+    np.testing.assert_allclose(
+        cdist(to_sparse(x_mat), to_sparse(y_mat), 'dot'), -x_mat @ y_mat.T
+    )
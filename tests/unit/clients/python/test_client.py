@@ -4,7 +4,7 @@ import time
 import pytest
 import requests
 
-from jina import Executor, DocumentArray, requests as req
+from jina import Executor, DocumentArray, DocumentArrayMemmap, requests as req
 from jina import Flow, __windows__
 from jina import helper
 from jina.clients import Client
@@ -233,3 +233,41 @@ def test_all_sync_clients(protocol, mocker):
     m2.assert_called()
     m3.assert_called_once()
     m4.assert_called()
+
+
+@pytest.mark.parametrize('keep_order', [False, True])
+def test_client_multiple_connections(keep_order):
+    docs = list(random_docs(100))
+    with Flow().add(uses=MyExec) as f:
+        c = Client(
+            host='localhost',
+            port=f.port_expose,
+            connections=4,
+            keep_order=keep_order,
+        )
+        responses = c.post('/foo', docs, request_size=10, return_results=True)
+
+    assert len(responses) == 10
+    returned_ids = [d.id for r in responses for d in r.docs]
+    if keep_order:
+        assert returned_ids == [d.id for d in docs]
+    else:
+        assert sorted(returned_ids) == sorted(d.id for d in docs)
+
+
+def test_client_results_to(tmpdir, mocker):
+    docs = list(random_docs(50))
+    on_done = mocker.Mock()
+    with Flow().add(uses=MyExec) as f:
+        c = Client(host='localhost', port=f.port_expose)
+        dam = c.post('/foo', docs, request_size=10, results_to=str(tmpdir))
+        # sending the same Documents again doesn't duplicate them
+        c.post('/foo', docs[:10], on_done=on_done, results_to=str(tmpdir))
+
+    on_done.assert_called_once()
+    assert len(dam) == 50
+    assert len(DocumentArrayMemmap(str(tmpdir))) == 50
+    # Responses are written as they arrive, not necessarily in the order of the Requests
+    assert sorted(d.id for d in DocumentArrayMemmap(str(tmpdir))) == sorted(
+        d.id for d in docs
+    )
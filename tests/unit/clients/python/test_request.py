@@ -225,3 +225,28 @@ def test_request_generate_numpy_arrays_iterator():
     assert len(request.docs) == 5
     for index, doc in enumerate(request.docs, 1):
         assert doc.blob.shape == (10,)
+
+
+@pytest.mark.parametrize('backend', ['thread', 'process'])
+def test_request_generate_in_pool_keeps_order(backend):
+    def generator():
+        for i in range(103):
+            yield f'text {i}'
+
+    reqs = list(
+        request_generator(
+            '/index',
+            data=generator(),
+            request_size=10,
+            num_worker=2,
+            backend=backend,
+            parameters={'hello': 'world'},
+        )
+    )
+
+    assert len(reqs) == 11
+    assert len(reqs[-1].docs) == 3
+    texts = [doc.text for req in reqs for doc in req.docs]
+    assert texts == [f'text {i}' for i in range(103)]
+    assert reqs[0].header.exec_endpoint == '/index'
+    assert reqs[0].parameters['hello'] == 'world'
@@ -55,3 +55,92 @@ def test_async_requests():
     assert not iscoroutinefunction(getattr(fn_2, 'fn'))
     assert hasattr(fn_3, 'fn')
     assert iscoroutinefunction(getattr(fn_3, 'fn'))
+
+
+class CachedEncoder:
+    def __init__(self):
+        self.num_encoded = 0
+        self.workspace = None
+
+    @requests(cache=2)
+    def encode(self, docs, **kwargs):
+        for d in docs:
+            self.num_encoded += 1
+            d.tags['encoded'] = d.text.upper()
+
+    @requests(on='/new', cache=True)
+    async def encode_new(self, docs, **kwargs):
+        from jina import DocumentArray, Document
+
+        self.num_encoded += len(docs)
+        return DocumentArray(Document(id=d.id, text=d.text * 2) for d in docs)
+
+
+def _docs(*texts):
+    from jina import DocumentArray, Document
+
+    return DocumentArray(Document(text=t) for t in texts)
+
+
+def test_requests_cache_in_place():
+    executor = CachedEncoder()
+    executor.encode(docs=_docs('a', 'b'), parameters={})
+    assert executor.num_encoded == 2
+
+    docs = _docs('b', 'c', 'b')
+    ids = [d.id for d in docs]
+    assert executor.encode(docs=docs, parameters={}) is None
+    # only `c` is sent to the function
+    assert executor.num_encoded == 3
+    assert [d.id for d in docs] == ids
+    assert [d.tags['encoded'] for d in docs] == ['B', 'C', 'B']
+
+    # other parameters, other outputs
+    executor.encode(docs=_docs('b'), parameters={'foo': 'bar'})
+    assert executor.num_encoded == 4
+
+    # `a` got evicted
+    executor.encode(docs=_docs('a'), parameters={})
+    assert executor.num_encoded == 5
+
+
+@pytest.mark.asyncio
+async def test_requests_cache_returned_docs():
+    executor = CachedEncoder()
+    await executor.encode_new(docs=_docs('a'), parameters={})
+    docs = _docs('x', 'a')
+    r_docs = await executor.encode_new(docs=docs, parameters={})
+    assert executor.num_encoded == 2
+    assert [d.text for d in r_docs] == ['xx', 'aa']
+    assert [d.id for d in r_docs] == [d.id for d in docs]
+
+
+def test_requests_cache_on_disk(tmpdir):
+    def _encoder():
+        class DiskEncoder(CachedEncoder):
+            @requests(cache={'on_disk': True, 'fields': ('text',)})
+            def encode(self, docs, **kwargs):
+                self.num_encoded += len(docs)
+                for d in docs:
+                    d.embedding = [len(d.text)]
+
+        executor = DiskEncoder()
+        executor.workspace = str(tmpdir)
+        return executor
+
+    _encoder().encode(docs=_docs('abc'), parameters={})
+
+    # a restarted Executor still finds it
+    executor = _encoder()
+    docs = _docs('abc')
+    executor.encode(docs=docs, parameters={})
+    assert executor.num_encoded == 0
+    assert docs[0].embedding.tolist() == [3]
+
+
+def test_requests_cache_bad_argument():
+    with pytest.raises(TypeError):
+
+        @requests(cache='yes')
+        def fn(*args, **kwargs):
+            pass
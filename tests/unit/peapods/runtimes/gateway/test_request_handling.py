@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+from jina import Document
+from jina.peapods.runtimes.gateway.request_handling import _coalesce_requests
+from jina.types.request.data import DataRequest
+
+
+def _create_request(text, endpoint='/search', parameters=None):
+    req = DataRequest()
+    req.header.exec_endpoint = endpoint
+    if parameters:
+        req.parameters = parameters
+    req.docs.append(Document(text=text))
+    return req
+
+
+@pytest.mark.asyncio
+async def test_coalesce_identical_requests():
+    handled = []
+
+    def _handle(request):
+        handled.append(request)
+
+        async def _respond():
+            await asyncio.sleep(0.1)
+            request.docs[0].tags['answer'] = request.docs[0].text
+            return request
+
+        return asyncio.ensure_future(_respond())
+
+    handle = _coalesce_requests(_handle)
+    requests = [
+        _create_request('hello'),
+        _create_request('hello'),
+        _create_request('hello', parameters={'top_k': 3}),
+        _create_request('hello', endpoint='/index'),
+        _create_request('world'),
+    ]
+    responses = await asyncio.gather(*[handle(r) for r in requests])
+
+    assert len(handled) == 4
+    for req, resp in zip(requests, responses):
+        assert resp.header.request_id == req.header.request_id
+        assert resp.docs[0].id == req.docs[0].id
+        assert resp.docs[0].tags['answer'] == req.docs[0].text
+
+    # once the response is back, the same request goes into the Flow again
+    await handle(_create_request('hello'))
+    assert len(handled) == 5
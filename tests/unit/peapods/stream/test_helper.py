@@ -37,3 +37,22 @@ async def test_iter_requests():
     task.cancel()
     # ideally count will be 20, but to avoid flaky CI
     assert count > 15
+
+
+@pytest.mark.asyncio
+async def test_iter_requests_in_chunks(mocker):
+    num_requests = 1000
+    iter = request_generator(
+        exec_endpoint='/',
+        data=(Document(id=i) for i in range(num_requests)),
+        request_size=1,
+    )
+    requests_iterator = AsyncRequestsIterator(iter, max_chunk_size=32)
+    spy = mocker.spy(requests_iterator, 'iterator__next_chunk__')
+
+    ids = [r.docs[0].id async for r in requests_iterator]
+
+    assert ids == [str(i) for i in range(num_requests)]
+    # a cheap generator is pulled in growing chunks, not one executor hop per request
+    assert spy.call_count < num_requests / 10
+    assert all(call.args[0] <= 32 for call in spy.call_args_list)
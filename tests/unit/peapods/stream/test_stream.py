@@ -77,3 +77,168 @@ async def test_request_streamer(prefetch, num_requests, async_iterator):
         assert r.docs[0].tags['result_handled']
 
     assert num_responses == num_requests
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('prefetch', [0, 3])
+@pytest.mark.parametrize('prefetch_global', [0, 2])
+@pytest.mark.parametrize('num_requests', [1, 13])
+@pytest.mark.parametrize('async_iterator', [False, True])
+async def test_request_streamer_with_credits(
+    prefetch, prefetch_global, num_requests, async_iterator
+):
+    in_flight = []
+    max_in_flight = []
+
+    def request_handler_fn(request):
+        in_flight.append(request)
+        max_in_flight.append(len(in_flight))
+
+        async def task():
+            await asyncio.sleep(0.05)
+            in_flight.remove(request)
+            return request
+
+        return asyncio.ensure_future(task())
+
+    def _get_sync_requests_iterator(num_requests):
+        for i in range(num_requests):
+            req = DataRequest()
+            req.header.request_id = random_identity()
+            req.docs.append(Document())
+            yield req
+
+    async def _get_async_requests_iterator(num_requests):
+        for req in _get_sync_requests_iterator(num_requests):
+            yield req
+
+    args = Namespace()
+    args.prefetch = prefetch
+    args.prefetch_adaptive = True
+    args.prefetch_global = prefetch_global
+    streamer = RequestStreamer(
+        args=args,
+        request_handler=request_handler_fn,
+        result_handler=lambda r: r,
+    )
+
+    it = (
+        _get_async_requests_iterator(num_requests)
+        if async_iterator
+        else _get_sync_requests_iterator(num_requests)
+    )
+    request_ids = [r.header.request_id async for r in streamer.stream(it)]
+
+    assert len(set(request_ids)) == num_requests
+    for limit in (prefetch, prefetch_global):
+        if limit:
+            assert max(max_in_flight) <= limit
+
+
+@pytest.mark.asyncio
+async def test_adaptive_window():
+    from jina.peapods.stream.helper import AdaptiveWindow
+
+    window = AdaptiveWindow(max_window=8)
+    assert window.window == 1
+    for _ in range(20):
+        window.update(0.01)
+    assert window.window == 8
+
+    window.update(1.0)
+    assert window.window == 4
+
+    await window.acquire()
+    await window.acquire()
+    assert window.in_flight == 2
+    window.release()
+    assert window.in_flight == 1
+
+
+def _get_requests(num_requests):
+    for _ in range(num_requests):
+        req = DataRequest()
+        req.header.request_id = random_identity()
+        req.docs.append(Document())
+        yield req
+
+
+def _get_credit_streamer(request_handler_fn, **kwargs):
+    args = Namespace()
+    args.prefetch = kwargs.get('prefetch', 0)
+    args.prefetch_adaptive = kwargs.get('prefetch_adaptive', False)
+    args.prefetch_global = kwargs.get('prefetch_global', 0)
+    return RequestStreamer(
+        args=args,
+        request_handler=request_handler_fn,
+        result_handler=lambda r: r,
+    )
+
+
+@pytest.mark.asyncio
+async def test_request_streamer_idle_stream_holds_no_global_credit():
+    def request_handler_fn(request):
+        async def task():
+            await asyncio.sleep(0.01)
+            return request
+
+        return asyncio.ensure_future(task())
+
+    streamer = _get_credit_streamer(request_handler_fn, prefetch_global=1)
+    client_done = asyncio.Event()
+
+    async def _idle_requests_iterator():
+        for req in _get_requests(1):
+            yield req
+        # a connected client which doesn't send anything for now
+        await client_done.wait()
+
+    async def _consume_idle():
+        return [r async for r in streamer.stream(_idle_requests_iterator())]
+
+    idle_task = asyncio.create_task(_consume_idle())
+    await asyncio.sleep(0.1)
+
+    responses = await asyncio.wait_for(
+        _consume([r async for r in streamer.stream(_get_requests(10))]), 5
+    )
+    assert len(responses) == 10
+
+    client_done.set()
+    assert len(await idle_task) == 1
+
+
+async def _consume(responses):
+    return responses
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('fail_in', ['iterator', 'handler'])
+async def test_request_streamer_with_credits_raises(fail_in):
+    def request_handler_fn(request):
+        if fail_in == 'handler':
+            raise ValueError('handler failed')
+        return asyncio.ensure_future(asyncio.sleep(0.01, result=request))
+
+    def _failing_requests_iterator():
+        yield from _get_requests(2)
+        if fail_in == 'iterator':
+            raise ValueError('iterator failed')
+
+    streamer = _get_credit_streamer(
+        request_handler_fn, prefetch_adaptive=True, prefetch_global=1
+    )
+    with pytest.raises(ValueError):
+        await asyncio.wait_for(
+            _consume([r async for r in streamer.stream(_failing_requests_iterator())]),
+            5,
+        )
+
+    # no credit is leaked for the following streams
+    streamer._request_handler = lambda request: asyncio.ensure_future(
+        asyncio.sleep(0, result=request)
+    )
+    responses = await asyncio.wait_for(
+        _consume([r async for r in streamer.stream(_get_requests(3))]), 5
+    )
+    assert len(responses) == 3
@@ -11,6 +11,7 @@ from jina import DocumentArray, Document
 from jina.clients.request import request_generator
 from jina.enums import PollingType
 from jina.helper import random_port
+from jina.peapods import networking
 from jina.peapods.networking import ReplicaList, GrpcConnectionPool
 from jina.proto import jina_pb2_grpc
 from jina.types.request.control import ControlRequest
@@ -370,6 +371,187 @@ async def test_secure_send_request(private_key_cert_chain):
     server_process1.join()
 
 
+@pytest.mark.asyncio
+@pytest.mark.slow
+@pytest.mark.timeout(5)
+async def test_send_request_reuses_channel(mocker):
+    server_ready_event = multiprocessing.Event()
+
+    def listen(port, event: multiprocessing.Event):
+        class DummyServer:
+            async def process_control(self, request, *args):
+                return ControlRequest(command='DEACTIVATE')
+
+        async def start_grpc_server():
+            grpc_server = grpc.aio.server()
+            jina_pb2_grpc.add_JinaControlRequestRPCServicer_to_server(
+                DummyServer(), grpc_server
+            )
+            grpc_server.add_insecure_port(f'localhost:{port}')
+            await grpc_server.start()
+            event.set()
+            await grpc_server.wait_for_termination()
+
+        asyncio.run(start_grpc_server())
+
+    port = random_port()
+    server_process = Process(target=listen, args=(port, server_ready_event))
+    server_process.start()
+    server_ready_event.wait()
+
+    await GrpcConnectionPool.close_cached_channels()
+    get_channel = mocker.spy(GrpcConnectionPool, 'get_grpc_channel')
+    sent_msg = ControlRequest(command='STATUS')
+    for _ in range(3):
+        result = GrpcConnectionPool.send_request_sync(sent_msg, f'localhost:{port}')
+        assert result.command == 'DEACTIVATE'
+        result = await GrpcConnectionPool.send_request_async(
+            sent_msg, f'localhost:{port}'
+        )
+        assert result.command == 'DEACTIVATE'
+    # one sync & one async channel
+    assert get_channel.call_count == 2
+
+    server_process.kill()
+    server_process.join()
+
+    # an unavailable target evicts its channel, the next request reconnects
+    with pytest.raises(grpc.RpcError):
+        await GrpcConnectionPool.send_request_async(sent_msg, f'localhost:{port}')
+    with pytest.raises(grpc.RpcError):
+        GrpcConnectionPool.send_request_sync(sent_msg, f'localhost:{port}')
+    assert not networking._async_channels.pop_all()
+    assert not networking._sync_channels.pop_all()
+    await GrpcConnectionPool.close_cached_channels()
+
+
+def test_channel_cache_evicts_idle_channels(mocker, monkeypatch):
+    cache = networking._ChannelCache()
+    channel1, channel2 = mocker.Mock(), mocker.Mock()
+
+    assert cache.get('a', lambda: channel1) == (channel1, [])
+    assert cache.get('a', lambda: channel2) == (channel1, [])
+    monkeypatch.setattr(networking, 'CHANNEL_IDLE_TIMEOUT', -1)
+    assert cache.get('b', lambda: channel2) == (channel2, [('a', channel1)])
+
+    assert not cache.evict('b', channel1)
+    assert cache.evict('b', channel2)
+    assert cache.pop_all() == []
+
+    # a cached channel found unhealthy is replaced
+    cache.get('a', lambda: channel1)
+    assert cache.get('a', lambda: channel2, is_healthy=lambda c: False) == (
+        channel2,
+        [('a', channel1)],
+    )
+
+
+def test_adaptive_compressor():
+    import numpy as np
+
+    from jina.enums import CompressAlgo
+    from jina.types.request.compression import is_available, is_compressed
+    from jina.types.request.data import DataRequest
+
+    request = _create_test_data_message()
+    request.docs.embeddings = np.zeros((10, 1024), dtype='float32')
+    expected = request.proto.SerializeToString()
+
+    local = networking.AdaptiveCompressor('localhost:53', CompressAlgo.AUTO)
+    assert not local.enabled
+    assert local.compress(request) is request
+
+    for algo in (CompressAlgo.AUTO, CompressAlgo.ZLIB):
+        compressor = networking.AdaptiveCompressor('1.1.1.1:53', algo)
+        if not compressor.enabled:
+            assert not is_available(CompressAlgo.LZ4)
+            continue
+        sent = compressor.compress(request)
+        assert is_compressed(sent.buffer)
+        assert len(sent.buffer) < len(expected)
+        # the receiver decompresses transparently
+        received = DataRequest(sent.buffer)
+        assert received.proto.SerializeToString() == expected
+        assert received.docs[0].embedding.shape == (1024,)
+
+    # small requests are sent uncompressed
+    compressor = networking.AdaptiveCompressor(
+        '1.1.1.1:53', CompressAlgo.ZLIB, compress_min_bytes=len(expected) + 1
+    )
+    assert compressor.compress(request).buffer == expected
+
+
+def test_hedging_policy_budget(mocker):
+    policy = networking.HedgingPolicy(percentile=50, budget=0.5, burst=2)
+    replicas = mocker.Mock()
+    replicas.get_all_connections.return_value = [1, 2]
+
+    # no delay until enough latencies are known
+    assert policy.get_delay(replicas) is None
+    for i in range(networking.HedgingPolicy.MIN_SAMPLES):
+        policy.record_latency(replicas, i)
+    assert policy.get_delay(replicas) == pytest.approx(9.5)
+
+    # the burst is spent, then one hedge per two requests
+    assert policy.acquire() and policy.acquire()
+    assert not policy.acquire()
+    policy.get_delay(replicas)
+    assert not policy.acquire()
+    policy.get_delay(replicas)
+    assert policy.acquire()
+
+    replicas.get_all_connections.return_value = [1]
+    assert policy.get_delay(replicas) is None
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_first_response_wins(mocker, monkeypatch):
+    await _mock_grpc(mocker, monkeypatch)
+    pool = GrpcConnectionPool()
+    pool.add_connection(pod='encoder', head=False, address='1.1.1.1:53')
+    pool.add_connection(pod='encoder', head=False, address='1.1.1.2:53')
+    replicas = pool._connections.get_replicas('encoder', False)
+    slow, fast = replicas.get_all_connections()
+    for _ in range(networking.HedgingPolicy.MIN_SAMPLES):
+        pool._hedging.record_latency(replicas, 0.01)
+
+    cancelled = []
+
+    async def call(connection):
+        try:
+            await asyncio.sleep(5 if connection is slow else 0.01)
+        except asyncio.CancelledError:
+            cancelled.append(connection)
+            raise
+        return connection, {}
+
+    pool._send_requests = lambda requests, connection, endpoint: asyncio.create_task(
+        call(connection)
+    )
+    request = _create_test_data_message()
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *pool.send_request(request=request, pod='encoder', hedge=True)
+    )
+    assert time.perf_counter() - start < 1
+    assert results[0][0] is fast
+    await asyncio.sleep(0)
+    assert cancelled == [slow]
+
+    # without budget, the slow replica is waited for
+    pool._hedging._tokens = 0
+    pool._hedging._budget = 0
+    tasks = pool.send_request(request=request, pod='encoder', hedge=True)
+    await asyncio.sleep(0.2)
+    assert not tasks[0].done()
+    tasks[0].cancel()
+
+    # requests that are not hedged go to a single replica
+    results = await asyncio.gather(*pool.send_request(request=request, pod='encoder'))
+    assert results[0][0] is fast
+
+
 def _create_test_data_message():
     return list(
         request_generator(
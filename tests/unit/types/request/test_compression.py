@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from jina import Document
+from jina.enums import CompressAlgo
+from jina.types.request.compression import (
+    compress,
+    decompress,
+    is_available,
+    is_compressed,
+)
+from jina.types.request.data import DataRequest
+
+ALGORITHMS = [
+    a
+    for a in CompressAlgo
+    if a not in (CompressAlgo.NONE, CompressAlgo.AUTO) and is_available(a)
+]
+
+
+@pytest.fixture
+def request_bytes():
+    r = DataRequest()
+    r.docs.extend(
+        Document(text=f'doc {i}', embedding=np.random.random(128).astype('float32'))
+        for i in range(10)
+    )
+    return r.proto.SerializeToString()
+
+
+@pytest.mark.parametrize('algo', ALGORITHMS)
+@pytest.mark.parametrize('shuffle', [False, True])
+def test_compress_roundtrip(request_bytes, algo, shuffle):
+    compressed = compress(request_bytes, algo, shuffle)
+    assert is_compressed(compressed)
+    assert decompress(compressed) == request_bytes
+
+
+@pytest.mark.parametrize('shuffle', [False, True])
+def test_compress_odd_size(shuffle):
+    buffer = bytes(range(255)) * 3
+    assert decompress(compress(buffer, CompressAlgo.ZLIB, shuffle)) == buffer
+
+
+def test_decompress_plain(request_bytes):
+    assert not is_compressed(request_bytes)
+    assert decompress(request_bytes) == request_bytes
+
+
+def test_unavailable_algo():
+    assert not is_available(CompressAlgo.NONE)
+    assert not is_available(CompressAlgo.AUTO)
+    with pytest.raises(ValueError):
+        compress(b'abc', CompressAlgo.NONE)
+
+
+@pytest.mark.parametrize('algo', ALGORITHMS)
+def test_data_request_decompresses(request_bytes, algo):
+    r = DataRequest(compress(request_bytes, algo, True))
+    assert not r.is_decompressed
+    assert len(r.docs) == 10
+    assert r.proto.SerializeToString() == request_bytes